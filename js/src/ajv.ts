@@ -1,21 +1,66 @@
 // Copyright (C) urljsf contributors.
 // Distributed under the terms of the Modified BSD License.
-import validator, { customizeValidator } from '@rjsf/validator-ajv8';
+import type { RJSFSchema, ValidatorType } from '@rjsf/utils';
+import validator, {
+  createPrecompiledValidator,
+  customizeValidator,
+} from '@rjsf/validator-ajv8';
 
 import { AggregateAjvError } from '@segment/ajv-human-errors';
 import type { ErrorObject } from 'ajv';
+import * as equal from 'ajv/dist/runtime/equal.js';
+import * as ucs2length from 'ajv/dist/runtime/ucs2length.js';
+import * as uri from 'ajv/dist/runtime/uri.js';
+import * as validation_error from 'ajv/dist/runtime/validation_error.js';
+import * as formats from 'ajv-formats/dist/formats.js';
 
 import { DEBUG } from './tokens.js';
+import { resolveUrl } from './urls.js';
+
+/** `ajv` runtime modules required by precompiled validators */
+const RUNTIME: Record<string, any> = {
+  'ajv/dist/runtime/equal': equal,
+  'ajv/dist/runtime/ucs2length': ucs2length,
+  'ajv/dist/runtime/uri': uri,
+  'ajv/dist/runtime/validation_error': validation_error,
+  'ajv-formats/dist/formats': formats,
+};
 
 export function getValidator(): typeof validator {
-  const newValidator = customizeValidator();
-  const { rawValidation } = validator;
+  return humanizeValidator(customizeValidator(), validator);
+}
+
+/** load a validator precompiled at build time for a single root schema */
+export async function getPrecompiledValidator(
+  url: string,
+  schema: RJSFSchema,
+): Promise<ValidatorType> {
+  const module = await import(/* webpackIgnore: true */ resolveUrl(url));
+  const validateFns = module.default(requireRuntime);
+  const newValidator = createPrecompiledValidator(validateFns, schema);
+  return humanizeValidator(newValidator, newValidator);
+}
+
+function requireRuntime(name: string): any {
+  /* istanbul ignore next */
+  if (!RUNTIME[name]) {
+    throw new Error(`precompiled validator requires unknown module: ${name}`);
+  }
+  return RUNTIME[name];
+}
+
+function humanizeValidator<T extends ValidatorType>(
+  newValidator: T,
+  original: ValidatorType,
+): T {
+  const { rawValidation } = original;
 
   function humanizedRawValidation(...args: any[]) {
-    const res = rawValidation.call(validator, ...args);
-    return { ...res, errors: res.errors ? humanizeErrors(res.errors) : res.errors };
+    const res = rawValidation.call(original, ...(args as [any, any]));
+    const { errors } = res;
+    return { ...res, errors: errors ? humanizeErrors(errors as any) : errors };
   }
-  newValidator.rawValidation = humanizedRawValidation;
+  newValidator.rawValidation = humanizedRawValidation as any;
   return newValidator;
 }
 
@@ -15,7 +15,7 @@ import Markdown from 'markdown-to-jsx';
 import type { MarkdownToJSX } from 'markdown-to-jsx';
 
 import { Urljsf } from '../_schema.js';
-import { getValidator } from '../ajv.js';
+import { getPrecompiledValidator, getValidator } from '../ajv.js';
 import { ensureBootstrap, getBoostrapCss } from '../bootstrap.js';
 import { ensureNunjucks, renderMarkdown } from '../nunjucks.js';
 import {
@@ -75,10 +75,19 @@ export async function makeOneForm(script: HTMLScriptElement): Promise<void> {
   ]);
 
   const forms: IFormsProps = {};
+  const validators = JSON.parse(script.dataset.urljsfValidators || '{}');
 
   await Promise.all(
     Object.entries(config.forms).map(async ([key, form]) => {
       const props = await initFormProps(form);
+      if (validators[key] && props.schema) {
+        try {
+          props.validator = await getPrecompiledValidator(validators[key], props.schema);
+        } catch (err) {
+          /* istanbul ignore next */
+          DEBUG && console.warn('failed to load precompiled validator', key, err);
+        }
+      }
       forms[key] = props;
     }),
   );
@@ -255,7 +264,7 @@ function UrljsfForm(props: IUrljsfFormProps): JSX.Element {
       ...initProps,
       onChange: makeOnFormChange.bind(null, key),
       formData: context.value.data[key],
-      validator: getValidator(),
+      validator: initProps.validator || getValidator(),
     };
   }
 
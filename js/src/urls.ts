@@ -0,0 +1,7 @@
+// Copyright (C) urljsf contributors.
+// Distributed under the terms of the Modified BSD License.
+
+/** resolve a possibly-relative URL against the current page */
+export function resolveUrl(url: string, base: string = window.location.href): string {
+  return new URL(url, base).href;
+}
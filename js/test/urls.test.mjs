@@ -0,0 +1,23 @@
+// Copyright (C) urljsf contributors.
+// Distributed under the terms of the Modified BSD License.
+import assert from 'node:assert/strict';
+import { test } from 'node:test';
+
+import { resolveUrl } from '../lib/urls.js';
+
+const PAGE = 'https://example.com/docs/forms/index.html';
+
+test('relative URLs resolve against the page', () => {
+  assert.equal(
+    resolveUrl('../_static/urljsf-forms/abc.js', PAGE),
+    'https://example.com/docs/_static/urljsf-forms/abc.js',
+  );
+  assert.equal(resolveUrl('./abc.js', PAGE), 'https://example.com/docs/forms/abc.js');
+});
+
+test('absolute URLs are kept', () => {
+  for (const url of ['https://cdn.example.com/abc.js', 'data:text/javascript,']) {
+    assert.equal(resolveUrl(url, PAGE), url);
+  }
+  assert.equal(resolveUrl('/abc.js', PAGE), 'https://example.com/abc.js');
+});
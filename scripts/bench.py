@@ -0,0 +1,183 @@
+"""Benchmark phases of building ``urljsf`` forms."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+import shutil
+import sys
+import tempfile
+import tracemalloc
+from argparse import ArgumentParser
+from copy import deepcopy
+from functools import partial
+from pathlib import Path
+from timeit import timeit
+from typing import Any, Callable
+
+from urljsf.config import Config
+from urljsf.filters import urljsf_json
+from urljsf.schema import URLJSF_VALIDATOR, urljsf_fast_validator
+from urljsf.source import DataSource, DefSource
+from urljsf.static import stream_if_changed, write_if_changed
+from urljsf.urljsf import Urljsf
+from urljsf.utils import merge_deep
+
+HERE = Path(__file__).parent
+ROOT = HERE.parent
+DEFINITIONS = sorted([
+    *(ROOT / "js/demo").glob("*/urljsf.*"),
+    *(ROOT / "tests/fixtures").rglob("urljsf.*"),
+])
+ROW = "{:<48} {:>12} {:>12} {:>8}"
+
+
+def bench_validate(number: int) -> int:
+    """Compare ``jsonschema`` and generated validators for all definitions."""
+    fast_validator = urljsf_fast_validator()
+    if fast_validator is None:
+        print("generated validator is disabled")
+        return 1
+
+    print(ROW.format("definition", "jsonschema", "generated", "speedup"))
+    totals = [0.0, 0.0]
+    for path in DEFINITIONS:
+        raw = DataSource(path).raw
+        slow = timeit(partial(_all_errors, raw), number=number)
+        fast = timeit(partial(fast_validator, raw), number=number)
+        totals[0] += slow
+        totals[1] += fast
+        rel = path.relative_to(ROOT).as_posix()
+        print(ROW.format(rel, *_per_call_ms(number, slow, fast)))
+
+    print(ROW.format("TOTAL", *_per_call_ms(number, *totals)))
+    return 0
+
+
+def bench_merge(number: int) -> int:
+    """Compare merging defaults into a large inline schema, before and after."""
+    defaults = {"iframe": True, "forms": {"big": {"props": {"liveValidate": True}}}}
+    defn = _big_definition()
+
+    print(ROW.format("merge", "time", "peak", ""))
+    for label, merge in {"deepcopy": _merge_deep_copying, "shared": merge_deep}.items():
+        elapsed = timeit(partial(merge, defaults, defn), number=number)
+        tracemalloc.start()
+        merge(defaults, defn)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(ROW.format(label, f"{1000 * elapsed / number:.3f}ms", f"{peak}B", ""))
+    return 0
+
+
+def bench_json(number: int) -> int:
+    """Compare the size and time of embedding resolved definitions as JSON."""
+    modes: dict[str, dict[str, Any]] = {
+        "indent": {"indent": 2},
+        "compact": {"indent": None},
+        "compact-unsorted": {"indent": None, "sort_keys": False},
+    }
+    print(ROW.format("definition", "mode", "time", "size"))
+    totals = {mode: [0.0, 0] for mode in modes}
+    for path in DEFINITIONS:
+        demo = ROOT / "js/demo" in path.parents
+        raw = DefSource(path, resource_path=ROOT / "js/demo" if demo else None).raw
+        rel = path.relative_to(ROOT).as_posix()
+        for mode, kwargs in modes.items():
+            dump = partial(urljsf_json, raw, **kwargs)
+            elapsed = timeit(dump, number=number)
+            size = len(dump().encode("utf-8"))
+            totals[mode][0] += elapsed
+            totals[mode][1] += size
+            print(ROW.format(rel, mode, f"{1000 * elapsed / number:.3f}ms", size))
+
+    baseline = totals["indent"][1]
+    for mode, (elapsed, size) in totals.items():
+        pct = f"{100 * size / baseline:.0f}%"
+        print(
+            ROW.format(f"TOTAL ({pct})", mode, f"{1000 * elapsed / number:.3f}ms", size)
+        )
+    return 0
+
+
+def bench_render(number: int) -> int:
+    """Compare writing a page with a large inline schema as one string or chunks."""
+    defn = {**_big_definition(), "templates": {"url": "https://example.com"}}
+    urljsf = Urljsf(Config(input_=None, definition=DefSource(raw=defn)))
+    out = Path(tempfile.mkdtemp()) / "index.html"
+
+    def whole() -> None:
+        write_if_changed(out, urljsf.render())
+
+    def streamed() -> None:
+        stream_if_changed(out, urljsf.generate())
+
+    print(ROW.format("render", "time", "peak", ""))
+    for label, write in {"whole": whole, "streamed": streamed}.items():
+        out.unlink(missing_ok=True)
+        elapsed = timeit(write, number=number)
+        tracemalloc.start()
+        write()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(ROW.format(label, f"{1000 * elapsed / number:.3f}ms", f"{peak}B", ""))
+    shutil.rmtree(out.parent)
+    return 0
+
+
+def _big_definition() -> dict[str, Any]:
+    """Build a definition with a large inline schema."""
+    properties = {
+        f"field_{i}": {"type": "string", "enum": [f"option_{j}" for j in range(20)]}
+        for i in range(2000)
+    }
+    return {"forms": {"big": {"schema": {"type": "object", "properties": properties}}}}
+
+
+def _merge_deep_copying(
+    left: dict[str, Any] | None, right: dict[str, Any] | None
+) -> dict[str, Any]:
+    """Merge dictionaries, as in ``urljsf <=0.1.5``."""
+    left = deepcopy(left or {})
+    right = deepcopy(right or {})
+    for key, value in right.items():
+        if isinstance(value, dict):
+            left[key] = _merge_deep_copying(left.get(key), value)
+            continue
+        left[key] = value
+    return left
+
+
+def _all_errors(raw: Any) -> list[Any]:
+    """Get all the validation errors from ``jsonschema``."""
+    return [*URLJSF_VALIDATOR.iter_errors(raw)]
+
+
+def _per_call_ms(number: int, slow: float, fast: float) -> list[str]:
+    """Format timings in milliseconds per call, with a speedup."""
+    return [
+        f"{1000 * slow / number:.3f}ms",
+        f"{1000 * fast / number:.3f}ms",
+        f"{slow / fast:.1f}x",
+    ]
+
+
+BENCHMARKS: dict[str, Callable[[int], int]] = {
+    "json": bench_json,
+    "merge": bench_merge,
+    "render": bench_render,
+    "validate": bench_validate,
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run a benchmark."""
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("-n", "--number", type=int, default=100)
+    args = parser.parse_args(argv)
+    return BENCHMARKS[args.benchmark](args.number)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
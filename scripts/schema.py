@@ -11,7 +11,9 @@ from pathlib import Path
 from subprocess import call as _call
 from typing import Any, Callable
 
+import fastjsonschema
 import tomllib
+from jsonschema import Draft7Validator
 
 VERBOSE = False
 CMD_DELIM = " \\\n\t" if VERBOSE else " "
@@ -143,6 +145,79 @@ def json_to_py(in_path: Path, out_path: Path) -> int:
     )
 
 
+VALIDATOR_PY = "_validator.py"
+VALIDATOR_PY_PREAMBLE = '''"""Generated validator for ``urljsf`` definitions."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+{imports}
+
+#: formats which must be provided as ``custom_formats``
+FORMATS = {formats}
+
+
+class JsonSchemaValueException(ValueError):
+    """A value is not valid."""
+
+    def __init__(self, message, value=None, name=None, definition=None, rule=None):
+        super().__init__(message)
+        self.message = message
+        self.value = value
+        self.name = name
+        self.definition = definition
+        self.rule = rule
+
+
+JsonSchemaValuesException = JsonSchemaValueException
+'''
+
+
+def json_to_validator(in_path: Path, out_path: Path) -> int:
+    """Get a standalone python validator from JSON Schema.
+
+    The generated code stops at the first error, without details: these are
+    provided by ``jsonschema``. Known formats are checked by ``custom_formats``.
+    """
+    schema = json.loads(in_path.read_text(**UTF8))
+    known = Draft7Validator.FORMAT_CHECKER.checkers
+    formats = sorted({f for f in _find_formats(schema) if f in known})
+    code = fastjsonschema.compile_to_code(
+        schema,
+        detailed_exceptions=False,
+        use_default=False,
+        formats=dict.fromkeys(formats, bool),
+    )
+    header, body = code.split("\n\n", 1)
+    imports = [line for line in header.splitlines() if line.startswith("import ")]
+    imports += [
+        line
+        for line in header.splitlines()
+        if line.startswith("from ") and "fastjsonschema" not in line
+    ]
+    preamble = VALIDATOR_PY_PREAMBLE.format(
+        imports="\n".join(imports), formats=tuple(formats)
+    )
+    entry_point = body.split("\ndef ")[1].split("(")[0]
+    out_path.write_text(f"{preamble}\n{body}\n\nvalidate = {entry_point}\n", **UTF8)
+
+    return call(["ruff", "format", f"{out_path}"])
+
+
+def _find_formats(schema: Any) -> set[str]:
+    """Find all the ``format`` values in a schema."""
+    found: set[str] = set()
+    if isinstance(schema, dict):
+        fmt = schema.get("format")
+        if isinstance(fmt, str):
+            found.add(fmt)
+        for value in schema.values():
+            found |= _find_formats(value)
+    elif isinstance(schema, list):
+        for value in schema:
+            found |= _find_formats(value)
+    return found
+
+
 CONVERTERS: dict[tuple[str, str], Callable[..., int]] = {
     (".ts", ".json"): ts_to_json,
     (".toml", ".json"): toml_to_json,
@@ -154,7 +229,7 @@ CONVERTERS: dict[tuple[str, str], Callable[..., int]] = {
 def main(in_path: Path, out_path: Path, *extra_paths: Path) -> int:
     """Convert some files."""
     key = in_path.suffix, out_path.suffix
-    converter = CONVERTERS[key]
+    converter = json_to_validator if out_path.name == VALIDATOR_PY else CONVERTERS[key]
     rc = converter(in_path, out_path, *extra_paths)
     print(
         f"""... converted: {in_path.relative_to(ROOT)}
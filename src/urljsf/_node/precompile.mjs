@@ -0,0 +1,69 @@
+// Copyright (C) urljsf contributors.
+// Distributed under the terms of the Modified BSD License.
+
+/**
+ * Write standalone `ajv` validation modules for `rjsf` forms.
+ *
+ * Reads `{"folder": "...", "schemas": {"<name>.js": {...}}}` on `stdin`, and
+ * writes one module per schema. `@rjsf/validator-ajv8` is found from the current
+ * working directory, not this file.
+ *
+ * The `CommonJS` code from `ajv` is wrapped in a function, which is given a
+ * `require` for the few `ajv` runtime modules already in the browser bundle.
+ */
+import { mkdirSync, readFileSync, renameSync, writeFileSync } from 'node:fs';
+import { createRequire } from 'node:module';
+import { join } from 'node:path';
+import { pathToFileURL } from 'node:url';
+
+const PACKAGE = '@rjsf/validator-ajv8';
+const MODULES = ['compileSchemaValidatorsCode', 'compileSchemaValidators'];
+const FOLDERS = ['', 'dist/', 'lib/'];
+
+const WRAPPER = (code) => `export default function (require) {
+const module = { exports: {} };
+const exports = module.exports;
+${code}
+return module.exports;
+}
+`;
+
+async function getCompiler() {
+  const require = createRequire(join(process.cwd(), 'package.json'));
+  for (const folder of FOLDERS) {
+    for (const name of MODULES) {
+      let resolved;
+      try {
+        resolved = require.resolve(`${PACKAGE}/${folder}${name}`);
+      } catch {
+        continue;
+      }
+      const mod = await import(pathToFileURL(resolved).href);
+      const compile =
+        mod.compileSchemaValidatorsCode || mod.default?.compileSchemaValidatorsCode;
+      if (compile) {
+        return compile;
+      }
+    }
+  }
+  throw new Error(`${PACKAGE} not found from ${process.cwd()}`);
+}
+
+async function main() {
+  const { folder, schemas } = JSON.parse(readFileSync(0, 'utf-8'));
+  const compile = await getCompiler();
+  mkdirSync(folder, { recursive: true });
+  for (const [name, schema] of Object.entries(schemas)) {
+    const path = join(folder, name);
+    const tmp = `${path}.${process.pid}.tmp`;
+    writeFileSync(tmp, WRAPPER(compile(schema)));
+    renameSync(tmp, path);
+  }
+}
+
+try {
+  await main();
+} catch (err) {
+  console.error(err.message);
+  process.exit(1);
+}
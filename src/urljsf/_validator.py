@@ -0,0 +1,1589 @@
+"""Generated validator for ``urljsf`` definitions."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+import re
+from decimal import Decimal
+
+#: formats which must be provided as ``custom_formats``
+FORMATS = ("uri-reference",)
+
+
+class JsonSchemaValueException(ValueError):
+    """A value is not valid."""
+
+    def __init__(self, message, value=None, name=None, definition=None, rule=None):
+        super().__init__(message)
+        self.message = message
+        self.value = value
+        self.name = name
+        self.definition = definition
+        self.rule = rule
+
+
+JsonSchemaValuesException = JsonSchemaValueException
+
+
+REGEX_PATTERNS = {
+    "^.+$": re.compile("^.+$"),
+    "[a-zA-Z\\d\\-_]+": re.compile("[a-zA-Z\\d\\-_]+"),
+}
+
+NoneType = type(None)
+
+
+def validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json(
+    data, custom_formats={}, name_prefix=None
+):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object")
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(["forms", "templates"]) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException(
+                "" + (name_prefix or "data") + " must contain "
+            )
+        data_keys = set(data.keys())
+        if "$id" in data_keys:
+            data_keys.remove("$id")
+            data__id = data["$id"]
+            if not isinstance(data__id, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".$id must be string"
+                )
+            if isinstance(data__id, str):
+                if not custom_formats["uri-reference"](data__id):
+                    raise JsonSchemaValueException(
+                        "" + (name_prefix or "data") + ".$id must be uri-reference"
+                    )
+        if "$schema" in data_keys:
+            data_keys.remove("$schema")
+            data__schema = data["$schema"]
+            if not isinstance(data__schema, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".$schema must be string"
+                )
+            if isinstance(data__schema, str):
+                if not custom_formats["uri-reference"](data__schema):
+                    raise JsonSchemaValueException(
+                        "" + (name_prefix or "data") + ".$schema must be uri-reference"
+                    )
+        if "checks" in data_keys:
+            data_keys.remove("checks")
+            data__checks = data["checks"]
+            validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_checks(
+                data__checks, custom_formats, (name_prefix or "data") + ".checks"
+            )
+        if "forms" in data_keys:
+            data_keys.remove("forms")
+            data__forms = data["forms"]
+            validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_forms(
+                data__forms, custom_formats, (name_prefix or "data") + ".forms"
+            )
+        if "iframe" in data_keys:
+            data_keys.remove("iframe")
+            data__iframe = data["iframe"]
+            if not isinstance(data__iframe, (bool)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".iframe must be boolean"
+                )
+        if "iframe_style" in data_keys:
+            data_keys.remove("iframe_style")
+            data__iframestyle = data["iframe_style"]
+            if not isinstance(data__iframestyle, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".iframe_style must be string"
+                )
+        if "no_bootstrap" in data_keys:
+            data_keys.remove("no_bootstrap")
+            data__nobootstrap = data["no_bootstrap"]
+            if not isinstance(data__nobootstrap, (bool)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".no_bootstrap must be boolean"
+                )
+        if "nunjucks" in data_keys:
+            data_keys.remove("nunjucks")
+            data__nunjucks = data["nunjucks"]
+            if not isinstance(data__nunjucks, (dict)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".nunjucks must be object"
+                )
+            data__nunjucks_is_dict = isinstance(data__nunjucks, dict)
+            if data__nunjucks_is_dict:
+                data__nunjucks_keys = set(data__nunjucks.keys())
+                if "filters" in data__nunjucks_keys:
+                    data__nunjucks_keys.remove("filters")
+                    data__nunjucks__filters = data__nunjucks["filters"]
+                    if not isinstance(data__nunjucks__filters, (list, tuple)):
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".nunjucks.filters must be array"
+                        )
+                    data__nunjucks__filters_is_list = isinstance(
+                        data__nunjucks__filters, (list, tuple)
+                    )
+                    if data__nunjucks__filters_is_list:
+
+                        def fn(var):
+                            return (
+                                frozenset(
+                                    dict((k, fn(v)) for k, v in var.items()).items()
+                                )
+                                if hasattr(var, "items")
+                                else tuple(fn(v) for v in var)
+                                if isinstance(var, (dict, list))
+                                else str(var)
+                                if isinstance(var, bool)
+                                else var
+                            )
+
+                        data__nunjucks__filters_len = len(data__nunjucks__filters)
+                        if data__nunjucks__filters_len > len(
+                            set(
+                                fn(data__nunjucks__filters_x)
+                                for data__nunjucks__filters_x in data__nunjucks__filters
+                            )
+                        ):
+                            raise JsonSchemaValueException(
+                                ""
+                                + (name_prefix or "data")
+                                + ".nunjucks.filters must contain unique items"
+                            )
+                        for (
+                            data__nunjucks__filters_x,
+                            data__nunjucks__filters_item,
+                        ) in enumerate(data__nunjucks__filters):
+                            data__nunjucks__filters_item_one_of_count1 = 0
+                            if data__nunjucks__filters_item_one_of_count1 < 2:
+                                try:
+                                    validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_file_format(
+                                        data__nunjucks__filters_item,
+                                        custom_formats,
+                                        (name_prefix or "data")
+                                        + ".nunjucks.filters[{data__nunjucks__filters_x}]".format(
+                                            **locals()
+                                        ),
+                                    )
+                                    data__nunjucks__filters_item_one_of_count1 += 1
+                                except (
+                                    JsonSchemaValueException,
+                                    JsonSchemaValuesException,
+                                ):
+                                    pass
+                            if data__nunjucks__filters_item_one_of_count1 < 2:
+                                try:
+                                    if not (
+                                        isinstance(data__nunjucks__filters_item, str)
+                                        and data__nunjucks__filters_item == "zip"
+                                    ):
+                                        raise JsonSchemaValueException(
+                                            ""
+                                            + (name_prefix or "data")
+                                            + ".nunjucks.filters[{data__nunjucks__filters_x}]".format(
+                                                **locals()
+                                            )
+                                            + " must be one of ['zip']"
+                                        )
+                                    data__nunjucks__filters_item_one_of_count1 += 1
+                                except (
+                                    JsonSchemaValueException,
+                                    JsonSchemaValuesException,
+                                ):
+                                    pass
+                            if data__nunjucks__filters_item_one_of_count1 != 1:
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".nunjucks.filters[{data__nunjucks__filters_x}]".format(
+                                        **locals()
+                                    )
+                                    + " must be valid exactly by one definition"
+                                )
+        if "style" in data_keys:
+            data_keys.remove("style")
+            data__style = data["style"]
+            validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_styles(
+                data__style, custom_formats, (name_prefix or "data") + ".style"
+            )
+        if "templates" in data_keys:
+            data_keys.remove("templates")
+            data__templates = data["templates"]
+            validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_templates(
+                data__templates, custom_formats, (name_prefix or "data") + ".templates"
+            )
+        if data_keys:
+            raise JsonSchemaValueException(
+                ""
+                + (name_prefix or "data")
+                + " must not contain "
+                + str(data_keys)
+                + " properties"
+            )
+    return data
+
+
+def validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_templates(
+    data, custom_formats={}, name_prefix=None
+):
+    validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_known_templates(
+        data, custom_formats, (name_prefix or "data") + ""
+    )
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object")
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        for data_key in data_keys:
+            if data_key not in []:
+                data_value = data.get(data_key)
+                validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_template(
+                    data_value,
+                    custom_formats,
+                    (name_prefix or "data") + ".{data_key}".format(**locals()),
+                )
+    return data
+
+
+def validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_template(
+    data, custom_formats={}, name_prefix=None
+):
+    data_any_of_count2 = 0
+    if not data_any_of_count2:
+        try:
+            if not isinstance(data, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + " must be string"
+                )
+            data_any_of_count2 += 1
+        except (JsonSchemaValueException, JsonSchemaValuesException):
+            pass
+    if not data_any_of_count2:
+        try:
+            if not isinstance(data, (list, tuple)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + " must be array"
+                )
+            data_is_list = isinstance(data, (list, tuple))
+            if data_is_list:
+                data_len = len(data)
+                if data_len < 1:
+                    raise JsonSchemaValueException(
+                        "" + (name_prefix or "data") + " must contain at least 1 items"
+                    )
+                for data_x, data_item in enumerate(data):
+                    if not isinstance(data_item, (str)):
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + "[{data_x}]".format(**locals())
+                            + " must be string"
+                        )
+            data_any_of_count2 += 1
+        except (JsonSchemaValueException, JsonSchemaValuesException):
+            pass
+    if not data_any_of_count2:
+        raise JsonSchemaValueException(
+            "" + (name_prefix or "data") + " cannot be validated by any definition"
+        )
+    return data
+
+
+def validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_known_templates(
+    data, custom_formats={}, name_prefix=None
+):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object")
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "download_filename" in data_keys:
+            data_keys.remove("download_filename")
+            data__downloadfilename = data["download_filename"]
+            validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_template(
+                data__downloadfilename,
+                custom_formats,
+                (name_prefix or "data") + ".download_filename",
+            )
+        if "submit_button" in data_keys:
+            data_keys.remove("submit_button")
+            data__submitbutton = data["submit_button"]
+            validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_template(
+                data__submitbutton,
+                custom_formats,
+                (name_prefix or "data") + ".submit_button",
+            )
+        if "submit_target" in data_keys:
+            data_keys.remove("submit_target")
+            data__submittarget = data["submit_target"]
+            validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_template(
+                data__submittarget,
+                custom_formats,
+                (name_prefix or "data") + ".submit_target",
+            )
+        if "url" in data_keys:
+            data_keys.remove("url")
+            data__url = data["url"]
+            validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_template(
+                data__url, custom_formats, (name_prefix or "data") + ".url"
+            )
+    return data
+
+
+def validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_styles(
+    data, custom_formats={}, name_prefix=None
+):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object")
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        for data_key, data_val in data.items():
+            if REGEX_PATTERNS["^.+$"].search(data_key):
+                if data_key in data_keys:
+                    data_keys.remove(data_key)
+                validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_style(
+                    data_val,
+                    custom_formats,
+                    (name_prefix or "data") + ".{data_key}".format(**locals()),
+                )
+    return data
+
+
+def validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_style(
+    data, custom_formats={}, name_prefix=None
+):
+    data_one_of_count3 = 0
+    if data_one_of_count3 < 2:
+        try:
+            if not isinstance(data, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + " must be string"
+                )
+            data_one_of_count3 += 1
+        except (JsonSchemaValueException, JsonSchemaValuesException):
+            pass
+    if data_one_of_count3 < 2:
+        try:
+            if not isinstance(data, (dict)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + " must be object"
+                )
+            data_one_of_count3 += 1
+        except (JsonSchemaValueException, JsonSchemaValuesException):
+            pass
+    if data_one_of_count3 != 1:
+        raise JsonSchemaValueException(
+            "" + (name_prefix or "data") + " must be valid exactly by one definition"
+        )
+    return data
+
+
+def validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_file_format(
+    data, custom_formats={}, name_prefix=None
+):
+    if not isinstance(data, (str)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be string")
+    if not (
+        isinstance(data, str)
+        and data == "json"
+        or isinstance(data, str)
+        and data == "toml"
+        or isinstance(data, str)
+        and data == "yaml"
+    ):
+        raise JsonSchemaValueException(
+            "" + (name_prefix or "data") + " must be one of ['json', 'toml', 'yaml']"
+        )
+    return data
+
+
+def validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_forms(
+    data, custom_formats={}, name_prefix=None
+):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object")
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        for data_key, data_val in data.items():
+            if REGEX_PATTERNS["[a-zA-Z\\d\\-_]+"].search(data_key):
+                if data_key in data_keys:
+                    data_keys.remove(data_key)
+                validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_form(
+                    data_val,
+                    custom_formats,
+                    (name_prefix or "data") + ".{data_key}".format(**locals()),
+                )
+    return data
+
+
+def validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_form(
+    data, custom_formats={}, name_prefix=None
+):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object")
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "form_data" in data_keys:
+            data_keys.remove("form_data")
+            data__formdata = data["form_data"]
+            validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_schema(
+                data__formdata, custom_formats, (name_prefix or "data") + ".form_data"
+            )
+        if "order" in data_keys:
+            data_keys.remove("order")
+            data__order = data["order"]
+            if not isinstance(data__order, (int, float, Decimal)) or isinstance(
+                data__order, bool
+            ):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".order must be number"
+                )
+        if "props" in data_keys:
+            data_keys.remove("props")
+            data__props = data["props"]
+            data__props_one_of_count4 = 0
+            if data__props_one_of_count4 < 2:
+                try:
+                    validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_props(
+                        data__props, custom_formats, (name_prefix or "data") + ".props"
+                    )
+                    data__props_one_of_count4 += 1
+                except (JsonSchemaValueException, JsonSchemaValuesException):
+                    pass
+            if data__props_one_of_count4 < 2:
+                try:
+                    if not isinstance(data__props, (str)):
+                        raise JsonSchemaValueException(
+                            "" + (name_prefix or "data") + ".props must be string"
+                        )
+                    data__props_one_of_count4 += 1
+                except (JsonSchemaValueException, JsonSchemaValuesException):
+                    pass
+            if data__props_one_of_count4 != 1:
+                raise JsonSchemaValueException(
+                    ""
+                    + (name_prefix or "data")
+                    + ".props must be valid exactly by one definition"
+                )
+        if "schema" in data_keys:
+            data_keys.remove("schema")
+            data__schema = data["schema"]
+            validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_schema(
+                data__schema, custom_formats, (name_prefix or "data") + ".schema"
+            )
+        if "ui_schema" in data_keys:
+            data_keys.remove("ui_schema")
+            data__uischema = data["ui_schema"]
+            validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_schema(
+                data__uischema, custom_formats, (name_prefix or "data") + ".ui_schema"
+            )
+        if data_keys:
+            raise JsonSchemaValueException(
+                ""
+                + (name_prefix or "data")
+                + " must not contain "
+                + str(data_keys)
+                + " properties"
+            )
+    return data
+
+
+def validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_props(
+    data, custom_formats={}, name_prefix=None
+):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object")
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "acceptCharset" in data_keys:
+            data_keys.remove("acceptCharset")
+            data__acceptCharset = data["acceptCharset"]
+            if not isinstance(data__acceptCharset, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".acceptCharset must be string"
+                )
+        if "action" in data_keys:
+            data_keys.remove("action")
+            data__action = data["action"]
+            if not isinstance(data__action, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".action must be string"
+                )
+        if "autoComplete" in data_keys:
+            data_keys.remove("autoComplete")
+            data__autoComplete = data["autoComplete"]
+            if not isinstance(data__autoComplete, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".autoComplete must be string"
+                )
+        if "className" in data_keys:
+            data_keys.remove("className")
+            data__className = data["className"]
+            if not isinstance(data__className, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".className must be string"
+                )
+        if "disabled" in data_keys:
+            data_keys.remove("disabled")
+            data__disabled = data["disabled"]
+            if not isinstance(data__disabled, (bool)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".disabled must be boolean"
+                )
+        if "enctype" in data_keys:
+            data_keys.remove("enctype")
+            data__enctype = data["enctype"]
+            if not isinstance(data__enctype, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".enctype must be string"
+                )
+        if "extraErrorsBlockSubmit" in data_keys:
+            data_keys.remove("extraErrorsBlockSubmit")
+            data__extraErrorsBlockSubmit = data["extraErrorsBlockSubmit"]
+            if not isinstance(data__extraErrorsBlockSubmit, (bool)):
+                raise JsonSchemaValueException(
+                    ""
+                    + (name_prefix or "data")
+                    + ".extraErrorsBlockSubmit must be boolean"
+                )
+        if "focusOnFirstError" in data_keys:
+            data_keys.remove("focusOnFirstError")
+            data__focusOnFirstError = data["focusOnFirstError"]
+            if not isinstance(data__focusOnFirstError, (bool)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".focusOnFirstError must be boolean"
+                )
+        if "formContext" in data_keys:
+            data_keys.remove("formContext")
+            data__formContext = data["formContext"]
+            if not isinstance(data__formContext, (dict)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".formContext must be object"
+                )
+        if "formData" in data_keys:
+            data_keys.remove("formData")
+            data__formData = data["formData"]
+            if not isinstance(data__formData, (dict)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".formData must be object"
+                )
+        if "id" in data_keys:
+            data_keys.remove("id")
+            data__id = data["id"]
+            if not isinstance(data__id, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".id must be string"
+                )
+        if "idPrefix" in data_keys:
+            data_keys.remove("idPrefix")
+            data__idPrefix = data["idPrefix"]
+            if not isinstance(data__idPrefix, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".idPrefix must be string"
+                )
+        if "idSeparator" in data_keys:
+            data_keys.remove("idSeparator")
+            data__idSeparator = data["idSeparator"]
+            if not isinstance(data__idSeparator, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".idSeparator must be string"
+                )
+        if "liveOmit" in data_keys:
+            data_keys.remove("liveOmit")
+            data__liveOmit = data["liveOmit"]
+            if not isinstance(data__liveOmit, (bool)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".liveOmit must be boolean"
+                )
+        if "liveValidate" in data_keys:
+            data_keys.remove("liveValidate")
+            data__liveValidate = data["liveValidate"]
+            if not isinstance(data__liveValidate, (bool)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".liveValidate must be boolean"
+                )
+        if "method" in data_keys:
+            data_keys.remove("method")
+            data__method = data["method"]
+            if not isinstance(data__method, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".method must be string"
+                )
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".name must be string"
+                )
+        if "noHtml5Validate" in data_keys:
+            data_keys.remove("noHtml5Validate")
+            data__noHtml5Validate = data["noHtml5Validate"]
+            if not isinstance(data__noHtml5Validate, (bool)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".noHtml5Validate must be boolean"
+                )
+        if "omitExtraData" in data_keys:
+            data_keys.remove("omitExtraData")
+            data__omitExtraData = data["omitExtraData"]
+            if not isinstance(data__omitExtraData, (bool)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".omitExtraData must be boolean"
+                )
+        if "readonly" in data_keys:
+            data_keys.remove("readonly")
+            data__readonly = data["readonly"]
+            if not isinstance(data__readonly, (bool)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".readonly must be boolean"
+                )
+        if "schema" in data_keys:
+            data_keys.remove("schema")
+            data__schema = data["schema"]
+            if not isinstance(data__schema, (dict)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".schema must be object"
+                )
+        if "showErrorList" in data_keys:
+            data_keys.remove("showErrorList")
+            data__showErrorList = data["showErrorList"]
+            if not isinstance(data__showErrorList, (bool, str)):
+                raise JsonSchemaValueException(
+                    ""
+                    + (name_prefix or "data")
+                    + ".showErrorList must be boolean or string"
+                )
+            if not (
+                isinstance(data__showErrorList, bool)
+                and data__showErrorList is False
+                or isinstance(data__showErrorList, str)
+                and data__showErrorList == "top"
+                or isinstance(data__showErrorList, str)
+                and data__showErrorList == "bottom"
+            ):
+                raise JsonSchemaValueException(
+                    ""
+                    + (name_prefix or "data")
+                    + ".showErrorList must be one of [False, 'top', 'bottom']"
+                )
+        if "tagName" in data_keys:
+            data_keys.remove("tagName")
+            data__tagName = data["tagName"]
+            if not isinstance(data__tagName, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".tagName must be string"
+                )
+        if "target" in data_keys:
+            data_keys.remove("target")
+            data__target = data["target"]
+            if not isinstance(data__target, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".target must be string"
+                )
+        if "uiSchema" in data_keys:
+            data_keys.remove("uiSchema")
+            data__uiSchema = data["uiSchema"]
+            validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_uischema(
+                data__uiSchema, custom_formats, (name_prefix or "data") + ".uiSchema"
+            )
+        if data_keys:
+            raise JsonSchemaValueException(
+                ""
+                + (name_prefix or "data")
+                + " must not contain "
+                + str(data_keys)
+                + " properties"
+            )
+    return data
+
+
+def validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_uischema(
+    data, custom_formats={}, name_prefix=None
+):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object")
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "items" in data_keys:
+            data_keys.remove("items")
+            data__items = data["items"]
+            validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_uischema(
+                data__items, custom_formats, (name_prefix or "data") + ".items"
+            )
+        if "ui:field" in data_keys:
+            data_keys.remove("ui:field")
+            data__uifield = data["ui:field"]
+            if not isinstance(data__uifield, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".ui:field must be string"
+                )
+        if "ui:fieldReplacesAnyOrOneOf" in data_keys:
+            data_keys.remove("ui:fieldReplacesAnyOrOneOf")
+            data__uifieldReplacesAnyOrOneOf = data["ui:fieldReplacesAnyOrOneOf"]
+            if not isinstance(data__uifieldReplacesAnyOrOneOf, (bool)):
+                raise JsonSchemaValueException(
+                    ""
+                    + (name_prefix or "data")
+                    + ".ui:fieldReplacesAnyOrOneOf must be boolean"
+                )
+        if "ui:options" in data_keys:
+            data_keys.remove("ui:options")
+            data__uioptions = data["ui:options"]
+            if not isinstance(data__uioptions, (dict)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".ui:options must be object"
+                )
+            data__uioptions_is_dict = isinstance(data__uioptions, dict)
+            if data__uioptions_is_dict:
+                data__uioptions_keys = set(data__uioptions.keys())
+                if "title" in data__uioptions_keys:
+                    data__uioptions_keys.remove("title")
+                    data__uioptions__title = data__uioptions["title"]
+                    if not isinstance(data__uioptions__title, (str)):
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.title must be string"
+                        )
+                if "description" in data__uioptions_keys:
+                    data__uioptions_keys.remove("description")
+                    data__uioptions__description = data__uioptions["description"]
+                    if not isinstance(data__uioptions__description, (str)):
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.description must be string"
+                        )
+                if "classNames" in data__uioptions_keys:
+                    data__uioptions_keys.remove("classNames")
+                    data__uioptions__classNames = data__uioptions["classNames"]
+                    if not isinstance(data__uioptions__classNames, (str)):
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.classNames must be string"
+                        )
+                if "disabled" in data__uioptions_keys:
+                    data__uioptions_keys.remove("disabled")
+                    data__uioptions__disabled = data__uioptions["disabled"]
+                    if not isinstance(data__uioptions__disabled, (bool)):
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.disabled must be boolean"
+                        )
+                if "emptyValue" in data__uioptions_keys:
+                    data__uioptions_keys.remove("emptyValue")
+                    data__uioptions__emptyValue = data__uioptions["emptyValue"]
+                    data__uioptions__emptyValue_any_of_count5 = 0
+                    if not data__uioptions__emptyValue_any_of_count5:
+                        try:
+                            if not isinstance(data__uioptions__emptyValue, (bool)):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.emptyValue must be boolean"
+                                )
+                            data__uioptions__emptyValue_any_of_count5 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            pass
+                    if not data__uioptions__emptyValue_any_of_count5:
+                        try:
+                            if not isinstance(
+                                data__uioptions__emptyValue, (int, float, Decimal)
+                            ) or isinstance(data__uioptions__emptyValue, bool):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.emptyValue must be number"
+                                )
+                            data__uioptions__emptyValue_any_of_count5 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            pass
+                    if not data__uioptions__emptyValue_any_of_count5:
+                        try:
+                            if not isinstance(data__uioptions__emptyValue, (str)):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.emptyValue must be string"
+                                )
+                            data__uioptions__emptyValue_any_of_count5 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            pass
+                    if not data__uioptions__emptyValue_any_of_count5:
+                        try:
+                            if not isinstance(data__uioptions__emptyValue, (dict)):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.emptyValue must be object"
+                                )
+                            data__uioptions__emptyValue_is_dict = isinstance(
+                                data__uioptions__emptyValue, dict
+                            )
+                            if data__uioptions__emptyValue_is_dict:
+                                data__uioptions__emptyValue_keys = set(
+                                    data__uioptions__emptyValue.keys()
+                                )
+                            data__uioptions__emptyValue_any_of_count5 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            pass
+                    if not data__uioptions__emptyValue_any_of_count5:
+                        try:
+                            if not isinstance(
+                                data__uioptions__emptyValue, (list, tuple)
+                            ):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.emptyValue must be array"
+                                )
+                            data__uioptions__emptyValue_is_list = isinstance(
+                                data__uioptions__emptyValue, (list, tuple)
+                            )
+                            if data__uioptions__emptyValue_is_list:
+                                data__uioptions__emptyValue_len = len(
+                                    data__uioptions__emptyValue
+                                )
+                            if not isinstance(data__uioptions__emptyValue, (dict)):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.emptyValue must be object"
+                                )
+                            data__uioptions__emptyValue_is_dict = isinstance(
+                                data__uioptions__emptyValue, dict
+                            )
+                            if data__uioptions__emptyValue_is_dict:
+                                data__uioptions__emptyValue_keys = set(
+                                    data__uioptions__emptyValue.keys()
+                                )
+                            data__uioptions__emptyValue_any_of_count5 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            pass
+                    if not data__uioptions__emptyValue_any_of_count5:
+                        try:
+                            if not isinstance(data__uioptions__emptyValue, (NoneType)):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.emptyValue must be null"
+                                )
+                            data__uioptions__emptyValue_any_of_count5 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            pass
+                    if not data__uioptions__emptyValue_any_of_count5:
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.emptyValue cannot be validated by any definition"
+                        )
+                if "enumDisabled" in data__uioptions_keys:
+                    data__uioptions_keys.remove("enumDisabled")
+                    data__uioptions__enumDisabled = data__uioptions["enumDisabled"]
+                    if not isinstance(data__uioptions__enumDisabled, (list, tuple)):
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.enumDisabled must be array"
+                        )
+                    data__uioptions__enumDisabled_is_list = isinstance(
+                        data__uioptions__enumDisabled, (list, tuple)
+                    )
+                    if data__uioptions__enumDisabled_is_list:
+                        data__uioptions__enumDisabled_len = len(
+                            data__uioptions__enumDisabled
+                        )
+                        for (
+                            data__uioptions__enumDisabled_x,
+                            data__uioptions__enumDisabled_item,
+                        ) in enumerate(data__uioptions__enumDisabled):
+                            if not isinstance(
+                                data__uioptions__enumDisabled_item,
+                                (str, int, float, Decimal, bool),
+                            ):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.enumDisabled[{data__uioptions__enumDisabled_x}]".format(
+                                        **locals()
+                                    )
+                                    + " must be string or number or boolean"
+                                )
+                if "enumNames" in data__uioptions_keys:
+                    data__uioptions_keys.remove("enumNames")
+                    data__uioptions__enumNames = data__uioptions["enumNames"]
+                    data__uioptions__enumNames_any_of_count6 = 0
+                    if not data__uioptions__enumNames_any_of_count6:
+                        try:
+                            if not isinstance(data__uioptions__enumNames, (bool)):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.enumNames must be boolean"
+                                )
+                            data__uioptions__enumNames_any_of_count6 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            pass
+                    if not data__uioptions__enumNames_any_of_count6:
+                        try:
+                            if not isinstance(
+                                data__uioptions__enumNames, (int, float, Decimal)
+                            ) or isinstance(data__uioptions__enumNames, bool):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.enumNames must be number"
+                                )
+                            data__uioptions__enumNames_any_of_count6 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            pass
+                    if not data__uioptions__enumNames_any_of_count6:
+                        try:
+                            if not isinstance(data__uioptions__enumNames, (str)):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.enumNames must be string"
+                                )
+                            data__uioptions__enumNames_any_of_count6 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            pass
+                    if not data__uioptions__enumNames_any_of_count6:
+                        try:
+                            if not isinstance(
+                                data__uioptions__enumNames, (list, tuple)
+                            ):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.enumNames must be array"
+                                )
+                            data__uioptions__enumNames_is_list = isinstance(
+                                data__uioptions__enumNames, (list, tuple)
+                            )
+                            if data__uioptions__enumNames_is_list:
+                                data__uioptions__enumNames_len = len(
+                                    data__uioptions__enumNames
+                                )
+                                for (
+                                    data__uioptions__enumNames_x,
+                                    data__uioptions__enumNames_item,
+                                ) in enumerate(data__uioptions__enumNames):
+                                    if not isinstance(
+                                        data__uioptions__enumNames_item, (str)
+                                    ):
+                                        raise JsonSchemaValueException(
+                                            ""
+                                            + (name_prefix or "data")
+                                            + ".ui:options.enumNames[{data__uioptions__enumNames_x}]".format(
+                                                **locals()
+                                            )
+                                            + " must be string"
+                                        )
+                            if not isinstance(data__uioptions__enumNames, (dict)):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.enumNames must be object"
+                                )
+                            data__uioptions__enumNames_is_dict = isinstance(
+                                data__uioptions__enumNames, dict
+                            )
+                            if data__uioptions__enumNames_is_dict:
+                                data__uioptions__enumNames_keys = set(
+                                    data__uioptions__enumNames.keys()
+                                )
+                            data__uioptions__enumNames_any_of_count6 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            pass
+                    if not data__uioptions__enumNames_any_of_count6:
+                        try:
+                            if not isinstance(
+                                data__uioptions__enumNames, (list, tuple)
+                            ):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.enumNames must be array"
+                                )
+                            data__uioptions__enumNames_is_list = isinstance(
+                                data__uioptions__enumNames, (list, tuple)
+                            )
+                            if data__uioptions__enumNames_is_list:
+                                data__uioptions__enumNames_len = len(
+                                    data__uioptions__enumNames
+                                )
+                                for (
+                                    data__uioptions__enumNames_x,
+                                    data__uioptions__enumNames_item,
+                                ) in enumerate(data__uioptions__enumNames):
+                                    if not isinstance(
+                                        data__uioptions__enumNames_item, (str)
+                                    ):
+                                        raise JsonSchemaValueException(
+                                            ""
+                                            + (name_prefix or "data")
+                                            + ".ui:options.enumNames[{data__uioptions__enumNames_x}]".format(
+                                                **locals()
+                                            )
+                                            + " must be string"
+                                        )
+                            if not isinstance(
+                                data__uioptions__enumNames, (list, tuple)
+                            ):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.enumNames must be array"
+                                )
+                            data__uioptions__enumNames_is_list = isinstance(
+                                data__uioptions__enumNames, (list, tuple)
+                            )
+                            if data__uioptions__enumNames_is_list:
+                                data__uioptions__enumNames_len = len(
+                                    data__uioptions__enumNames
+                                )
+                            data__uioptions__enumNames_any_of_count6 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            pass
+                    if not data__uioptions__enumNames_any_of_count6:
+                        try:
+                            if not isinstance(data__uioptions__enumNames, (NoneType)):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.enumNames must be null"
+                                )
+                            data__uioptions__enumNames_any_of_count6 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            pass
+                    if not data__uioptions__enumNames_any_of_count6:
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.enumNames cannot be validated by any definition"
+                        )
+                if "filePreview" in data__uioptions_keys:
+                    data__uioptions_keys.remove("filePreview")
+                    data__uioptions__filePreview = data__uioptions["filePreview"]
+                    if not isinstance(data__uioptions__filePreview, (bool)):
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.filePreview must be boolean"
+                        )
+                if "help" in data__uioptions_keys:
+                    data__uioptions_keys.remove("help")
+                    data__uioptions__help = data__uioptions["help"]
+                    if not isinstance(data__uioptions__help, (str)):
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.help must be string"
+                        )
+                if "hideError" in data__uioptions_keys:
+                    data__uioptions_keys.remove("hideError")
+                    data__uioptions__hideError = data__uioptions["hideError"]
+                    if not isinstance(data__uioptions__hideError, (bool)):
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.hideError must be boolean"
+                        )
+                if "inline" in data__uioptions_keys:
+                    data__uioptions_keys.remove("inline")
+                    data__uioptions__inline = data__uioptions["inline"]
+                    if not isinstance(data__uioptions__inline, (bool)):
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.inline must be boolean"
+                        )
+                if "inputType" in data__uioptions_keys:
+                    data__uioptions_keys.remove("inputType")
+                    data__uioptions__inputType = data__uioptions["inputType"]
+                    if not isinstance(data__uioptions__inputType, (str)):
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.inputType must be string"
+                        )
+                if "order" in data__uioptions_keys:
+                    data__uioptions_keys.remove("order")
+                    data__uioptions__order = data__uioptions["order"]
+                    data__uioptions__order_any_of_count7 = 0
+                    if not data__uioptions__order_any_of_count7:
+                        try:
+                            if not isinstance(data__uioptions__order, (bool)):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.order must be boolean"
+                                )
+                            data__uioptions__order_any_of_count7 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            pass
+                    if not data__uioptions__order_any_of_count7:
+                        try:
+                            if not isinstance(
+                                data__uioptions__order, (int, float, Decimal)
+                            ) or isinstance(data__uioptions__order, bool):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.order must be number"
+                                )
+                            data__uioptions__order_any_of_count7 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            pass
+                    if not data__uioptions__order_any_of_count7:
+                        try:
+                            if not isinstance(data__uioptions__order, (str)):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.order must be string"
+                                )
+                            data__uioptions__order_any_of_count7 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            pass
+                    if not data__uioptions__order_any_of_count7:
+                        try:
+                            if not isinstance(data__uioptions__order, (list, tuple)):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.order must be array"
+                                )
+                            data__uioptions__order_is_list = isinstance(
+                                data__uioptions__order, (list, tuple)
+                            )
+                            if data__uioptions__order_is_list:
+                                data__uioptions__order_len = len(data__uioptions__order)
+                                for (
+                                    data__uioptions__order_x,
+                                    data__uioptions__order_item,
+                                ) in enumerate(data__uioptions__order):
+                                    if not isinstance(
+                                        data__uioptions__order_item, (str)
+                                    ):
+                                        raise JsonSchemaValueException(
+                                            ""
+                                            + (name_prefix or "data")
+                                            + ".ui:options.order[{data__uioptions__order_x}]".format(
+                                                **locals()
+                                            )
+                                            + " must be string"
+                                        )
+                            if not isinstance(data__uioptions__order, (dict)):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.order must be object"
+                                )
+                            data__uioptions__order_is_dict = isinstance(
+                                data__uioptions__order, dict
+                            )
+                            if data__uioptions__order_is_dict:
+                                data__uioptions__order_keys = set(
+                                    data__uioptions__order.keys()
+                                )
+                            data__uioptions__order_any_of_count7 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            pass
+                    if not data__uioptions__order_any_of_count7:
+                        try:
+                            if not isinstance(data__uioptions__order, (list, tuple)):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.order must be array"
+                                )
+                            data__uioptions__order_is_list = isinstance(
+                                data__uioptions__order, (list, tuple)
+                            )
+                            if data__uioptions__order_is_list:
+                                data__uioptions__order_len = len(data__uioptions__order)
+                                for (
+                                    data__uioptions__order_x,
+                                    data__uioptions__order_item,
+                                ) in enumerate(data__uioptions__order):
+                                    if not isinstance(
+                                        data__uioptions__order_item, (str)
+                                    ):
+                                        raise JsonSchemaValueException(
+                                            ""
+                                            + (name_prefix or "data")
+                                            + ".ui:options.order[{data__uioptions__order_x}]".format(
+                                                **locals()
+                                            )
+                                            + " must be string"
+                                        )
+                            if not isinstance(data__uioptions__order, (list, tuple)):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.order must be array"
+                                )
+                            data__uioptions__order_is_list = isinstance(
+                                data__uioptions__order, (list, tuple)
+                            )
+                            if data__uioptions__order_is_list:
+                                data__uioptions__order_len = len(data__uioptions__order)
+                            data__uioptions__order_any_of_count7 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            pass
+                    if not data__uioptions__order_any_of_count7:
+                        try:
+                            if not isinstance(data__uioptions__order, (NoneType)):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.order must be null"
+                                )
+                            data__uioptions__order_any_of_count7 += 1
+                        except (JsonSchemaValueException, JsonSchemaValuesException):
+                            pass
+                    if not data__uioptions__order_any_of_count7:
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.order cannot be validated by any definition"
+                        )
+                if "placeholder" in data__uioptions_keys:
+                    data__uioptions_keys.remove("placeholder")
+                    data__uioptions__placeholder = data__uioptions["placeholder"]
+                    if not isinstance(data__uioptions__placeholder, (str)):
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.placeholder must be string"
+                        )
+                if "readonly" in data__uioptions_keys:
+                    data__uioptions_keys.remove("readonly")
+                    data__uioptions__readonly = data__uioptions["readonly"]
+                    if not isinstance(data__uioptions__readonly, (bool)):
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.readonly must be boolean"
+                        )
+                if "rows" in data__uioptions_keys:
+                    data__uioptions_keys.remove("rows")
+                    data__uioptions__rows = data__uioptions["rows"]
+                    if not isinstance(
+                        data__uioptions__rows, (int, float, Decimal)
+                    ) or isinstance(data__uioptions__rows, bool):
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.rows must be number"
+                        )
+                if "style" in data__uioptions_keys:
+                    data__uioptions_keys.remove("style")
+                    data__uioptions__style = data__uioptions["style"]
+                    if not isinstance(data__uioptions__style, (dict)):
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.style must be object"
+                        )
+                if "urljsf:grid" in data__uioptions_keys:
+                    data__uioptions_keys.remove("urljsf:grid")
+                    data__uioptions__urljsfgrid = data__uioptions["urljsf:grid"]
+                    if not isinstance(data__uioptions__urljsfgrid, (dict)):
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.urljsf:grid must be object"
+                        )
+                    data__uioptions__urljsfgrid_is_dict = isinstance(
+                        data__uioptions__urljsfgrid, dict
+                    )
+                    if data__uioptions__urljsfgrid_is_dict:
+                        data__uioptions__urljsfgrid_keys = set(
+                            data__uioptions__urljsfgrid.keys()
+                        )
+                        if "addButton" in data__uioptions__urljsfgrid_keys:
+                            data__uioptions__urljsfgrid_keys.remove("addButton")
+                            data__uioptions__urljsfgrid__addButton = (
+                                data__uioptions__urljsfgrid["addButton"]
+                            )
+                            if not isinstance(
+                                data__uioptions__urljsfgrid__addButton, (list, tuple)
+                            ):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.urljsf:grid.addButton must be array"
+                                )
+                            data__uioptions__urljsfgrid__addButton_is_list = isinstance(
+                                data__uioptions__urljsfgrid__addButton, (list, tuple)
+                            )
+                            if data__uioptions__urljsfgrid__addButton_is_list:
+                                data__uioptions__urljsfgrid__addButton_len = len(
+                                    data__uioptions__urljsfgrid__addButton
+                                )
+                                for (
+                                    data__uioptions__urljsfgrid__addButton_x,
+                                    data__uioptions__urljsfgrid__addButton_item,
+                                ) in enumerate(data__uioptions__urljsfgrid__addButton):
+                                    if not isinstance(
+                                        data__uioptions__urljsfgrid__addButton_item,
+                                        (str),
+                                    ):
+                                        raise JsonSchemaValueException(
+                                            ""
+                                            + (name_prefix or "data")
+                                            + ".ui:options.urljsf:grid.addButton[{data__uioptions__urljsfgrid__addButton_x}]".format(
+                                                **locals()
+                                            )
+                                            + " must be string"
+                                        )
+                        if "children" in data__uioptions__urljsfgrid_keys:
+                            data__uioptions__urljsfgrid_keys.remove("children")
+                            data__uioptions__urljsfgrid__children = (
+                                data__uioptions__urljsfgrid["children"]
+                            )
+                            if not isinstance(
+                                data__uioptions__urljsfgrid__children, (dict)
+                            ):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.urljsf:grid.children must be object"
+                                )
+                            data__uioptions__urljsfgrid__children_is_dict = isinstance(
+                                data__uioptions__urljsfgrid__children, dict
+                            )
+                            if data__uioptions__urljsfgrid__children_is_dict:
+                                data__uioptions__urljsfgrid__children_keys = set(
+                                    data__uioptions__urljsfgrid__children.keys()
+                                )
+                                for (
+                                    data__uioptions__urljsfgrid__children_key
+                                ) in data__uioptions__urljsfgrid__children_keys:
+                                    if (
+                                        data__uioptions__urljsfgrid__children_key
+                                        not in []
+                                    ):
+                                        data__uioptions__urljsfgrid__children_value = data__uioptions__urljsfgrid__children.get(
+                                            data__uioptions__urljsfgrid__children_key
+                                        )
+                                        if not isinstance(
+                                            data__uioptions__urljsfgrid__children_value,
+                                            (list, tuple),
+                                        ):
+                                            raise JsonSchemaValueException(
+                                                ""
+                                                + (name_prefix or "data")
+                                                + ".ui:options.urljsf:grid.children.{data__uioptions__urljsfgrid__children_key}".format(
+                                                    **locals()
+                                                )
+                                                + " must be array"
+                                            )
+                                        data__uioptions__urljsfgrid__children_value_is_list = isinstance(
+                                            data__uioptions__urljsfgrid__children_value,
+                                            (list, tuple),
+                                        )
+                                        if data__uioptions__urljsfgrid__children_value_is_list:
+                                            data__uioptions__urljsfgrid__children_value_len = len(
+                                                data__uioptions__urljsfgrid__children_value
+                                            )
+                                            for (
+                                                data__uioptions__urljsfgrid__children_value_x,
+                                                data__uioptions__urljsfgrid__children_value_item,
+                                            ) in enumerate(
+                                                data__uioptions__urljsfgrid__children_value
+                                            ):
+                                                if not isinstance(
+                                                    data__uioptions__urljsfgrid__children_value_item,
+                                                    (str),
+                                                ):
+                                                    raise JsonSchemaValueException(
+                                                        ""
+                                                        + (name_prefix or "data")
+                                                        + ".ui:options.urljsf:grid.children.{data__uioptions__urljsfgrid__children_key}[{data__uioptions__urljsfgrid__children_value_x}]".format(
+                                                            **locals()
+                                                        )
+                                                        + " must be string"
+                                                    )
+                        if "default" in data__uioptions__urljsfgrid_keys:
+                            data__uioptions__urljsfgrid_keys.remove("default")
+                            data__uioptions__urljsfgrid__default = (
+                                data__uioptions__urljsfgrid["default"]
+                            )
+                            if not isinstance(
+                                data__uioptions__urljsfgrid__default, (list, tuple)
+                            ):
+                                raise JsonSchemaValueException(
+                                    ""
+                                    + (name_prefix or "data")
+                                    + ".ui:options.urljsf:grid.default must be array"
+                                )
+                            data__uioptions__urljsfgrid__default_is_list = isinstance(
+                                data__uioptions__urljsfgrid__default, (list, tuple)
+                            )
+                            if data__uioptions__urljsfgrid__default_is_list:
+                                data__uioptions__urljsfgrid__default_len = len(
+                                    data__uioptions__urljsfgrid__default
+                                )
+                                for (
+                                    data__uioptions__urljsfgrid__default_x,
+                                    data__uioptions__urljsfgrid__default_item,
+                                ) in enumerate(data__uioptions__urljsfgrid__default):
+                                    if not isinstance(
+                                        data__uioptions__urljsfgrid__default_item, (str)
+                                    ):
+                                        raise JsonSchemaValueException(
+                                            ""
+                                            + (name_prefix or "data")
+                                            + ".ui:options.urljsf:grid.default[{data__uioptions__urljsfgrid__default_x}]".format(
+                                                **locals()
+                                            )
+                                            + " must be string"
+                                        )
+                        if data__uioptions__urljsfgrid_keys:
+                            raise JsonSchemaValueException(
+                                ""
+                                + (name_prefix or "data")
+                                + ".ui:options.urljsf:grid must not contain "
+                                + str(data__uioptions__urljsfgrid_keys)
+                                + " properties"
+                            )
+                if "widget" in data__uioptions_keys:
+                    data__uioptions_keys.remove("widget")
+                    data__uioptions__widget = data__uioptions["widget"]
+                    if not isinstance(data__uioptions__widget, (str)):
+                        raise JsonSchemaValueException(
+                            ""
+                            + (name_prefix or "data")
+                            + ".ui:options.widget must be string"
+                        )
+        if "ui:rootFieldId" in data_keys:
+            data_keys.remove("ui:rootFieldId")
+            data__uirootFieldId = data["ui:rootFieldId"]
+            if not isinstance(data__uirootFieldId, (str)):
+                raise JsonSchemaValueException(
+                    "" + (name_prefix or "data") + ".ui:rootFieldId must be string"
+                )
+        for data_key in data_keys:
+            if data_key not in [
+                "items",
+                "ui:field",
+                "ui:fieldReplacesAnyOrOneOf",
+                "ui:options",
+                "ui:rootFieldId",
+            ]:
+                data_value = data.get(data_key)
+                data_value_any_of_count8 = 0
+                if not data_value_any_of_count8:
+                    try:
+                        validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_uischema(
+                            data_value,
+                            custom_formats,
+                            (name_prefix or "data") + ".{data_key}".format(**locals()),
+                        )
+                        data_value_any_of_count8 += 1
+                    except (JsonSchemaValueException, JsonSchemaValuesException):
+                        pass
+                if not data_value_any_of_count8:
+                    try:
+                        data_value_any_of_count8 += 1
+                    except (JsonSchemaValueException, JsonSchemaValuesException):
+                        pass
+                if not data_value_any_of_count8:
+                    raise JsonSchemaValueException(
+                        ""
+                        + (name_prefix or "data")
+                        + ".{data_key}".format(**locals())
+                        + " cannot be validated by any definition"
+                    )
+    return data
+
+
+def validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_schema(
+    data, custom_formats={}, name_prefix=None
+):
+    data_one_of_count9 = 0
+    if data_one_of_count9 < 2:
+        try:
+            validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_schema_location(
+                data, custom_formats, (name_prefix or "data") + ""
+            )
+            data_one_of_count9 += 1
+        except (JsonSchemaValueException, JsonSchemaValuesException):
+            pass
+    if data_one_of_count9 < 2:
+        try:
+            validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_object(
+                data, custom_formats, (name_prefix or "data") + ""
+            )
+            data_one_of_count9 += 1
+        except (JsonSchemaValueException, JsonSchemaValuesException):
+            pass
+    if data_one_of_count9 != 1:
+        raise JsonSchemaValueException(
+            "" + (name_prefix or "data") + " must be valid exactly by one definition"
+        )
+    return data
+
+
+def validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_object(
+    data, custom_formats={}, name_prefix=None
+):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object")
+    return data
+
+
+def validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_schema_location(
+    data, custom_formats={}, name_prefix=None
+):
+    if not isinstance(data, (str)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be string")
+    if isinstance(data, str):
+        data_len = len(data)
+        if data_len < 1:
+            raise JsonSchemaValueException(
+                ""
+                + (name_prefix or "data")
+                + " must be longer than or equal to 1 characters"
+            )
+        if not custom_formats["uri-reference"](data):
+            raise JsonSchemaValueException(
+                "" + (name_prefix or "data") + " must be uri-reference"
+            )
+    return data
+
+
+def validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_checks(
+    data, custom_formats={}, name_prefix=None
+):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object")
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        for data_key in data_keys:
+            if data_key not in []:
+                data_value = data.get(data_key)
+                validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json__definitions_any_template(
+                    data_value,
+                    custom_formats,
+                    (name_prefix or "data") + ".{data_key}".format(**locals()),
+                )
+    return data
+
+
+validate = (
+    validate_https___urljsf_rtfd_org_en_latest__static_urljsf_schema_v0_form_schema_json
+)
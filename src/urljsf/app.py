@@ -0,0 +1,346 @@
+"""An ASGI application which renders ``urljsf`` definitions on request."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import mimetypes
+from collections import OrderedDict
+from collections.abc import AsyncIterable
+from dataclasses import dataclass, field
+from logging import Logger, getLogger
+from typing import TYPE_CHECKING, Any, Callable
+
+from .cache import HASH_LENGTH, file_stamp, source_key
+from .config import Config
+from .constants import STATIC, __dist__
+from .errors import UrljsfError
+from .source import DefSource
+from .static import CHUNK_SIZE
+from .urljsf import Urljsf
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Iterable, Iterator
+    from pathlib import Path
+
+#: a raw definition for a request path, or ``None`` if not found
+Loader = Callable[[str], "dict[str, Any] | Awaitable[dict[str, Any] | None] | None"]
+
+#: an ASGI message
+Message = dict[str, Any]
+
+#: HTTP response headers
+Headers = list[tuple[bytes, bytes]]
+
+#: an ASGI ``receive`` callable
+Receive = Callable[[], "Awaitable[Message]"]
+
+#: an ASGI ``send`` callable
+Send = Callable[[Message], "Awaitable[None]"]
+
+#: the default number of rendered pages kept in memory
+MAX_PAGES = 1024
+
+#: the default size in bytes of the largest rendered page kept in memory
+MAX_PAGE_BYTES = 2**22
+
+#: the approximate number of characters sent at a time while rendering
+BUFFER_SIZE = 2**16
+
+#: response headers for static assets, which change with the package version
+STATIC_CACHE_CONTROL = b"public, max-age=3600"
+
+#: response headers for rendered pages, which may change with their definition
+PAGE_CACHE_CONTROL = b"no-cache"
+
+
+@dataclass
+class Pages:
+    """A bounded, least-recently-used cache of rendered pages, by definition hash."""
+
+    maxsize: int = MAX_PAGES
+    max_bytes: int = MAX_PAGE_BYTES
+    hits: int = 0
+    misses: int = 0
+    pages: OrderedDict[str, bytes] = field(default_factory=OrderedDict)
+
+    def get(self, key: str) -> bytes | None:
+        """Get a rendered page, if still cached."""
+        body = self.pages.get(key)
+        if body is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.pages.move_to_end(key)
+        return body
+
+    def put(self, key: str, body: bytes) -> None:
+        """Cache a rendered page, forgetting the least-recently-used pages."""
+        self.pages[key] = body
+        while len(self.pages) > self.maxsize:
+            self.pages.popitem(last=False)
+
+    async def keep(
+        self, key: str, chunks: AsyncIterable[bytes]
+    ) -> AsyncIterator[bytes]:
+        """Pass through the chunks of a page, caching it if complete and small."""  # noqa: DOC402
+        kept: list[bytes] | None = []
+        size = 0
+        async for chunk in chunks:
+            size += len(chunk)
+            if kept is not None:
+                kept.append(chunk)
+                if size > self.max_bytes:
+                    kept = None
+            yield chunk
+        if kept is not None:
+            self.put(key, b"".join(kept))
+
+    def info(self) -> dict[str, int]:
+        """Get statistics about the rendered pages."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.pages),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self) -> None:
+        """Forget all rendered pages and statistics."""
+        self.pages.clear()
+        self.hits = self.misses = 0
+
+
+@dataclass
+class UrljsfApp:
+    """An ASGI application which renders ``urljsf`` definitions on request.
+
+    The ``loader`` is given each request path, without its leading ``/``, and
+    returns (or awaits) a raw definition, or ``None``. Each rendered page has an
+    ``ETag`` of the hash of its definition, and is kept in a bounded cache. The
+    ``urljsf`` static assets are streamed from the package, under ``url_base``.
+
+    Parsing, validating, and rendering definitions, and reading static assets,
+    all happen in worker threads, so other requests are not blocked.
+
+    As definitions may come from untrusted sources, form fields may not reference
+    ``./`` files or ``py:`` imports, unless ``resolve_refs`` is enabled.
+    """
+
+    loader: Loader
+    defaults: dict[str, Any] | None = None
+    template: str = "urljsf/standalone.j2"
+    extra_template_paths: list[Path] = field(default_factory=list)
+    url_base: str = "/"
+    resolve_refs: bool = False
+    pages: Pages = field(default_factory=Pages)
+    log: Logger = field(default_factory=lambda: getLogger(__dist__))
+
+    async def __call__(self, scope: Message, receive: Receive, send: Send) -> None:
+        """Handle an ASGI connection."""
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+            return
+
+        if scope["method"] not in {"GET", "HEAD"}:
+            await self.send_text(send, 405, "method not allowed")
+            return
+
+        path: str = scope["path"]
+        static = f"{self.url_base}_static/urljsf/"
+        if path.startswith(static):
+            await self.send_static(scope, send, path[len(static) :])
+        else:
+            await self.send_page(scope, send, path.lstrip("/"))
+
+    @staticmethod
+    async def lifespan(receive: Receive, send: Send) -> None:
+        """Acknowledge startup and shutdown."""
+        while True:
+            message = await receive()
+            kind = message["type"].rpartition(".")[2]
+            await send({"type": f"lifespan.{kind}.complete"})
+            if kind == "shutdown":
+                return
+
+    async def send_page(self, scope: Message, send: Send, name: str) -> None:
+        """Send a rendered definition, unless the client already has it."""
+        raw = self.loader(name)
+        if inspect.isawaitable(raw):
+            raw = await raw
+        if raw is None:
+            await self.send_text(send, 404, "not found")
+            return
+
+        key = source_key(self.template, self.url_base, self.defaults, raw)
+        etag = f'"{key[:HASH_LENGTH]}"'
+        headers: Headers = [
+            (b"etag", etag.encode()),
+            (b"cache-control", PAGE_CACHE_CONTROL),
+        ]
+
+        if self.is_fresh(scope, etag):
+            await self.send_empty(send, 304, headers)
+            return
+
+        headers += [(b"content-type", b"text/html; charset=utf-8")]
+        body = self.pages.get(key)
+        if body is not None:
+            headers += [(b"content-length", f"{len(body)}".encode())]
+            await self.send_body(scope, send, headers, [body])
+            return
+
+        try:
+            source = await asyncio.to_thread(
+                DefSource,
+                raw=raw,
+                defaults=self.defaults,
+                resolve_refs=self.resolve_refs,
+                log=self.log,
+            )
+        except (UrljsfError, ValueError, TypeError, NotImplementedError) as err:
+            await self.send_text(send, 422, f"{err}")
+            return
+        if source.validation_errors:
+            errors = "\n".join(
+                getattr(err, "message", f"{err}") for err in source.validation_errors
+            )
+            await self.send_text(send, 422, errors)
+            return
+
+        chunks = in_thread(self.render(source))
+        await self.send_body(scope, send, headers, self.pages.keep(key, chunks))
+
+    def render(self, source: DefSource) -> Iterator[bytes]:
+        """Render a validated definition as a page, in chunks of bytes."""  # noqa: DOC402
+        yield from buffered(self.urljsf(source).generate(), BUFFER_SIZE)
+
+    def urljsf(self, source: DefSource) -> Urljsf:
+        """Prepare to render a validated definition as a page."""
+        config = Config(
+            input_=None,
+            definition=source,
+            defaults=self.defaults,
+            template=self.template,
+            extra_template_paths=self.extra_template_paths,
+            url_base=self.url_base,
+            log_level="WARNING",
+        )
+        return Urljsf(config)
+
+    async def send_static(self, scope: Message, send: Send, rel: str) -> None:
+        """Stream a static asset from the package."""
+        root = (STATIC / "urljsf").resolve()
+        path = (root / rel).resolve()
+        if root not in path.parents or not path.is_file():
+            await self.send_text(send, 404, "not found")
+            return
+
+        mtime, size = file_stamp(path)
+        etag = f'"{mtime:x}-{size:x}"'
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        headers: Headers = [
+            (b"etag", etag.encode()),
+            (b"cache-control", STATIC_CACHE_CONTROL),
+        ]
+        if self.is_fresh(scope, etag):
+            await self.send_empty(send, 304, headers)
+            return
+
+        headers += [
+            (b"content-type", content_type.encode()),
+            (b"content-length", f"{size}".encode()),
+        ]
+        await self.send_body(scope, send, headers, in_thread(read_chunks(path)))
+
+    @staticmethod
+    def is_fresh(scope: Message, etag: str) -> bool:
+        """Check whether an ``If-None-Match`` request header matches an ``ETag``."""
+        for name, value in scope.get("headers", []):
+            if name.lower() == b"if-none-match":
+                tags = {tag.strip() for tag in value.decode("latin-1").split(",")}
+                return "*" in tags or etag in tags or f"W/{etag}" in tags
+        return False
+
+    @staticmethod
+    async def send_body(
+        scope: Message,
+        send: Send,
+        headers: Headers,
+        chunks: Iterable[bytes] | AsyncIterable[bytes],
+    ) -> None:
+        """Send a successful response in chunks, or only its headers for ``HEAD``."""
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        if scope["method"] != "HEAD":
+            if isinstance(chunks, AsyncIterable):
+                async for chunk in chunks:
+                    await send({
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": True,
+                    })
+            else:
+                for chunk in chunks:
+                    await send({
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": True,
+                    })
+        await send({"type": "http.response.body", "body": b""})
+
+    @staticmethod
+    async def send_empty(send: Send, status: int, headers: Headers) -> None:
+        """Send a response without a body."""
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": headers,
+        })
+        await send({"type": "http.response.body", "body": b""})
+
+    @staticmethod
+    async def send_text(send: Send, status: int, text: str) -> None:
+        """Send a plain text response."""
+        body = text.encode("utf-8")
+        headers = [
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", f"{len(body)}".encode()),
+        ]
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": headers,
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+def buffered(chunks: Iterable[str], size: int) -> Iterator[bytes]:
+    """Join many small chunks of text into fewer, larger chunks of bytes."""  # noqa: DOC402
+    buffer: list[str] = []
+    length = 0
+    for chunk in chunks:
+        buffer += [chunk]
+        length += len(chunk)
+        if length >= size:
+            yield "".join(buffer).encode("utf-8")
+            buffer, length = [], 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+async def in_thread(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    """Get each chunk of a blocking iterable in a worker thread."""  # noqa: DOC402
+    iterator = iter(chunks)
+    while True:
+        chunk = await asyncio.to_thread(next, iterator, None)
+        if chunk is None:
+            return
+        yield chunk
+
+
+def read_chunks(path: Path, size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Read a file in chunks."""  # noqa: DOC402
+    with path.open("rb") as fd:
+        yield from iter(lambda: fd.read(size), b"")
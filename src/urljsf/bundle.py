@@ -0,0 +1,161 @@
+"""Bundle JSON Schema ``$ref`` into a single, self-contained schema."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import unquote
+
+#: keys which hold named subschemas
+DEFINITIONS_KEYS = ("definitions", "$defs")
+
+#: keys whose values are data, and may contain ``$ref`` which are not references
+DATA_KEYS = {"const", "default", "enum", "examples"}
+
+#: keys whose values map names, which may look like ``DATA_KEYS``, to subschemas
+NAMED_KEYS = {
+    *DEFINITIONS_KEYS,
+    "dependencies",
+    "dependentSchemas",
+    "patternProperties",
+    "properties",
+}
+
+#: the key for the root document, which has no path
+ROOT = ""
+
+#: characters not used in generated definition names
+UNSAFE_NAME = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+@dataclass
+class Bundler:
+    """Inline local and relative file ``$ref`` into one ``definitions`` block.
+
+    Every referenced subschema is hoisted into ``definitions`` once, unreferenced
+    definitions are dropped, and remote ``$ref`` are kept as-is. The input is not
+    changed, but unchanged values may be shared with the output.
+    """
+
+    root: dict[str, Any]
+    base: Path | None
+    loader: Callable[[Path], dict[str, Any]]
+    names: dict[tuple[str, str], str] = field(default_factory=dict)
+    definitions: dict[str, Any] = field(default_factory=dict)
+    documents: dict[str, Any] = field(default_factory=dict)
+
+    def bundle(self) -> dict[str, Any]:
+        """Build a new, self-contained schema."""
+        self.documents[ROOT] = self.root
+        root = {k: v for k, v in self.root.items() if k not in DEFINITIONS_KEYS}
+        bundled = self.rewrite_dict(root, ROOT)
+        if self.definitions:
+            bundled["definitions"] = self.definitions
+        return bundled
+
+    def rewrite(self, node: object, doc: str, *, named: bool = False) -> object:
+        """Copy a node, rewriting any ``$ref`` to point to hoisted definitions."""
+        if isinstance(node, list):
+            return [self.rewrite(item, doc) for item in node]
+        if isinstance(node, dict):
+            return self.rewrite_dict(node, doc, named=named)
+        return node
+
+    def rewrite_dict(
+        self, node: dict[str, Any], doc: str, *, named: bool = False
+    ) -> dict[str, Any]:
+        """Copy an object, rewriting any ``$ref``.
+
+        If ``named``, the keys are names of subschemas, rather than keywords.
+        """
+        if named:
+            return {key: self.rewrite(value, doc) for key, value in node.items()}
+        rewritten: dict[str, Any] = {}
+        for key, value in node.items():
+            if key == "$ref" and isinstance(value, str):
+                rewritten[key] = self.resolve_ref(value, doc)
+            elif key in DATA_KEYS:
+                rewritten[key] = value
+            else:
+                rewritten[key] = self.rewrite(value, doc, named=key in NAMED_KEYS)
+        return rewritten
+
+    def resolve_ref(self, ref: str, doc: str) -> str:
+        """Hoist the target of a reference, returning its new reference."""
+        url, _, fragment = ref.partition("#")
+        pointer = unquote(fragment)
+        target_doc = doc
+
+        if url:
+            base = self.base if doc == ROOT else Path(doc).parent
+            if base is None or ":" in url or url.startswith("/"):
+                return ref
+            target_doc = str((base / unquote(url)).resolve())
+        elif doc == ROOT and not pointer.startswith(
+            tuple(f"/{key}/" for key in DEFINITIONS_KEYS)
+        ):
+            return ref
+
+        key = (target_doc, pointer)
+        name = self.names.get(key)
+        if name is None:
+            try:
+                target = self.lookup(target_doc, pointer)
+            except (KeyError, IndexError, ValueError, OSError):
+                return ref
+            name = self.names[key] = self.new_name(target_doc, pointer)
+            self.definitions[name] = {}
+            self.definitions[name] = self.rewrite(target, target_doc)
+
+        return f"#/definitions/{escape(name)}"
+
+    def lookup(self, doc: str, pointer: str) -> object:
+        """Find the value at a JSON pointer in a document."""
+        if doc not in self.documents:
+            self.documents[doc] = self.loader(Path(doc))
+        node: Any = self.documents[doc]
+        for raw_token in pointer.split("/")[1:]:
+            token = unescape(raw_token)
+            node = node[int(token)] if isinstance(node, list) else node[token]
+        return node
+
+    def new_name(self, doc: str, pointer: str) -> str:
+        """Pick a unique, readable name for a hoisted definition."""
+        tokens = [unescape(t) for t in pointer.split("/")[1:]]
+        if tokens and tokens[0] in DEFINITIONS_KEYS:
+            tokens = tokens[1:]
+        if doc == ROOT:
+            name = "-".join(tokens)
+        else:
+            name = UNSAFE_NAME.sub(
+                "-", "-".join([Path(doc).name.split(".")[0], *tokens])
+            )
+
+        unique, i = name, 1
+        while unique in self.definitions:
+            i += 1
+            unique = f"{name}-{i}"
+        return unique
+
+
+def bundle_schema(
+    schema: dict[str, Any],
+    base: Path | None,
+    loader: Callable[[Path], dict[str, Any]],
+) -> dict[str, Any]:
+    """Bundle a schema, resolving relative file ``$ref`` from a folder."""
+    return Bundler(root=schema, base=base, loader=loader).bundle()
+
+
+def escape(token: str) -> str:
+    """Escape a JSON pointer token."""
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def unescape(token: str) -> str:
+    """Unescape a JSON pointer token."""
+    return token.replace("~1", "/").replace("~0", "~")
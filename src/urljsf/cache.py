@@ -0,0 +1,357 @@
+"""Caches for ``urljsf``."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import sys
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from hashlib import sha256
+from typing import TYPE_CHECKING, Any, Callable
+
+import jinja2
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import SchemaError
+from jsonschema.validators import validator_for
+
+from .bundle import bundle_schema
+from .constants import SCHEMA_VERSION, UTF8, __version__
+from .filters import FILTERS
+from .utils import dotted_module_file, import_dotted_dict
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from jsonschema.protocols import Validator
+
+#: the number of hex digits of a content hash used in file names
+HASH_LENGTH = 16
+
+#: the folder in a cache directory for validated sources
+SOURCES = "sources"
+
+#: a key for a shared ``jinja2`` environment
+EnvKey = tuple[tuple[str, ...], bool, "str | None"]
+
+#: shared ``jinja2`` environments, which each hold their own compiled templates
+_ENVS: dict[EnvKey, jinja2.Environment] = {}
+
+
+def get_env(
+    search_path: tuple[str, ...],
+    *,
+    autoescape: bool = True,
+    bytecode_dir: Path | None = None,
+) -> jinja2.Environment:
+    """Get a ``jinja2`` environment shared by all forms with the same templates."""
+    key: EnvKey = (search_path, autoescape, str(bytecode_dir) if bytecode_dir else None)
+    env = _ENVS.get(key)
+
+    if env is None:
+        bytecode_cache: jinja2.BytecodeCache | None = None
+        if bytecode_dir:
+            bytecode_dir.mkdir(parents=True, exist_ok=True)
+            bytecode_cache = jinja2.FileSystemBytecodeCache(str(bytecode_dir))
+        env = _ENVS[key] = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(searchpath=list(search_path)),
+            undefined=jinja2.StrictUndefined,
+            autoescape=autoescape,  # noqa: S701
+            bytecode_cache=bytecode_cache,
+        )
+        env.filters.update(FILTERS)
+
+    return env
+
+
+def clear_envs() -> None:
+    """Forget all shared ``jinja2`` environments."""
+    _ENVS.clear()
+
+
+def source_key(*parts: object) -> str:
+    """Get a stable content hash for the inputs to parsing and validating a source."""
+    text = json.dumps(
+        [__version__, SCHEMA_VERSION, *parts], sort_keys=True, default=str
+    )
+    return sha256(text.encode("utf-8")).hexdigest()
+
+
+def load_source(cache_dir: Path, key: str) -> dict[str, Any] | None:
+    """Maybe load previously-validated raw data."""
+    path = cache_dir / SOURCES / f"{key}.json"
+    if not path.exists():
+        return None
+    try:
+        raw = json.loads(path.read_text(**UTF8))
+    except json.JSONDecodeError:  # pragma: no cover
+        return None
+    return raw if isinstance(raw, dict) else None
+
+
+def save_source(cache_dir: Path, key: str, raw: dict[str, Any]) -> bool:
+    """Maybe save validated raw data, if it can be represented as JSON."""
+    try:
+        text = json.dumps(raw)
+    except (TypeError, ValueError):
+        return False
+    path = cache_dir / SOURCES / f"{key}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(text, **UTF8)
+    tmp.replace(path)
+    return True
+
+
+@dataclass
+class SchemaChecks:
+    """A bounded, least-recently-used record of checked JSON schema.
+
+    This may be shared by many threads, e.g. rendering pages in ``urljsf.app``.
+    """
+
+    maxsize: int = 256
+    hits: int = 0
+    misses: int = 0
+    checked: OrderedDict[str, SchemaError | None] = field(default_factory=OrderedDict)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def check(self, schema: dict[str, Any]) -> SchemaError | None:
+        """Check a schema against its meta-schema, unless seen before."""
+        key = sha256(
+            json.dumps(schema, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+        with self.lock:
+            if key in self.checked:
+                self.hits += 1
+                self.checked.move_to_end(key)
+                return self.checked[key]
+            self.misses += 1
+
+        validator_cls: type[Validator] = validator_for(schema, default=Draft7Validator)
+        error: SchemaError | None = None
+        try:
+            validator_cls.check_schema(schema)
+        except SchemaError as err:
+            error = err
+
+        with self.lock:
+            self.checked[key] = error
+            while len(self.checked) > self.maxsize:
+                self.checked.popitem(last=False)
+        return error
+
+    def info(self) -> dict[str, int]:
+        """Get statistics about the checked schema."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.checked),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self) -> None:
+        """Forget all checked schema and statistics."""
+        with self.lock:
+            self.checked.clear()
+            self.hits = self.misses = 0
+
+
+#: schema checked in this process
+SCHEMA_CHECKS = SchemaChecks()
+
+
+def file_stamp(path: Path) -> tuple[int, int]:
+    """Get the modified time and size of a file, which change with its content."""
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+@dataclass
+class Resolutions:
+    """Documents referenced by forms, loaded once per build.
+
+    The same objects are returned to every form, and must not be mutated.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    files: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = field(
+        default_factory=dict
+    )
+    imports: dict[str, dict[str, Any]] = field(default_factory=dict)
+    bundles: dict[
+        tuple[int, str], tuple[object, dict[str, Any], dict[Path, tuple[int, int]]]
+    ] = field(default_factory=dict)
+
+    def load_file(
+        self, path: Path, loader: Callable[[Path], dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Load a local file, unless its size and modified time are unchanged."""
+        path = path.resolve()
+        stamp = file_stamp(path)
+        cached = self.files.get(path)
+        if cached and cached[0] == stamp:
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        raw = loader(path)
+        self.files[path] = (stamp, raw)
+        return raw
+
+    def import_dotted(self, dotted: str) -> dict[str, Any]:
+        """Import a python object (or call a python function) once."""
+        if dotted in self.imports:
+            self.hits += 1
+            return self.imports[dotted]
+        self.misses += 1
+        raw = self.imports[dotted] = import_dotted_dict(dotted)
+        return raw
+
+    def bundle(
+        self,
+        schema: dict[str, Any],
+        base: Path | None,
+        loader: Callable[[Path], dict[str, Any]],
+    ) -> tuple[dict[str, Any], set[Path]]:
+        """Bundle a schema once, returning it with the files it referenced.
+
+        A bundle is made again if any of the files it referenced changed.
+        """
+        key = (id(schema), str(base))
+        cached = self.bundles.get(key)
+        if cached and cached[0] is schema and _unchanged(cached[2]):
+            self.hits += 1
+            return cached[1], {*cached[2]}
+        self.misses += 1
+        stamps: dict[Path, tuple[int, int]] = {}
+
+        def load(path: Path) -> dict[str, Any]:
+            raw = self.load_file(path, loader)
+            path = path.resolve()
+            stamps[path] = self.files[path][0]
+            return raw
+
+        bundled = bundle_schema(schema, base, load)
+        self.bundles[key] = (schema, bundled, stamps)
+        return bundled, {*stamps}
+
+    def forget(self, paths: Iterable[Path]) -> None:
+        """Forget imports from changed files, reloading their modules."""
+        changed = {*paths}
+        reloaded: set[str] = set()
+        for dotted in [*self.imports]:
+            if dotted_module_file(dotted) not in changed:
+                continue
+            self.imports.pop(dotted)
+            module_name = dotted.split(":", 1)[0]
+            module = sys.modules.get(module_name)
+            if module and module_name not in reloaded:
+                importlib.reload(module)
+                reloaded.add(module_name)
+
+    def info(self) -> dict[str, int]:
+        """Get statistics about the resolved documents."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "files": len(self.files),
+            "imports": len(self.imports),
+            "bundles": len(self.bundles),
+        }
+
+    def clear(self) -> None:
+        """Forget all resolved documents and statistics."""
+        self.files.clear()
+        self.imports.clear()
+        self.bundles.clear()
+        self.hits = self.misses = 0
+
+
+#: documents resolved during the current build
+RESOLUTIONS = Resolutions()
+
+
+def _unchanged(stamps: dict[Path, tuple[int, int]]) -> bool:
+    """Check whether files still have the same stamps."""
+    try:
+        return all(file_stamp(path) == stamp for path, stamp in stamps.items())
+    except OSError:
+        return False
+
+
+@dataclass
+class Payloads:
+    """JSON documents written once as content-hashed files, shared by many pages.
+
+    Objects are remembered by identity, so the same (unmutated) resolved document
+    is only serialized once per build.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    names: dict[int, tuple[object, str]] = field(default_factory=dict)
+
+    def write(self, folder: Path, value: object) -> str:
+        """Write a document, unless already present, returning its file name."""
+        text: str | None = None
+        cached = self.names.get(id(value))
+        if cached and cached[0] is value:
+            name = cached[1]
+        else:
+            text = payload_text(value)
+            name = f"{sha256(text.encode('utf-8')).hexdigest()[:HASH_LENGTH]}.json"
+            self.names[id(value)] = (value, name)
+
+        path = folder / name
+        if path.exists():
+            self.hits += 1
+            return name
+
+        self.misses += 1
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(payload_text(value) if text is None else text, **UTF8)
+        tmp.replace(path)
+        return name
+
+    def info(self) -> dict[str, int]:
+        """Get statistics about the written documents."""
+        return {"hits": self.hits, "misses": self.misses, "names": len(self.names)}
+
+    def clear(self) -> None:
+        """Forget all written documents and statistics."""
+        self.names.clear()
+        self.hits = self.misses = 0
+
+
+def payload_text(value: object) -> str:
+    """Serialize a document with a stable key order, for content hashing.
+
+    This ignores the JSON options of pages, so a document always has the same name.
+    """
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+#: documents written during the current build
+PAYLOADS = Payloads()
+
+
+def cache_stats() -> Counter[str]:
+    """Get the hits and misses of the caches in this process."""
+    caches = {
+        "resolutions": RESOLUTIONS,
+        "schema_checks": SCHEMA_CHECKS,
+        "payloads": PAYLOADS,
+    }
+    return Counter({
+        f"{name}_{key}": getattr(cache, key)
+        for name, cache in caches.items()
+        for key in ["hits", "misses"]
+    })
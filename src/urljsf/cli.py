@@ -4,21 +4,49 @@
 
 from __future__ import annotations
 
+import os
 from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from glob import glob
+from logging import getLogger
 from pathlib import Path
+from typing import Any
 
 from .config import DEFAULTS, Config
-from .constants import __dist__, __version__
+from .constants import EXTENSION_FORMAT, FORMS_STATIC, __dist__, __version__
+from .profile import PROFILER, Profile
+from .schema import urljsf_validator
 from .urljsf import Urljsf
 
+#: the expected name of definition files found in folders
+DEFINITION_STEM = "urljsf"
+
+#: characters which indicate an input is a ``glob`` pattern
+GLOB_CHARS = "*?["
+
+#: the return code, errors, and profiles of building a definition in a worker
+BuildResult = tuple[int, "list[str]", "list[Profile]"]
+
+#: the default address for ``--serve``
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+
 
 def get_parser() -> ArgumentParser:
     """Get a parser for the command line arguments."""
-    parser = ArgumentParser(__dist__, add_help=False, description=__doc__)
+    parser = ArgumentParser(
+        __dist__, add_help=False, description=__doc__, fromfile_prefix_chars="@"
+    )
     parser.add_argument(
         "input_",
         metavar="INPUT",
-        help="a urljsf definition file as JSON, TOML, or YAML",
+        nargs="+",
+        help=(
+            "urljsf definition files as JSON, TOML, or YAML, folders containing"
+            f" ``{DEFINITION_STEM}.*`` files, or glob patterns; prefix a manifest file"
+            " with ``@`` to read more inputs, one per line"
+        ),
     )
     parser.add_argument(
         "-o",
@@ -42,6 +70,95 @@ def get_parser() -> ArgumentParser:
         help="name of the template to use",
         default=DEFAULTS["template"],
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="path to a folder for caching templates and validated definitions",
+    )
+    parser.add_argument(
+        "--link-static",
+        action="store_true",
+        help="hard link static assets instead of copying, where possible",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="also write gzip (and brotli, if installed) copies of changed outputs",
+    )
+    parser.add_argument(
+        "--bundle",
+        action="store_true",
+        help=(
+            "inline relative ``$ref`` in each form schema, keeping only the used"
+            " ``definitions``"
+        ),
+    )
+    parser.add_argument(
+        "--precompile",
+        action="store_true",
+        help=(
+            "write standalone validators for inline form schema with ``node`` and"
+            " ``@rjsf/validator-ajv8``, instead of compiling them in the browser"
+        ),
+    )
+    parser.add_argument(
+        "--externalize",
+        action="store_true",
+        help=(
+            "write inline schema and UI schema once as content-hashed JSON files,"
+            " referenced by URL"
+        ),
+    )
+    parser.add_argument(
+        "--json-indent",
+        type=int,
+        default=DEFAULTS["json_indent"],
+        help="spaces to indent embedded JSON",
+    )
+    parser.add_argument(
+        "--json-compact",
+        dest="json_indent",
+        action="store_const",
+        const=None,
+        help="embed JSON without any insignificant whitespace",
+    )
+    parser.add_argument(
+        "--json-unsorted",
+        dest="json_sort_keys",
+        action="store_false",
+        help=(
+            "embed JSON with keys in their original order, instead of sorted;"
+            " externalized documents are always sorted"
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of processes for building many inputs, or 0 for all CPUs",
+    )
+    parser.add_argument(
+        "--profile-json",
+        type=Path,
+        help="path to a JSON file of the time and bytes of each phase of each form",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="serve the output, rebuilding forms and reloading pages as files change",
+    )
+    parser.add_argument(
+        "--host",
+        default=DEFAULT_HOST,
+        help="the host to serve on",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help="the port to serve on",
+    )
     parser.add_argument("--help", action="help", help="show program's usage and exit")
     parser.add_argument("--version", action="version", version=__version__)
     return parser
@@ -51,7 +168,170 @@ def main(argv: list[str] | None = None) -> int:
     """Run the command line interface."""
     parser = get_parser()
     parsed_args = parser.parse_args(argv)
-    config = Config(**vars(parsed_args))
-    urljsf = Urljsf(config)
-    urljsf.log.error("argv: %s", parsed_args)
-    return urljsf.run_cli()
+    kwargs = dict(vars(parsed_args))
+    inputs = find_definitions(kwargs.pop("input_"))
+    jobs: int = kwargs.pop("jobs")
+    serve: bool = kwargs.pop("serve")
+    address = (kwargs.pop("host"), kwargs.pop("port"))
+    profile_json: Path | None = kwargs.pop("profile_json")
+
+    if serve:
+        if profile_json:
+            parser.error("--profile-json can't be used with --serve")
+
+        from .serve import serve_many  # noqa: PLC0415
+
+        return serve_many(inputs, kwargs, address)
+
+    PROFILER.enabled = profile_json is not None
+
+    if len(inputs) == 1:
+        config = Config(input_=str(inputs[0]), **kwargs)
+        urljsf = Urljsf(config)
+        urljsf.log.error("argv: %s", parsed_args)
+        rc = urljsf.run_cli()
+    else:
+        rc = build_many(inputs, kwargs, jobs=jobs)
+
+    if profile_json:
+        PROFILER.write_report(profile_json)
+        log = getLogger(__dist__)
+        for profile in PROFILER.slowest():
+            log.warning("slowest: %s", profile.summary())
+        log.warning("wrote profile to %s", profile_json)
+
+    return rc
+
+
+def find_definitions(inputs: list[str]) -> list[Path]:
+    """Expand paths, folders, and glob patterns into definition files."""
+    found: dict[Path, None] = {}
+
+    for input_ in inputs:
+        if any(char in input_ for char in GLOB_CHARS):
+            paths = [Path(p) for p in sorted(glob(input_, recursive=True))]  # noqa: PTH207
+        else:
+            paths = [Path(input_)]
+
+        for path in paths:
+            if path.is_dir():
+                found.update({
+                    child: None
+                    for child in sorted(path.rglob(f"{DEFINITION_STEM}.*"))
+                    if child.suffix in EXTENSION_FORMAT
+                })
+            else:
+                found[path] = None
+
+    return [*found]
+
+
+def build_many(inputs: list[Path], options: dict[str, Any], jobs: int = 1) -> int:
+    """Build many definitions into one tree, deploying static assets once."""
+    log = getLogger(__dist__)
+    if not inputs:
+        log.error("No definitions found")
+        return 1
+
+    output_dir: Path = options["output_dir"]
+    configs, rc = plan_many(inputs, options)
+    jobs = jobs or os.cpu_count() or 1
+
+    if jobs > 1 and len(configs) > 1:
+        results = build_parallel(configs, jobs)
+    else:
+        results = [_build_one(config) for config in configs]
+
+    for config, (one_rc, errors, profiles) in zip(configs, results):
+        for error in errors:
+            log.error("%s: %s", config.input_, error)
+        rc = max(rc, one_rc)
+        PROFILER.profiles += profiles
+
+    if any(not one_rc for one_rc, _errors, _profiles in results):
+        Urljsf.deploy_static(
+            output_dir / "_static",
+            link=options["link_static"],
+            compress=options["compress"],
+        )
+
+    return rc
+
+
+def plan_many(inputs: list[Path], options: dict[str, Any]) -> tuple[list[Config], int]:
+    """Configure many definitions to be built into one tree, relative to their root."""
+    log = getLogger(__dist__)
+    options = dict(options)
+    output_dir: Path = options.pop("output_dir")
+    root = Path(os.path.commonpath([p.resolve().parent for p in inputs]))
+    seen: dict[Path, Path] = {}
+    rc = 0
+    configs: list[Config] = []
+
+    for input_ in inputs:
+        rel = input_.resolve().parent.relative_to(root)
+        if input_.stem != DEFINITION_STEM:
+            rel /= input_.stem
+        if rel in seen:
+            log.error("%s would overwrite the output of %s", input_, seen[rel])
+            rc = max(rc, 1)
+            continue
+        seen[rel] = input_
+        configs += [
+            Config(
+                input_=str(input_),
+                output_dir=output_dir / rel,
+                url_base="../" * len(rel.parts) or "./",
+                forms_dir=output_dir / "_static" / FORMS_STATIC,
+                **options,
+            )
+        ]
+
+    return configs, rc
+
+
+def build_parallel(configs: list[Config], jobs: int) -> list[BuildResult]:
+    """Build definitions in a pool of processes, returning results in order."""
+    first = configs[0]
+    quiet = [replace(config, log_level="CRITICAL") for config in configs]
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(configs)),
+        initializer=_init_worker,
+        initargs=(first.extra_template_paths, first.cache_dir, PROFILER.enabled),
+    ) as pool:
+        return [*pool.map(_build_one, quiet)]
+
+
+def _init_worker(
+    extra_template_paths: list[Path],
+    cache_dir: Path | None,
+    profile: bool,  # noqa: FBT001
+) -> None:
+    """Prepare templates and validators once per worker process."""
+    PROFILER.enabled = profile
+    urljsf_validator()
+    Urljsf(
+        Config(
+            input_=None,
+            extra_template_paths=extra_template_paths,
+            cache_dir=cache_dir,
+            log_level="CRITICAL",
+        )
+    )
+
+
+def _build_one(config: Config) -> BuildResult:
+    """Build a single definition, capturing any errors, and taking its profiles."""
+    start = len(PROFILER.profiles)
+    try:
+        rc = Urljsf(config).build()
+        source = config.definition
+        errors = [
+            getattr(err, "message", f"{err}")
+            for err in (source.validation_errors if source else [])
+        ]
+    except Exception as err:  # noqa: BLE001
+        rc, errors = 1, [f"{err}"]
+    profiles = PROFILER.profiles[start:]
+    del PROFILER.profiles[start:]
+    return rc, errors, profiles
@@ -29,6 +29,16 @@ class Config:
     output_dir: Path = Path("./_urljsf_output")
     template: str = "urljsf/standalone.j2"
     extra_template_paths: list[Path] = field(default_factory=list)
+    cache_dir: Path | None = None
+    link_static: bool = False
+    compress: bool = False
+    externalize: bool = False
+    bundle: bool = False
+    precompile: bool = False
+    forms_dir: Path | None = None
+    forms_url: str | None = None
+    json_indent: int | None = 2
+    json_sort_keys: bool = True
     # app...
     log_level: str = "DEBUG"
     # more?
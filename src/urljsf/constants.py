@@ -19,6 +19,11 @@ HERE = Path(__file__).parent
 TEMPLATES = HERE / "_templates"
 STATIC = HERE / "_static"
 
+#: the folder in ``_static`` for content-hashed form documents
+FORMS_STATIC = "urljsf-forms"
+#: form members which may be written as content-hashed documents
+EXTERNAL_KEYS = ("schema", "ui_schema")
+
 SCHEMA_VERSION = "v0"
 MIME_PREFIX = f"application/vnd.deathbeds.urljsf.{SCHEMA_VERSION}"
 
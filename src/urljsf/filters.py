@@ -0,0 +1,80 @@
+"""Custom ``jinja2`` filters for ``urljsf``."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Callable
+
+from jinja2.utils import htmlsafe_json_dumps
+from markupsafe import Markup
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+#: separators for JSON without insignificant whitespace
+COMPACT_SEPARATORS = (",", ":")
+
+#: the approximate number of characters in each chunk of streamed JSON
+JSON_CHUNK_SIZE = 2**16
+
+
+def urljsf_json(
+    value: object, indent: int | None = 2, *, sort_keys: bool = True
+) -> Markup:
+    """Serialize JSON which is safe to embed in a ``script`` element.
+
+    With the defaults, this is the same as ``tojson(indent=2)``, while an ``indent``
+    of ``None`` omits all insignificant whitespace.
+    """
+    return htmlsafe_json_dumps(
+        value,
+        dumps=json.dumps,
+        indent=indent,
+        sort_keys=sort_keys,
+        separators=None if indent is not None else COMPACT_SEPARATORS,
+    )
+
+
+def urljsf_json_chunks(
+    value: object, indent: int | None = 2, *, sort_keys: bool = True
+) -> Iterator[Markup]:
+    """Serialize JSON in chunks, which join to the same text as ``urljsf_json``.
+
+    This allows streaming templates to write very large values without building
+    them as one string.
+    """  # noqa: DOC402
+    encoder = json.JSONEncoder(
+        indent=indent,
+        sort_keys=sort_keys,
+        separators=None if indent is not None else COMPACT_SEPARATORS,
+    )
+    buffer: list[str] = []
+    length = 0
+    for chunk in encoder.iterencode(value):
+        buffer += [chunk]
+        length += len(chunk)
+        if length >= JSON_CHUNK_SIZE:
+            yield _htmlsafe("".join(buffer))
+            buffer, length = [], 0
+    if buffer:
+        yield _htmlsafe("".join(buffer))
+
+
+def _htmlsafe(text: str) -> Markup:
+    """Escape HTML-unsafe characters in JSON, as in ``htmlsafe_json_dumps``."""
+    return Markup(  # noqa: S704
+        text
+        .replace("<", "\\u003c")
+        .replace(">", "\\u003e")
+        .replace("&", "\\u0026")
+        .replace("'", "\\u0027")
+    )
+
+
+#: filters added to every ``urljsf`` environment
+FILTERS: dict[str, Callable[..., Any]] = {
+    "urljsf_json": urljsf_json,
+    "urljsf_json_chunks": urljsf_json_chunks,
+}
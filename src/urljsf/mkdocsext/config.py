@@ -5,10 +5,22 @@
 from __future__ import annotations
 
 from mkdocs.config.base import Config
-from mkdocs.config.config_options import Type
+from mkdocs.config.config_options import Optional, Type
+
+from ..profile import SLOWEST
 
 
 class UrljsfMkdocsConfig(Config):  # type: ignore[no-untyped-call]
     """A minimal configuration for ``urljsf`` in ``mkdocs.yml``."""
 
     defaults = Type(dict, default={})
+    cache_dir = Optional(Type(str))
+    externalize = Type(bool, default=False)
+    bundle = Type(bool, default=False)
+    precompile = Type(bool, default=False)
+    compress = Type(bool, default=False)
+    link_static = Type(bool, default=False)
+    json_indent = Type(int, default=2)
+    json_compact = Type(bool, default=False)
+    json_sort_keys = Type(bool, default=True)
+    profile = Type(int, default=SLOWEST)
@@ -4,21 +4,28 @@
 
 from __future__ import annotations
 
+import json
 import os
+from dataclasses import dataclass
+from hashlib import sha256
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
-from mkdocs.plugins import BasePlugin
+from mkdocs.plugins import BasePlugin, get_plugin_logger
 
+from ..cache import PAYLOADS, RESOLUTIONS, file_stamp
 from ..config import Config
+from ..constants import FORMS_STATIC
+from ..precompile import VALIDATORS
+from ..profile import PROFILER
 from ..source import DefSource
 from ..urljsf import Urljsf
-from ..utils import import_dotted_dict
 from .config import UrljsfMkdocsConfig
 
 if TYPE_CHECKING:
     from markdown.core import Markdown
     from mkdocs.config.defaults import MkDocsConfig
+    from mkdocs.livereload import LiveReloadServer
     from mkdocs.structure.files import Files
     from mkdocs.structure.pages import Page
 
@@ -27,16 +34,71 @@ PMDX_SF = "pymdownx.superfences"
 ATTR_LIST = "attr_list"
 ENSURE_CONFIG = [PMDX_SF, ATTR_LIST]
 
+#: tags added once to each page with forms
+PAGE_STATIC = """
+<link rel="modulepreload" href="{url_base}index.js" />
+<script type="module" src="{url_base}index.js"></script>
+"""
+
+log = get_plugin_logger(__name__)
+
+
+@dataclass
+class CachedFence:
+    """A rendered fence, and the files it was rendered from."""
+
+    html: str
+    urljsf: Urljsf
+    stamps: dict[Path, tuple[int, int]]
+
+    def is_fresh(self) -> bool:
+        """Check whether none of the files have changed."""
+        try:
+            return all(file_stamp(p) == s for p, s in self.stamps.items())
+        except OSError:
+            return False
+
 
 class UrljsfMkdocs(BasePlugin[UrljsfMkdocsConfig]):  # type: ignore[no-untyped-call]
-    """An ``mkdocs`` plugin for ``urljsf``."""
+    """An ``mkdocs`` plugin for ``urljsf``.
+
+    As it handles ``on_startup``, one instance is kept for all the rebuilds of
+    ``mkdocs serve``, reusing unchanged fences.
+    """
 
     _current_page: Page | None = None
     _docs_path: Path | None = None
+    _site_path: Path | None = None
+    _cache_dir: Path | None = None
+    _config_key: str = ""
+    _server: LiveReloadServer | None = None
+
+    def __init__(self) -> None:
+        """Initialize the caches kept between builds."""
+        self._fences: dict[tuple[str, str], CachedFence] = {}
+        self._used: set[tuple[str, str]] = set()
+        self._watched: set[Path] = set()
+        self._page_static: dict[str, str] = {}
+        self._hits = self._misses = 0
+
+    def on_startup(
+        self, *, command: Literal["build", "gh-deploy", "serve"], dirty: bool
+    ) -> None:
+        """Keep this instance for all builds of ``mkdocs serve``."""
 
     def on_config(self, config: MkDocsConfig) -> MkDocsConfig:
         """Handle mkdocs configuration."""
         self._docs_path = Path(config.docs_dir)
+        self._site_path = Path(config.site_dir)
+        self._config_key = json.dumps(
+            [dict(self.config), str(self._docs_path), str(self._site_path)],
+            sort_keys=True,
+            default=str,
+        )
+
+        if self.config.cache_dir:
+            root = Path(config.config_file_path or ".").parent
+            self._cache_dir = (root / self.config.cache_dir).resolve()
 
         for ext in ENSURE_CONFIG:
             if ext not in config.markdown_extensions:
@@ -49,16 +111,82 @@ class UrljsfMkdocs(BasePlugin[UrljsfMkdocsConfig]):  # type: ignore[no-untyped-c
         fences.append(fence)
         return config
 
+    def on_pre_build(self, config: MkDocsConfig) -> None:
+        """Forget documents resolved or written in any previous build."""
+        RESOLUTIONS.clear()
+        PAYLOADS.clear()
+        VALIDATORS.clear()
+        PROFILER.clear()
+        PROFILER.enabled = self.config.profile > 0
+        self._used.clear()
+        self._page_static.clear()
+        self._hits = self._misses = 0
+
+    def on_serve(
+        self, server: LiveReloadServer, /, *, config: MkDocsConfig, builder: Any
+    ) -> LiveReloadServer | None:
+        """Watch the files referenced by forms, which may be outside of the docs."""
+        self._server = server
+        self._watch()
+        return server
+
     def on_page_markdown(
         self, markdown: str, /, *, page: Page, config: MkDocsConfig, files: Files
     ) -> str | None:
         """Capture the current markdown page."""
         self._current_page = page
+        self._page_static.pop(page.file.src_uri, None)
         return markdown
 
+    def on_page_content(
+        self, html: str, /, *, page: Page, config: MkDocsConfig, files: Files
+    ) -> str | None:
+        """Add the JS once to a page with any forms."""
+        url_base = self._page_static.get(page.file.src_uri)
+        if url_base is None:
+            return html
+        return PAGE_STATIC.format(url_base=url_base) + html
+
     def on_post_build(self, config: MkDocsConfig) -> None:
-        """Deploy static files."""
-        Urljsf.deploy_static(Path(config["site_dir"]) / "_static")
+        """Deploy changed static files, and forget fences not seen in this build.
+
+        Static files are only hard linked, where possible, if ``link_static``, as
+        editing them in the site would change the installed package.
+        """
+        if self._page_static:
+            Urljsf.deploy_static(
+                Path(config["site_dir"]) / "_static",
+                link=self.config.link_static,
+                compress=self.config.compress,
+            )
+        for key in [*self._fences]:
+            if key not in self._used:
+                self._fences.pop(key)
+        log.debug("reused %s fences, rendered %s", self._hits, self._misses)
+        for profile in PROFILER.slowest(self.config.profile):
+            log.info("slowest: %s", profile.summary())
+        self._watch()
+
+    def cache_info(self) -> dict[str, int]:
+        """Get statistics about the fences of the current build."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "fences": len(self._fences),
+            "watched": len(self._watched),
+        }
+
+    def _watch(self) -> None:
+        """Watch any new files referenced by forms outside of the docs."""
+        if self._server is None or self._docs_path is None:
+            return
+        docs = self._docs_path.resolve()
+        for fence in self._fences.values():
+            for path in fence.stamps:
+                if path in self._watched or docs in path.parents:
+                    continue
+                self._watched.add(path)
+                self._server.watch(str(path), recursive=False)
 
     def _fence(
         self,
@@ -72,38 +200,75 @@ class UrljsfMkdocs(BasePlugin[UrljsfMkdocsConfig]):  # type: ignore[no-untyped-c
         attrs: dict[str, Any] | None = None,
         **kwargs: Any,
     ) -> str:
-        config = self._attrs_to_config(source, attrs or {})
-        urljsf = Urljsf(config)
-        urljsf.load_definition()
-        return f"""
-            <script type="module" src="{config.url_base}index.js"></script>
-            {urljsf.render()}
-        """
+        page = self._current_page
+        src_uri = page.file.src_uri if page else ""
+        source_hash = sha256(
+            json.dumps([source, attrs, self._config_key], sort_keys=True).encode()
+        ).hexdigest()
+        key = (src_uri, source_hash)
+        self._used.add(key)
+
+        cached = self._fences.get(key)
+        if cached and cached.is_fresh():
+            self._hits += 1
+            self._page_static[src_uri] = cached.urljsf.config.url_base
+            if cached.urljsf.config.externalize:
+                # restore any documents removed by cleaning the site
+                cached.urljsf.externalize()
+            if cached.urljsf.config.precompile:
+                cached.urljsf.precompile()
+            return cached.html
+
+        self._misses += 1
+        name = f"{src_uri} {(attrs or {}).get('path', '')}".strip()
+        with PROFILER.form(name):
+            config = self._attrs_to_config(source, attrs or {})
+            urljsf = Urljsf(config)
+            urljsf.load_definition()
+            html = urljsf.render()
+        self._page_static[src_uri] = config.url_base
+        dependencies = config.definition.dependencies if config.definition else set()
+        self._fences[key] = CachedFence(
+            html=html,
+            urljsf=urljsf,
+            stamps={path: file_stamp(path) for path in sorted(dependencies)},
+        )
+        return html
 
     def _attrs_to_config(self, source: str, attrs: dict[str, Any]) -> Config:
         """Convert ``sphinx-options`` to ``urljsf_options``."""
         current_page = self._current_page
         attr = attrs.get
         abs_src_path = current_page.file.abs_src_path if current_page else None
+        site_path = self._site_path
 
-        if abs_src_path is None or self._docs_path is None:  # pragma: no cover
+        if (
+            current_page is None
+            or abs_src_path is None
+            or self._docs_path is None
+            or site_path is None
+        ):  # pragma: no cover
             msg = "don't know how to handle documents without source"
             raise NotImplementedError(msg)
 
         here = Path(abs_src_path).parent.resolve()
         rel = os.path.relpath(self._docs_path, here)
+        page_dir = (site_path / current_page.file.dest_path).parent
+        site_rel = Path(os.path.relpath(site_path, page_dir)).as_posix()
         path = attr("path")
         fmt = attr("format")
         definition: DefSource | None = None
         input_: str | None = None
         app_defaults: dict[str, Any] = self.config.defaults
-        def_kwargs: Any = {"defaults": app_defaults, "resource_path": here}
+        def_kwargs: Any = {
+            "defaults": app_defaults,
+            "resource_path": here,
+            "cache_dir": self._cache_dir,
+            "bundle": self.config.bundle,
+        }
 
         if path and path.startswith("py:"):
-            definition = DefSource(
-                raw=import_dotted_dict(path[3:]),
-                **def_kwargs,
-            )
+            definition = DefSource.from_dotted(path[3:], **def_kwargs)
         elif path:
             input_ = str(here / path)
         elif source and fmt:
@@ -113,6 +278,14 @@ class UrljsfMkdocs(BasePlugin[UrljsfMkdocsConfig]):  # type: ignore[no-untyped-c
             input_=input_,
             definition=definition,
             defaults=app_defaults,
+            cache_dir=self._cache_dir,
+            externalize=self.config.externalize,
+            bundle=self.config.bundle,
+            precompile=self.config.precompile,
+            forms_dir=site_path / "_static" / FORMS_STATIC,
+            forms_url=f"{site_rel}/_static/{FORMS_STATIC}/",
+            json_indent=None if self.config.json_compact else self.config.json_indent,
+            json_sort_keys=self.config.json_sort_keys,
             # meta
             template="urljsf/mkdocs.j2",
             url_base=f"{rel}/_static/urljsf/",
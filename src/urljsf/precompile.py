@@ -0,0 +1,110 @@
+"""Ahead-of-time compilation of form schema into standalone validation modules."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess  # noqa: S404
+from dataclasses import dataclass, field
+from hashlib import sha256
+from logging import getLogger
+from pathlib import Path
+from typing import Any
+
+from .cache import HASH_LENGTH, payload_text
+from .constants import UTF8, __dist__
+
+#: a ``node`` script which writes standalone ``ajv`` validators for ``rjsf``
+PRECOMPILE_SCRIPT = Path(__file__).parent / "_node/precompile.mjs"
+
+#: an environment variable for the ``node`` executable used to precompile
+NODE_ENV_VAR = "URLJSF_NODE"
+
+#: the most seconds to wait for ``node`` to compile a batch of schema
+TIMEOUT = 120
+
+
+@dataclass
+class Validators:
+    """Standalone validation modules written once per schema, by content hash.
+
+    All the schema of one definition not yet on disk are compiled by a single
+    ``node`` process. If ``node`` or ``@rjsf/validator-ajv8`` can't be found, this
+    is only reported once, and forms fall back to compiling in the browser.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    names: dict[int, tuple[object, str]] = field(default_factory=dict)
+    error: str | None = None
+
+    def write(self, folder: Path, schemas: dict[str, Any]) -> dict[str, str]:
+        """Write modules for schema by key, returning the file names of those found."""
+        names = {key: self.name(schema) for key, schema in schemas.items()}
+        pending: dict[str, Any] = {}
+        for key, name in names.items():
+            if (folder / name).exists():
+                self.hits += 1
+            else:
+                self.misses += 1
+                pending[name] = schemas[key]
+
+        if pending and self.error is None:
+            self.compile(folder, pending)
+
+        return {key: name for key, name in names.items() if (folder / name).exists()}
+
+    def name(self, schema: object) -> str:
+        """Get the content-hashed file name of a schema's module."""
+        cached = self.names.get(id(schema))
+        if cached and cached[0] is schema:
+            return cached[1]
+        text = payload_text(schema)
+        name = f"{sha256(text.encode('utf-8')).hexdigest()[:HASH_LENGTH]}.js"
+        self.names[id(schema)] = (schema, name)
+        return name
+
+    def compile(self, folder: Path, schemas: dict[str, Any]) -> None:
+        """Run ``node`` once to write modules for schema, by file name."""
+        log = getLogger(__dist__)
+        node = shutil.which(os.environ.get(NODE_ENV_VAR, "node"))
+        if node is None:
+            self.error = (
+                f"no node found to precompile validators, see ``{NODE_ENV_VAR}``"
+            )
+            log.warning(self.error)
+            return
+
+        folder.mkdir(parents=True, exist_ok=True)
+        request = json.dumps({"folder": str(folder.resolve()), "schemas": schemas})
+        try:
+            subprocess.run(  # noqa: S603
+                [node, str(PRECOMPILE_SCRIPT)],
+                input=request,
+                capture_output=True,
+                check=True,
+                timeout=TIMEOUT,
+                encoding=UTF8["encoding"],
+            )
+        except subprocess.CalledProcessError as err:
+            self.error = f"failed to precompile validators: {err.stderr.strip()}"
+            log.warning(self.error)
+        except subprocess.TimeoutExpired:  # pragma: no cover
+            log.warning("timed out precompiling %s validators", len(schemas))
+
+    def info(self) -> dict[str, int]:
+        """Get statistics about the written modules."""
+        return {"hits": self.hits, "misses": self.misses, "names": len(self.names)}
+
+    def clear(self) -> None:
+        """Forget all written modules, statistics, and errors."""
+        self.names.clear()
+        self.hits = self.misses = 0
+        self.error = None
+
+
+#: validation modules written during the current build
+VALIDATORS = Validators()
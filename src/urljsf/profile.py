@@ -0,0 +1,170 @@
+"""Wall-clock time and byte counts for the phases of building ``urljsf`` forms."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+import json
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .constants import UTF8, __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+    from pathlib import Path
+
+#: the name of the profile of deploying static assets
+STATIC_PROFILE = "_static"
+
+#: the default number of slowest forms to summarize
+SLOWEST = 5
+
+#: the number of phases to show for each summarized form
+SUMMARY_PHASES = 3
+
+#: the profile of the form being built in the current thread or task
+_CURRENT: ContextVar[Profile | None] = ContextVar("urljsf_profile", default=None)
+
+
+@dataclass
+class Phase:
+    """The time, bytes, and calls of one phase of building a form."""
+
+    seconds: float = 0.0
+    nbytes: int = 0
+    calls: int = 0
+
+    def to_json(self) -> dict[str, Any]:
+        """Get the phase as JSON-compatible data."""
+        return {"seconds": self.seconds, "bytes": self.nbytes, "calls": self.calls}
+
+
+@dataclass
+class Profile:
+    """The phases of building one form.
+
+    The ``seconds`` of each phase exclude any phases nested inside it, while the
+    ``seconds`` of the profile are the wall-clock time of the whole build.
+    """
+
+    name: str
+    seconds: float = 0.0
+    phases: dict[str, Phase] = field(default_factory=dict)
+    #: the time spent in nested phases, for each open phase
+    nested: list[float] = field(default_factory=list, repr=False)
+
+    def to_json(self) -> dict[str, Any]:
+        """Get the profile as JSON-compatible data."""
+        return {
+            "name": self.name,
+            "seconds": self.seconds,
+            "phases": {name: phase.to_json() for name, phase in self.phases.items()},
+        }
+
+    def summary(self) -> str:
+        """Describe the profile, and its slowest phases, in one line."""
+        phases = sorted(self.phases.items(), key=lambda item: -item[1].seconds)
+        slowest = ", ".join(
+            f"{name} {1000 * phase.seconds:.1f}ms"
+            for name, phase in phases[:SUMMARY_PHASES]
+        )
+        return f"{1000 * self.seconds:.1f}ms {self.name} ({slowest or 'no phases'})"
+
+
+@dataclass
+class Profiler:
+    """Profiles of the forms built in this process, if enabled."""
+
+    enabled: bool = False
+    profiles: list[Profile] = field(default_factory=list)
+
+    @contextmanager
+    def form(self, name: str) -> Generator[Profile | None, None, None]:
+        """Record the phases of building a form, unless already recording one."""  # noqa: DOC402
+        current = _CURRENT.get()
+        if not self.enabled or current is not None:
+            yield current
+            return
+
+        profile = Profile(name)
+        token = _CURRENT.set(profile)
+        started = time.perf_counter()
+        try:
+            yield profile
+        finally:
+            profile.seconds = time.perf_counter() - started
+            _CURRENT.reset(token)
+            self.profiles += [profile]
+
+    @staticmethod
+    @contextmanager
+    def phase(name: str) -> Generator[Phase | None, None, None]:
+        """Record the time of a phase of the current form, which may count bytes."""  # noqa: DOC402
+        profile = _CURRENT.get()
+        if profile is None:
+            yield None
+            return
+
+        phase = profile.phases.setdefault(name, Phase())
+        profile.nested += [0.0]
+        started = time.perf_counter()
+        try:
+            yield phase
+        finally:
+            elapsed = time.perf_counter() - started
+            phase.seconds += elapsed - profile.nested.pop()
+            phase.calls += 1
+            if profile.nested:
+                profile.nested[-1] += elapsed
+
+    def slowest(self, count: int = SLOWEST) -> list[Profile]:
+        """Get the slowest profiles."""
+        return slowest(self.profiles, count)
+
+    def report(self) -> dict[str, Any]:
+        """Get all profiles, and the total of each phase, as JSON-compatible data."""
+        return report(self.profiles)
+
+    def write_report(self, path: Path) -> None:
+        """Write all profiles as JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2, sort_keys=True), **UTF8)
+
+    def clear(self) -> None:
+        """Forget all profiles."""
+        self.profiles.clear()
+
+
+def slowest(profiles: Iterable[Profile], count: int = SLOWEST) -> list[Profile]:
+    """Get the slowest of some profiles of forms."""
+    forms = [profile for profile in profiles if profile.name != STATIC_PROFILE]
+    return sorted(forms, key=lambda profile: -profile.seconds)[:count]
+
+
+def report(profiles: Iterable[Profile]) -> dict[str, Any]:
+    """Get profiles, and the total of each phase, as JSON-compatible data."""
+    all_profiles = [*profiles]
+    totals: dict[str, Phase] = {}
+    for profile in all_profiles:
+        for name, phase in profile.phases.items():
+            total = totals.setdefault(name, Phase())
+            total.seconds += phase.seconds
+            total.nbytes += phase.nbytes
+            total.calls += phase.calls
+    return {
+        "version": __version__,
+        "seconds": sum(profile.seconds for profile in all_profiles),
+        "phases": {name: phase.to_json() for name, phase in sorted(totals.items())},
+        "profiles": [
+            profile.to_json()
+            for profile in sorted(all_profiles, key=lambda profile: -profile.seconds)
+        ],
+    }
+
+
+#: profiles of forms built in this process
+PROFILER = Profiler()
@@ -5,12 +5,18 @@
 from __future__ import annotations
 
 import json
+import os
+from functools import cache, partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
 
 from jsonschema import Draft7Validator, validators
 
 from .constants import SCHEMA_VERSION, UTF8
 
+if TYPE_CHECKING:
+    from jsonschema.protocols import Validator
+
 HERE = Path(__file__).parent
 STATIC = HERE / "_static"
 SCHEMA = STATIC / "urljsf/schema"
@@ -20,20 +26,72 @@ FORM_SCHEMA = CURRENT_SCHEMA / "form.schema.json"
 PROPS_SCHEMA = CURRENT_SCHEMA / "props.schema.json"
 UI_SCHEMA = CURRENT_SCHEMA / "ui.schema.json"
 
-_StrictDraft7Validator = validators.create(
-    dict(Draft7Validator.META_SCHEMA, additionalProperties=False),
-    Draft7Validator.VALIDATORS,
-    "StrictDraft7",
-)
+#: an environment variable which, if ``0``, skips checking the ``urljsf`` schema
+CHECK_SCHEMA_ENV_VAR = "URLJSF_CHECK_SCHEMA"
+
+#: an environment variable which, if ``0``, skips the generated ``urljsf`` validator
+FAST_VALIDATE_ENV_VAR = "URLJSF_FAST_VALIDATE"
+
+#: validators built on first use
+LAZY_VALIDATORS = {
+    "URLJSF_VALIDATOR": FORM_SCHEMA,
+    "PROPS_VALIDATOR": PROPS_SCHEMA,
+    "UI_VALIDATOR": UI_SCHEMA,
+}
+
 
+@cache
+def _strict_draft7_validator() -> type[Validator]:
+    """Build a validator that rejects unknown schema keywords."""
+    return validators.create(
+        dict(Draft7Validator.META_SCHEMA, additionalProperties=False),
+        Draft7Validator.VALIDATORS,
+        "StrictDraft7",
+    )
 
+
+@cache
 def _make_strict_validator(path: Path) -> Draft7Validator:
     """Validate the schema."""
     raw = json.loads(path.read_text(**UTF8))
-    _StrictDraft7Validator.check_schema(raw)
+    if os.environ.get(CHECK_SCHEMA_ENV_VAR, "1") != "0":
+        _strict_draft7_validator().check_schema(raw)
     return Draft7Validator(raw, format_checker=Draft7Validator.FORMAT_CHECKER)
 
 
-URLJSF_VALIDATOR = _make_strict_validator(FORM_SCHEMA)
-PROPS_VALIDATOR = _make_strict_validator(PROPS_SCHEMA)
-UI_VALIDATOR = _make_strict_validator(UI_SCHEMA)
+def urljsf_validator() -> Draft7Validator:
+    """Get the validator for ``urljsf`` definitions."""
+    return _make_strict_validator(FORM_SCHEMA)
+
+
+@cache
+def urljsf_fast_validator() -> Callable[[Any], bool] | None:
+    """Get a generated validator which only checks if a definition is valid."""
+    if os.environ.get(FAST_VALIDATE_ENV_VAR, "1") == "0":
+        return None
+
+    from . import _validator
+
+    checker = Draft7Validator.FORMAT_CHECKER
+    custom_formats = {
+        fmt: partial(checker.conforms, format=fmt) for fmt in _validator.FORMATS
+    }
+
+    def is_valid(instance: object) -> bool:
+        """Check whether an instance is valid, without details."""
+        try:
+            _validator.validate(instance, custom_formats)  # type: ignore[no-untyped-call]
+        except (TypeError, ValueError):
+            return False
+        return True
+
+    return is_valid
+
+
+def __getattr__(name: str) -> Draft7Validator:
+    """Build a validator the first time it is used."""
+    path = LAZY_VALIDATORS.get(name)
+    if path is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return _make_strict_validator(path)
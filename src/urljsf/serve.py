@@ -0,0 +1,267 @@
+"""A development server which rebuilds forms as their files change."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from logging import Logger, getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .cache import RESOLUTIONS, file_stamp
+from .cli import plan_many
+from .constants import __dist__
+from .urljsf import Urljsf
+
+if TYPE_CHECKING:
+    from .config import Config
+
+#: the path of the server-sent events which tell pages to reload
+RELOAD_PATH = "/_urljsf/reload"
+
+#: a script added to served HTML pages to reload them after a rebuild
+RELOAD_SCRIPT = (
+    f'<script>new EventSource("{RELOAD_PATH}").onmessage = () => location.reload();'
+    "</script>"
+)
+
+#: seconds between sending comments to keep event streams open
+KEEPALIVE = 15
+
+#: a stamp for files which can't be found
+MISSING = (-1, -1)
+
+
+@dataclass
+class Watched:
+    """A warm ``Urljsf`` and the files its last build read."""
+
+    urljsf: Urljsf
+    stamps: dict[Path, tuple[int, int]] = field(default_factory=dict)
+
+    def changed(self) -> list[Path]:
+        """Get the files which changed since the last build."""
+        return [path for path, stamp in self.stamps.items() if _stamp(path) != stamp]
+
+
+@dataclass
+class DevServer:
+    """Rebuild forms when any file they read changes, and tell pages to reload.
+
+    Each definition keeps its ``Urljsf`` between builds, so only changed
+    definitions are parsed again, and unchanged referenced files, validators,
+    and templates are all reused.
+    """
+
+    configs: list[Config]
+    output_dir: Path
+    link_static: bool = False
+    compress: bool = False
+    interval: float = 0.5
+    version: int = 0
+    watched: list[Watched] = field(default_factory=list)
+    changes: threading.Condition = field(default_factory=threading.Condition)
+    stopped: threading.Event = field(default_factory=threading.Event)
+    log: Logger = field(default_factory=partial(getLogger, __dist__))
+
+    def build_all(self) -> int:
+        """Build every definition, and deploy static assets."""
+        self.watched = [Watched(Urljsf(config)) for config in self.configs]
+        rc = max([self.build(watched) for watched in self.watched], default=0)
+        self.deploy()
+        return rc
+
+    def deploy(self) -> None:
+        """Deploy changed static assets, and compress any changed form documents."""
+        Urljsf.deploy_static(
+            self.output_dir / "_static", link=self.link_static, compress=self.compress
+        )
+
+    def build(self, watched: Watched) -> int:
+        """(Re)build one definition, recording the files it read.
+
+        A failed build may not find all the files it would read, so the files
+        of the previous build are also kept.
+        """
+        urljsf = watched.urljsf
+        cfg = urljsf.config
+        cfg.definition = None
+        started = time.perf_counter()
+        try:
+            rc = urljsf.build()
+        except Exception as err:  # noqa: BLE001
+            self.log.warning("failed to build %s: %s", cfg.input_, err)
+            rc = 1
+
+        paths = {Path(f"{cfg.input_}").resolve()}
+        if cfg.definition:
+            paths |= cfg.definition.dependencies
+        for template_path in cfg.extra_template_paths:
+            paths |= {p.resolve() for p in template_path.rglob("*") if p.is_file()}
+        if rc:
+            paths |= {*watched.stamps}
+        watched.stamps = {path: _stamp(path) for path in sorted(paths)}
+
+        elapsed = 1000 * (time.perf_counter() - started)
+        self.log.info("built %s in %.1fms: %s", cfg.input_, elapsed, rc)
+        return rc
+
+    def check(self) -> list[Watched]:
+        """Rebuild any definitions with changed files, and notify any pages."""
+        rebuilt: list[Watched] = []
+        pending = [(watched, watched.changed()) for watched in self.watched]
+        pending = [(watched, changed) for watched, changed in pending if changed]
+        RESOLUTIONS.forget(path for _watched, changed in pending for path in changed)
+        for watched, changed in pending:
+            self.log.info("changed: %s", ", ".join(map(str, changed)))
+            self.build(watched)
+            rebuilt += [watched]
+        if rebuilt:
+            if self.compress:
+                self.deploy()
+            self.notify()
+        return rebuilt
+
+    def notify(self) -> None:
+        """Tell all waiting pages to reload."""
+        with self.changes:
+            self.version += 1
+            self.changes.notify_all()
+
+    def wait(self, version: int, timeout: float = KEEPALIVE) -> int:
+        """Wait for a build newer than a version, or a timeout, or stopping."""
+        with self.changes:
+            self.changes.wait_for(
+                lambda: self.version != version or self.stopped.is_set(), timeout
+            )
+            return self.version
+
+    def watch(self) -> None:
+        """Check for changes until stopped."""
+        while not self.stopped.wait(self.interval):
+            self.check()
+
+    def stop(self) -> None:
+        """Stop watching, and release any waiting pages."""
+        self.stopped.set()
+        with self.changes:
+            self.changes.notify_all()
+
+
+class DevHTTPServer(ThreadingHTTPServer):
+    """An HTTP server for a ``DevServer``."""
+
+    daemon_threads = True
+    dev: DevServer
+
+
+class DevHandler(SimpleHTTPRequestHandler):
+    """Serve the output, adding a reload script to HTML pages."""
+
+    server: DevHTTPServer
+
+    def do_GET(self) -> None:
+        """Handle a request."""
+        if self.path == RELOAD_PATH:
+            self.send_events()
+            return
+
+        path = Path(self.translate_path(self.path))
+        if path.is_dir() and self.path.endswith("/"):
+            path /= "index.html"
+        if path.suffix != ".html" or not path.is_file():
+            super().do_GET()
+            return
+
+        html = path.read_bytes()
+        body = html.replace(b"</body>", f"{RELOAD_SCRIPT}</body>".encode(), 1)
+        if body == html:
+            body += RELOAD_SCRIPT.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", f"{len(body)}")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_events(self) -> None:
+        """Stream an event after each rebuild, until stopped or disconnected."""
+        dev = self.server.dev
+        version = dev.version
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        while not dev.stopped.is_set():
+            new_version = dev.wait(version)
+            message = (
+                ": keepalive" if new_version == version else f"data: {new_version}"
+            )
+            version = new_version
+            try:
+                self.wfile.write(f"{message}\n\n".encode())
+                self.wfile.flush()
+            except OSError:
+                return
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Log requests at the debug level."""
+        self.server.dev.log.debug(format, *args)
+
+
+def make_server(dev: DevServer, address: tuple[str, int]) -> DevHTTPServer:
+    """Make an HTTP server for the output of a ``DevServer``."""
+    handler = partial(DevHandler, directory=str(dev.output_dir))
+    httpd = DevHTTPServer(address, handler)
+    httpd.dev = dev
+    return httpd
+
+
+def serve_many(
+    inputs: list[Path], options: dict[str, Any], address: tuple[str, int]
+) -> int:
+    """Build definitions, then serve and rebuild them until interrupted."""
+    log = getLogger(__dist__)
+    if not inputs:
+        log.error("No definitions found")
+        return 1
+
+    handler = logging.StreamHandler()
+    handler.setLevel(logging.INFO)
+    logging.basicConfig(format="%(asctime)s %(message)s", handlers=[handler])
+
+    configs, rc = plan_many(inputs, options)
+    dev = DevServer(
+        configs=configs,
+        output_dir=options["output_dir"],
+        link_static=options["link_static"],
+        compress=options["compress"],
+    )
+    rc = max(rc, dev.build_all())
+    httpd = make_server(dev, address)
+    watcher = threading.Thread(target=dev.watch, daemon=True)
+    watcher.start()
+    host, port = httpd.server_address[:2]
+    log.info("serving %s on http://%s:%s", dev.output_dir, host, port)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:  # pragma: no cover
+        pass
+    finally:
+        dev.stop()
+        httpd.server_close()
+    return rc
+
+
+def _stamp(path: Path) -> tuple[int, int]:
+    """Get the stamp of a file, even if it has been removed."""
+    try:
+        return file_stamp(path)
+    except OSError:
+        return MISSING
@@ -9,19 +9,17 @@ import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Callable
 
-from jsonschema import Draft7Validator
-from jsonschema.exceptions import SchemaError
-from jsonschema.validators import validator_for
-
 from ._schema import Urljsf as UrljsfSchema
+from .cache import RESOLUTIONS, SCHEMA_CHECKS, load_source, save_source, source_key
 from .constants import EXTENSION_FORMAT, UTF8
-from .schema import URLJSF_VALIDATOR
-from .utils import import_dotted_dict, merge_deep
+from .profile import PROFILER
+from .schema import urljsf_fast_validator, urljsf_validator
+from .utils import dotted_module_file, import_dotted_dict, merge_deep
 
 if TYPE_CHECKING:
     from pathlib import Path
 
-    from jsonschema.protocols import Validator
+    from jsonschema import Draft7Validator
 
 
 @dataclass
@@ -49,7 +47,11 @@ class DataSource:
         """Get the source of a path."""
         if TYPE_CHECKING:
             assert self.path
-        return self.path.read_text(**UTF8)
+        with PROFILER.phase("read") as phase:
+            text = self.path.read_text(**UTF8)
+            if phase:
+                phase.nbytes += len(text.encode("utf-8"))
+        return text
 
     def guess_format(self) -> str:
         """Guess the format from a suffix."""
@@ -67,6 +69,14 @@ class DataSource:
         fmt = self.format = self.format or self.guess_format()
         text = self.text = self.text or self.read_text()
 
+        with PROFILER.phase("parse") as phase:
+            if phase:
+                phase.nbytes += len(text.encode("utf-8"))
+            self.parse_text(fmt, text)
+        self.log.debug("parsed %s: %s", self.format, self.path)
+
+    def parse_text(self, fmt: str, text: str) -> None:
+        """Parse text in a format."""
         if fmt == "toml":
             try:
                 import tomllib
@@ -84,7 +94,6 @@ class DataSource:
         else:  # pragma: no cover
             msg = f"Can't parse {self.format}: {self.path}"
             raise NotImplementedError(msg)
-        self.log.debug("parsed %s: %s", self.format, self.path)
 
 
 @dataclass
@@ -92,13 +101,25 @@ class ValidatedSource(DataSource):
     """A validated source."""
 
     validator: Draft7Validator | None = None
+    fast_validator: Callable[[Any], bool] | None = None
     validation_errors: list[Any] = field(default_factory=list)
     as_type: Callable[..., Any] = field(default_factory=lambda: lambda: dict)
     data: Any | None = None
     defaults: dict[str, Any] | None = None
+    cache_dir: Path | None = None
 
     def parse(self) -> None:
         """Validate, and attempt to parse the data."""
+        cache_key = self.cache_key()
+        if cache_key and self.cache_dir:
+            with PROFILER.phase("cache"):
+                cached = load_source(self.cache_dir, cache_key)
+            if cached is not None:
+                self.log.debug("cached %s: %s", self.format, self.path)
+                self.raw = cached
+                self.data = self.as_type(**self.raw)
+                return
+
         super().parse()
         if not self.validator:  # pragma: no cover
             msg = f"No validator for {self.__class__.__name__}"
@@ -107,13 +128,31 @@ class ValidatedSource(DataSource):
             msg = f"No data for {self.__class__.__name__}"
             raise NotImplementedError(msg)
 
-        self.raw = merge_deep(self.defaults, self.raw)
-        self.validate()
+        with PROFILER.phase("merge"):
+            self.raw = merge_deep(self.defaults, self.raw)
+        with PROFILER.phase("validate"):
+            self.validate()
+
+        if cache_key and self.cache_dir and not self.validation_errors:
+            save_source(self.cache_dir, cache_key, self.raw)
 
         self.data = self.as_type(**self.raw)
 
+    def cache_key(self) -> str | None:
+        """Get a content hash for a source read from text, if caching is enabled."""
+        if self.cache_dir is None or self.raw:
+            return None
+        self.format = self.format or self.guess_format()
+        self.text = self.text or self.read_text()
+        return source_key(
+            self.__class__.__name__, self.format, self.text, self.defaults
+        )
+
     def validate(self) -> None:
-        """Capture validation errors."""
+        """Capture validation errors, only seeking details if not valid."""
+        if self.fast_validator and self.fast_validator(self.raw):
+            self.validation_errors = []
+            return
         self.validation_errors = (
             [*self.validator.iter_errors(self.raw)] if self.validator else []
         )
@@ -125,57 +164,117 @@ class DefSource(ValidatedSource):
 
     data: UrljsfSchema | None = None
     as_type: Callable[..., UrljsfSchema] = field(default_factory=lambda: UrljsfSchema)
-    validator: Draft7Validator = field(default_factory=lambda: URLJSF_VALIDATOR)
+    validator: Draft7Validator = field(default_factory=urljsf_validator)
+    fast_validator: Callable[[Any], bool] | None = field(
+        default_factory=urljsf_fast_validator
+    )
     resource_path: Path | None = None
+    #: local files read while parsing, including modules of ``py:`` references
+    dependencies: set[Path] = field(default_factory=set)
+    #: whether to bundle each form ``schema`` into one self-contained document
+    bundle: bool = False
+    #: whether form fields may reference ``./`` files and ``py:`` imports
+    resolve_refs: bool = True
+
+    @classmethod
+    def from_dotted(cls, dotted: str, **kwargs: Any) -> DefSource:  # noqa: ANN401
+        """Create a definition from a dotted python import, tracking its module."""
+        with PROFILER.phase("import"):
+            raw = import_dotted_dict(dotted)
+        source = cls(raw=raw, **kwargs)
+        module_file = dotted_module_file(dotted)
+        if module_file:
+            source.dependencies.add(module_file)
+        return source
 
     def parse(self) -> None:
         """Extend parsing with path resolution."""
+        if self.path:
+            self.dependencies.add(self.path.resolve())
+
         super().parse()
 
         if self.raw is None:  # pragma: no cover
             msg = f"unexpected empty raw data {self}"
             raise NotImplementedError(msg)
 
-        for form_name, form in self.raw.get("forms", {}).items():
-            if form is None:
+        forms = self.raw.get("forms")
+        if not isinstance(forms, dict):  # pragma: no cover
+            return
+
+        # forms may be shared with defaults, so copy before resolving in place
+        forms = self.raw["forms"] = dict(forms)
+        for form_name, form in forms.items():
+            if not isinstance(form, dict):
                 continue
-            self.parse_form(form_name, form)
+            forms[form_name] = dict(form)
+            self.parse_form(form_name, forms[form_name])
+
+        self.data = self.as_type(**self.raw)
 
     def parse_form(self, form_name: str, form: dict[str, Any]) -> None:
         """Parse common fields of a single form."""
         schema: dict[str, Any] | None = None
+        schema_base = self.rel_path()
 
         for key in ["schema", "ui_schema", "props", "form_data"]:
             value = form.get(key)
             if value is None:
                 continue
             if isinstance(value, str):
+                if not self.resolve_refs:
+                    msg = f"{form_name}.{key}: references are not allowed: {value}"
+                    self.validation_errors += [msg]
+                    return
                 form[key] = self.resolve_url(value)
+                if key == "schema" and value.startswith(".") and schema_base:
+                    schema_base = (schema_base / value).resolve().parent
             if key == "schema":
                 schema = form[key]
 
         if not schema:  # pragma: no cover
             return
 
-        validator_cls: type[Validator] = validator_for(schema, default=Draft7Validator)
+        if self.bundle:
+            with PROFILER.phase("bundle"):
+                schema, files = RESOLUTIONS.bundle(schema, schema_base, self.load_raw)
+            form["schema"] = schema
+            self.dependencies.update(files)
 
-        try:
-            validator_cls.check_schema(schema)
-        except SchemaError as err:  # pragma: no cover
-            self.log.exception("Error in %s schema", form_name)
+        with PROFILER.phase("check"):
+            err = SCHEMA_CHECKS.check(schema)
+        if err:  # pragma: no cover
+            self.log.error("Error in %s schema: %s", form_name, err)
             self.validation_errors += [err]
 
+    def rel_path(self) -> Path | None:
+        """Get the folder from which to resolve relative URLs."""
+        return self.resource_path or (self.path.parent if self.path else None)
+
+    def load_raw(self, path: Path) -> dict[str, Any]:
+        """Load the raw data from a referenced file."""
+        source = DataSource(path, log=self.log)
+        if source.raw is None:  # pragma: no cover
+            msg = f"unexpected empty raw data {path}"
+            raise NotImplementedError(msg)
+        return source.raw
+
     def resolve_url(self, url: str) -> dict[str, Any]:
         """Maybe resolve a URL."""
         if url.startswith("py:"):
-            return import_dotted_dict(url[3:])
+            with PROFILER.phase("import"):
+                raw = RESOLUTIONS.import_dotted(url[3:])
+            module_file = dotted_module_file(url[3:])
+            if module_file:
+                self.dependencies.add(module_file)
+            return raw
         if url.startswith("."):
-            rel_path = self.resource_path or (self.path.parent if self.path else None)
+            rel_path = self.rel_path()
             if rel_path is None:  # pragma: no cover
                 msg = f"no rel path for {self}"
                 raise NotImplementedError(msg)
-            source = DataSource(rel_path / url)
-            if source.raw is not None:
-                return source.raw
+            path = (rel_path / url).resolve()
+            self.dependencies.add(path)
+            return RESOLUTIONS.load_file(path, self.load_raw)
         msg = f"unexpected url {url}"  # pragma: no cover
         raise NotImplementedError(msg)  # pragma: no cover
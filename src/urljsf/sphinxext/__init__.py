@@ -7,8 +7,15 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from ..constants import __version__
+from ..profile import SLOWEST
 from .directives.urljsf import UrljsfDirective
-from .extension import build_finished, html_page_context
+from .extension import (
+    build_finished,
+    builder_inited,
+    env_merge_info,
+    env_purge_doc,
+    html_page_context,
+)
 
 if TYPE_CHECKING:
     from sphinx.application import Sphinx
@@ -19,6 +26,19 @@ def setup(app: Sphinx) -> ExtensionMetadata:
     """Set up the sphinx extension."""
     app.add_directive("urljsf", UrljsfDirective)
     app.add_config_value("urljsf", {}, "env")
+    app.add_config_value("urljsf_cache", default=False, rebuild="env")
+    app.add_config_value("urljsf_externalize", default=False, rebuild="env")
+    app.add_config_value("urljsf_bundle", default=False, rebuild="env")
+    app.add_config_value("urljsf_precompile", default=False, rebuild="env")
+    app.add_config_value("urljsf_compress", default=False, rebuild="")
+    app.add_config_value("urljsf_profile", default=SLOWEST, rebuild="", types=(int,))
+    app.add_config_value(
+        "urljsf_json_indent", default=2, rebuild="env", types=(int, type(None))
+    )
+    app.add_config_value("urljsf_json_sort_keys", default=True, rebuild="env")
+    app.connect("builder-inited", builder_inited)
+    app.connect("env-purge-doc", env_purge_doc)
+    app.connect("env-merge-info", env_merge_info)
     app.connect("build-finished", build_finished)
     app.connect("html-page-context", html_page_context)
 
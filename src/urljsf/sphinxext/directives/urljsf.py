@@ -11,12 +11,14 @@ from typing import TYPE_CHECKING, ClassVar
 from docutils.parsers.rst.directives import choice, uri
 from sphinx.util.docutils import SphinxDirective
 
+from ...cache import cache_stats
 from ...config import Config
-from ...constants import EXTENSION_FORMAT
+from ...constants import EXTENSION_FORMAT, FORMS_STATIC
+from ...profile import PROFILER
 from ...source import DefSource
 from ...urljsf import Urljsf
-from ...utils import import_dotted_dict
 from ..nodes import urljsf
+from ..state import get_state
 
 if TYPE_CHECKING:
     from docutils import nodes
@@ -42,12 +44,20 @@ class UrljsfDirective(SphinxDirective):
 
     def run(self) -> list[nodes.Node]:
         """Generate a single RJSF form."""
-        config = self.options_to_config()
-        self._urljsf = Urljsf(config)
+        before = cache_stats()
+        with PROFILER.form(f"{self.env.docname}:{self.lineno}") as profile:
+            config = self.options_to_config()
+            self._urljsf = Urljsf(config)
 
-        self._urljsf.load_definition()
+            self._urljsf.load_definition()
+            rendered = self._urljsf.render()
 
-        return [urljsf("", self._urljsf.render())]
+        if config.definition:
+            for path in sorted(config.definition.dependencies):
+                self.env.note_dependency(str(path))
+
+        get_state(self.env).add_form(self.env.docname, cache_stats() - before, profile)
+        return [urljsf("", rendered)]
 
     def options_to_config(self) -> Config:
         """Convert ``sphinx-options`` to ``urljsf_options``."""
@@ -69,14 +79,21 @@ class UrljsfDirective(SphinxDirective):
         definition: DefSource | None = None
         input_: str | None = None
         app_defaults = self.env.config.__dict__.get("urljsf", {})
+        cache_dir = (
+            Path(self.env.doctreedir) / "urljsf"
+            if self.env.config.urljsf_cache
+            else None
+        )
 
-        def_kwargs = {"defaults": app_defaults, "resource_path": here}
+        def_kwargs = {
+            "defaults": app_defaults,
+            "resource_path": here,
+            "cache_dir": cache_dir,
+            "bundle": self.env.config.urljsf_bundle,
+        }
 
         if path and path.startswith("py:"):
-            definition = DefSource(
-                raw=import_dotted_dict(path[3:]),
-                **def_kwargs,
-            )
+            definition = DefSource.from_dotted(path[3:], **def_kwargs)
         elif path:
             input_ = str(here / path)
         elif self.content and fmt:
@@ -84,11 +101,21 @@ class UrljsfDirective(SphinxDirective):
                 format=fmt, text="\n".join(self.content), **def_kwargs
             )
 
+        url_base = f"{rel}/_static/{FORMS_STATIC}/"
+
         return Config(
             input_=input_,
             definition=definition,
             defaults=app_defaults,
+            cache_dir=cache_dir,
+            externalize=self.env.config.urljsf_externalize,
+            bundle=self.env.config.urljsf_bundle,
+            precompile=self.env.config.urljsf_precompile,
+            forms_dir=Path(self.env.app.outdir) / "_static" / FORMS_STATIC,
+            forms_url=url_base,
+            json_indent=self.env.config.urljsf_json_indent,
+            json_sort_keys=self.env.config.urljsf_json_sort_keys,
             # meta
             template="urljsf/sphinx.j2",
-            url_base=f"{rel}/_static/urljsf-forms/",
+            url_base=url_base,
         )
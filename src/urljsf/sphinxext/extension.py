@@ -7,21 +7,66 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from sphinx.builders.singlehtml import SingleFileHTMLBuilder
+from sphinx.util import logging
+
+from ..cache import PAYLOADS, RESOLUTIONS
+from ..precompile import VALIDATORS
+from ..profile import PROFILER
 from ..urljsf import Urljsf
-from .nodes import urljsf
+from .state import get_state
 
 if TYPE_CHECKING:
     from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+logger = logging.getLogger(__name__)
 
 
 ROOT_CLASS = "urljsf-form"
 
 
+def builder_inited(app: Sphinx) -> None:
+    """Forget documents resolved or written in any previous build."""
+    RESOLUTIONS.clear()
+    PAYLOADS.clear()
+    VALIDATORS.clear()
+    PROFILER.clear()
+    PROFILER.enabled = app.config.urljsf_profile > 0
+
+
+def env_purge_doc(app: Sphinx, env: BuildEnvironment, docname: str) -> None:
+    """Forget the forms of a document which will be read again, or was removed."""
+    get_state(env).purge(docname)
+
+
+def env_merge_info(
+    app: Sphinx, env: BuildEnvironment, docnames: set[str], other: BuildEnvironment
+) -> None:
+    """Add the forms of documents read in a parallel process."""
+    get_state(env).merge(docnames, get_state(other))
+
+
 def build_finished(app: Sphinx, _err: Exception | None) -> None:
-    """Copy all static assets."""
+    """Copy all static assets, if any documents have forms."""
+    state = get_state(app.env)
+    if not state.forms:
+        return
+
+    stats = ", ".join(f"{k}: {v}" for k, v in sorted(state.total_stats().items()))
+    logger.info(
+        "urljsf: %s forms in %s documents (%s)",
+        sum(state.forms.values()),
+        len(state.forms),
+        stats or "no cache statistics",
+    )
+    for profile in state.slowest(app.config.urljsf_profile):
+        logger.info("urljsf: slowest: %s", profile.summary())
     static = Path(app.builder.outdir) / "_static"
 
-    Urljsf.deploy_static(Path(app.builder.outdir) / static)
+    Urljsf.deploy_static(
+        Path(app.builder.outdir) / static, compress=app.config.urljsf_compress
+    )
 
 
 def html_page_context(
@@ -31,8 +76,15 @@ def html_page_context(
     context: dict[str, Any],
     doctree: Any,
 ) -> None:
-    """Add JS/CSS to the page."""
-    if not doctree or not doctree.traverse(urljsf):
+    """Add JS/CSS to a page, if forms were found while reading its documents.
+
+    A ``singlehtml`` page includes every document, so needs JS if any have forms.
+    """
+    forms = get_state(app.env).forms
+    if isinstance(app.builder, SingleFileHTMLBuilder):
+        if not forms:
+            return
+    elif pagename not in forms:
         return
 
     app.add_js_file("urljsf/index.js", type="module")
@@ -0,0 +1,79 @@
+"""Per-document state for ``urljsf.sphinxext``, kept in the Sphinx environment."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from ..profile import SLOWEST, slowest
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sphinx.environment import BuildEnvironment
+
+    from ..profile import Profile
+
+#: the attribute of the Sphinx environment which holds the state
+ENV_ATTR = "urljsf_state"
+
+
+@dataclass
+class UrljsfState:
+    """Documents with forms, and cache statistics and profiles from reading them.
+
+    This is pickled with the environment, and merged from parallel readers.
+    """
+
+    forms: dict[str, int] = field(default_factory=dict)
+    stats: dict[str, Counter[str]] = field(default_factory=dict)
+    profiles: dict[str, list[Profile]] = field(default_factory=dict)
+
+    def add_form(
+        self, docname: str, stats: Counter[str], profile: Profile | None = None
+    ) -> None:
+        """Record a form read in a document, and maybe its profile."""
+        self.forms[docname] = self.forms.get(docname, 0) + 1
+        self.stats.setdefault(docname, Counter()).update(stats)
+        if profile:
+            self.profiles.setdefault(docname, []).append(profile)
+
+    def purge(self, docname: str) -> None:
+        """Forget a document which will be read again, or was removed."""
+        self.forms.pop(docname, None)
+        self.stats.pop(docname, None)
+        self.profiles.pop(docname, None)
+
+    def merge(self, docnames: Iterable[str], other: UrljsfState) -> None:
+        """Add the state of documents read by another process."""
+        for docname in docnames:
+            if docname in other.forms:
+                self.forms[docname] = other.forms[docname]
+                self.stats[docname] = other.stats[docname]
+                if docname in other.profiles:
+                    self.profiles[docname] = other.profiles[docname]
+
+    def total_stats(self) -> Counter[str]:
+        """Get the cache statistics for all documents."""
+        total: Counter[str] = Counter()
+        for stats in self.stats.values():
+            total.update(stats)
+        return total
+
+    def slowest(self, count: int = SLOWEST) -> list[Profile]:
+        """Get the profiles of the slowest forms in all documents."""
+        return slowest(
+            (p for profiles in self.profiles.values() for p in profiles), count
+        )
+
+
+def get_state(env: BuildEnvironment) -> UrljsfState:
+    """Get (or create) the state of an environment."""
+    state: UrljsfState | None = getattr(env, ENV_ATTR, None)
+    if state is None:
+        state = UrljsfState()
+        setattr(env, ENV_ATTR, state)
+    return state
@@ -0,0 +1,212 @@
+"""Static asset deployment for ``urljsf``."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+import gzip
+import os
+import shutil
+from dataclasses import dataclass
+from functools import cache
+from hashlib import sha256
+from importlib import import_module
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+#: bytes to read at a time when hashing files
+CHUNK_SIZE = 2**20
+
+#: file extensions worth precompressing
+COMPRESSIBLE = {".css", ".html", ".js", ".json", ".map", ".mjs", ".svg", ".txt"}
+
+
+@dataclass
+class DeployStats:
+    """Counts of files and bytes handled while deploying static assets."""
+
+    copied: int = 0
+    copied_bytes: int = 0
+    linked: int = 0
+    skipped: int = 0
+    skipped_bytes: int = 0
+    compressed: int = 0
+
+    def __str__(self) -> str:
+        """Summarize the deployment."""
+        return (
+            f"copied {self.copied} files ({self.copied_bytes} bytes),"
+            f" linked {self.linked} files,"
+            f" skipped {self.skipped} files ({self.skipped_bytes} bytes),"
+            f" compressed {self.compressed} files"
+        )
+
+
+def deploy_tree(
+    src: Path,
+    dest: Path,
+    *,
+    link: bool = False,
+    compress: bool = False,
+    stats: DeployStats | None = None,
+) -> DeployStats:
+    """Copy (or hard link) changed files from one folder into another."""
+    stats = stats or DeployStats()
+    for child in sorted(src.rglob("*")):
+        if child.is_dir():
+            continue
+        dest_child = dest / child.relative_to(src)
+        deploy_file(child, dest_child, link=link, stats=stats)
+        if compress:
+            compress_file(dest_child, stats=stats)
+    return stats
+
+
+def deploy_file(
+    src: Path, dest: Path, *, link: bool = False, stats: DeployStats | None = None
+) -> bool:
+    """Copy (or hard link) a file if it has changed, returning whether it did."""
+    stats = stats or DeployStats()
+    src_stat = src.stat()
+
+    if is_unchanged(src, dest):
+        stats.skipped += 1
+        stats.skipped_bytes += src_stat.st_size
+        return False
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if dest.exists():
+        dest.unlink()
+
+    if link:
+        try:
+            os.link(src, dest)
+        except OSError:
+            pass
+        else:
+            stats.linked += 1
+            return True
+
+    shutil.copy2(src, dest)
+    stats.copied += 1
+    stats.copied_bytes += src_stat.st_size
+    return True
+
+
+def is_unchanged(src: Path, dest: Path) -> bool:
+    """Check whether a file already has the content of its source."""
+    if not dest.exists():
+        return False
+    if src.samefile(dest):
+        return True
+
+    src_stat, dest_stat = src.stat(), dest.stat()
+
+    if src_stat.st_size != dest_stat.st_size:
+        return False
+    if src_stat.st_mtime_ns == dest_stat.st_mtime_ns:
+        return True
+    if file_hash(src) != file_hash(dest):
+        return False
+
+    os.utime(dest, ns=(dest_stat.st_atime_ns, src_stat.st_mtime_ns))
+    return True
+
+
+def file_hash(path: Path) -> str:
+    """Get the hash of a file's content."""
+    digest = sha256()
+    with path.open("rb") as fd:
+        for chunk in iter(lambda: fd.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@cache
+def compressors() -> dict[str, Callable[[bytes], bytes]]:
+    """Get compression functions by file suffix, including ``brotli`` if available."""
+    found: dict[str, Callable[[bytes], bytes]] = {
+        ".gz": lambda data: gzip.compress(data, compresslevel=9, mtime=0),
+    }
+    try:
+        brotli = import_module("brotli")
+    except ImportError:  # pragma: no cover
+        pass
+    else:  # pragma: no cover
+        found[".br"] = brotli.compress
+    return found
+
+
+def compress_tree(path: Path, *, stats: DeployStats | None = None) -> DeployStats:
+    """Precompress all the compressible files in a folder."""
+    stats = stats or DeployStats()
+    for child in sorted(path.rglob("*")):
+        if child.is_file():
+            compress_file(child, stats=stats)
+    return stats
+
+
+def compress_file(path: Path, *, stats: DeployStats | None = None) -> list[Path]:
+    """Write compressed copies of a file, if it has changed, returning any written.
+
+    Compressed copies get the modified time of the original, so an unchanged file is
+    only compressed once.
+    """
+    stats = stats or DeployStats()
+    if path.suffix not in COMPRESSIBLE:
+        return []
+
+    src_stat = path.stat()
+    written: list[Path] = []
+    data: bytes | None = None
+
+    for suffix, compress in compressors().items():
+        dest = path.with_name(f"{path.name}{suffix}")
+        if dest.exists() and dest.stat().st_mtime_ns == src_stat.st_mtime_ns:
+            continue
+        data = path.read_bytes() if data is None else data
+        dest.write_bytes(compress(data))
+        os.utime(dest, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        written += [dest]
+
+    stats.compressed += len(written)
+    return written
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """Write a text file, unless it already has the same content."""
+    return stream_if_changed(path, [text])
+
+
+def stream_if_changed(path: Path, chunks: Iterable[str]) -> bool:
+    """Write a text file from chunks, unless it already has the same content.
+
+    Chunks are written to a temporary file as they are produced, which only
+    replaces the file if its content has changed.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    digest = sha256()
+    try:
+        with tmp.open("wb") as fd:
+            for chunk in chunks:
+                data = chunk.encode("utf-8")
+                digest.update(data)
+                fd.write(data)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+    unchanged = (
+        path.exists()
+        and path.stat().st_size == tmp.stat().st_size
+        and file_hash(path) == digest.hexdigest()
+    )
+    if unchanged:
+        tmp.unlink()
+        return False
+    tmp.replace(path)
+    return True
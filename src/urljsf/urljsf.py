@@ -6,15 +6,34 @@ from __future__ import annotations
 
 from logging import Logger, getLogger
 from pathlib import Path
-from typing import TYPE_CHECKING
-
-import jinja2
-
-from .constants import MIME_PREFIX, STATIC, TEMPLATES, __dist__
+from typing import TYPE_CHECKING, Any
+
+from .cache import PAYLOADS, get_env
+from .constants import (
+    EXTERNAL_KEYS,
+    FORMS_STATIC,
+    MIME_PREFIX,
+    STATIC,
+    TEMPLATES,
+    __dist__,
+)
 from .errors import InvalidDefinitionError, InvalidInputError
+from .precompile import VALIDATORS
+from .profile import PROFILER, STATIC_PROFILE
 from .source import DefSource
+from .static import (
+    DeployStats,
+    compress_file,
+    compress_tree,
+    deploy_tree,
+    stream_if_changed,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import jinja2
+
     from ._schema import Urljsf as UrljsfSchema
     from .config import Config
 
@@ -35,16 +54,31 @@ class Urljsf:
         self.init_env()
 
     def init_env(self) -> None:
-        """Prepare a jinja environment."""
-        loader = jinja2.FileSystemLoader(
-            searchpath=[TEMPLATES, *self.config.extra_template_paths],
-        )
-        self.env = jinja2.Environment(
-            loader=loader, undefined=jinja2.StrictUndefined, autoescape=True
-        )
+        """Prepare a (possibly shared) jinja environment."""
+        cfg = self.config
+        search_path = tuple(map(str, [TEMPLATES, *cfg.extra_template_paths]))
+        bytecode_dir = cfg.cache_dir / "jinja2" if cfg.cache_dir else None
+        self.env = get_env(search_path, autoescape=True, bytecode_dir=bytecode_dir)
 
     def run_cli(self) -> int:
         """Generate output."""
+        rc = self.build()
+        if not rc:
+            self.deploy_static(
+                self.config.output_dir / "_static",
+                link=self.config.link_static,
+                compress=self.config.compress,
+            )
+        return rc
+
+    def build(self) -> int:
+        """Generate an HTML file, without static assets, profiling if enabled."""
+        cfg = self.config
+        with PROFILER.form(f"{cfg.input_ or cfg.output_dir / cfg.html_filename}"):
+            return self.build_html()
+
+    def build_html(self) -> int:
+        """Generate an HTML file, without static assets."""
         cfg = self.config
         self.log.debug("config: %s", cfg)
         self.load_definition()
@@ -58,11 +92,14 @@ class Urljsf:
             )
             return 2
 
-        rendered = self.render()
-        cfg.output_dir.mkdir(parents=True, exist_ok=True)
         out_html = cfg.output_dir / cfg.html_filename
-        out_html.write_text(rendered, encoding="utf-8")
-        self.deploy_static(cfg.output_dir / "_static")
+        with PROFILER.phase("render") as phase:
+            stream_if_changed(out_html, self.generate())
+            if phase:
+                phase.nbytes += out_html.stat().st_size
+        if cfg.compress:
+            with PROFILER.phase("compress"):
+                compress_file(out_html)
         return 0
 
     def load_definition(self) -> None:
@@ -79,7 +116,13 @@ class Urljsf:
         input_path = Path(cfg.input_)
 
         if input_path.exists():
-            cfg.definition = DefSource(input_path, defaults=cfg.defaults, log=self.log)
+            cfg.definition = DefSource(
+                input_path,
+                defaults=cfg.defaults,
+                log=self.log,
+                cache_dir=cfg.cache_dir,
+                bundle=cfg.bundle,
+            )
         else:  # pragma: no cover
             msg = f"No form definition found in {self.config}"
             raise InvalidDefinitionError(msg)
@@ -95,20 +138,86 @@ class Urljsf:
 
     def render(self) -> str:
         """Render a template."""
+        with PROFILER.phase("render") as phase:
+            tmpl = self.env.get_template(self.config.template)
+            html = tmpl.render(self.context())
+            if phase:
+                phase.nbytes += len(html.encode("utf-8"))
+        return html
+
+    def generate(self) -> Iterator[str]:
+        """Render a template in chunks, without holding the whole page in memory.
+
+        Only here is the embedded definition also encoded in chunks, as this is
+        slower than encoding it at once.
+        """
+        tmpl = self.env.get_template(self.config.template)
+        return tmpl.generate({**self.context(), "json_stream": True})
+
+    def context(self) -> dict[str, Any]:
+        """Get the context for rendering a template."""
         cfg = self.config
         self.log.debug("rendering: %s", cfg)
-        tmpl = self.env.get_template(cfg.template)
         context = dict(cfg.__dict__)
-        context.update(definition_json=self.definition, mime_prefix=MIME_PREFIX)
-        return tmpl.render(context)
+        definition = self.externalize() if cfg.externalize else self.definition
+        validators = self.precompile() if cfg.precompile else {}
+        context.update(
+            definition_json=definition,
+            validators_json=validators,
+            mime_prefix=MIME_PREFIX,
+        )
+        return context
+
+    def forms_dir_url(self) -> tuple[Path, str]:
+        """Get the folder and URL for content-hashed form documents."""
+        cfg = self.config
+        forms_dir = cfg.forms_dir or cfg.output_dir / "_static" / FORMS_STATIC
+        forms_url = cfg.forms_url
+        if forms_url is None:
+            forms_url = f"{cfg.url_base}_static/{FORMS_STATIC}/"
+        return forms_dir, forms_url
+
+    def externalize(self) -> dict[str, Any]:
+        """Replace inline form documents with URLs of content-hashed JSON files."""
+        forms_dir, forms_url = self.forms_dir_url()
+        definition: dict[str, Any] = dict(self.definition)
+        forms: dict[str, Any] = {}
+        for name, form in definition.get("forms", {}).items():
+            forms[name] = dict(form)
+            for key in EXTERNAL_KEYS:
+                value = form.get(key)
+                if isinstance(value, dict):
+                    forms[name][key] = forms_url + PAYLOADS.write(forms_dir, value)
+        definition["forms"] = forms
+        return definition
+
+    def precompile(self) -> dict[str, str]:
+        """Get URLs of standalone validation modules for inline form schema, by form."""
+        forms_dir, forms_url = self.forms_dir_url()
+        schemas = {
+            name: form["schema"]
+            for name, form in self.definition.get("forms", {}).items()
+            if isinstance(form.get("schema"), dict)
+        }
+        names = VALIDATORS.write(forms_dir, schemas) if schemas else {}
+        return {key: forms_url + name for key, name in names.items()}
 
     @staticmethod
-    def deploy_static(path: Path) -> None:
-        """Copy the static assets into the right place."""
-        for child in (STATIC / "urljsf").rglob("*"):
-            if child.is_dir():
-                continue
-            rel = str(child.relative_to(STATIC))
-            dest = path / rel
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            dest.write_bytes(child.read_bytes())
+    def deploy_static(
+        path: Path, *, link: bool = False, compress: bool = False
+    ) -> DeployStats:
+        """Copy (or hard link) changed static assets into the right place.
+
+        If ``compress``, also precompress these, and any externalized form documents.
+        """
+        with PROFILER.form(STATIC_PROFILE), PROFILER.phase("deploy") as phase:
+            stats = deploy_tree(
+                STATIC / "urljsf", path / "urljsf", link=link, compress=compress
+            )
+            forms = path / FORMS_STATIC
+            if compress and forms.is_dir():
+                compress_tree(forms, stats=stats)
+            if phase:
+                phase.nbytes += stats.copied_bytes
+        getLogger(__dist__).info("deployed static assets to %s: %s", path, stats)
+        return stats
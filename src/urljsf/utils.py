@@ -4,7 +4,8 @@
 # Distributed under the terms of the Modified BSD License.
 from __future__ import annotations
 
-from copy import deepcopy
+import sys
+from pathlib import Path
 from typing import Any
 
 from .errors import BadImportError
@@ -28,15 +29,25 @@ def import_dotted_dict(dotted: str) -> dict[str, Any]:
     return candidate
 
 
+def dotted_module_file(dotted: str) -> Path | None:
+    """Get the file of the (already imported) module of a dotted python import."""
+    module = sys.modules.get(dotted.split(":", 1)[0])
+    file_ = getattr(module, "__file__", None)
+    return Path(file_).resolve() if file_ else None
+
+
 def merge_deep(
     left: dict[str, Any] | None, right: dict[str, Any] | None
 ) -> dict[str, Any]:
-    """Merge dictionaries."""
-    left = deepcopy(left or {})
-    right = deepcopy(right or {})
-    for key, value in right.items():
-        if isinstance(value, dict):
-            left[key] = merge_deep(left.get(key), value)
+    """Merge dictionaries, only copying the dictionaries defined on both sides.
+
+    Any other values are shared with the inputs, and should not be mutated.
+    """
+    merged = dict(left or {})
+    for key, value in (right or {}).items():
+        old_value = merged.get(key)
+        if isinstance(value, dict) and isinstance(old_value, dict):
+            merged[key] = merge_deep(old_value, value)
             continue
-        left[key] = value
-    return left
+        merged[key] = value
+    return merged
@@ -61,6 +61,15 @@ NO_SCHEMA_JSON = ["remote"]
 
 FORMATS = ["json", "toml", "yaml"]
 
+#: a small, valid definition
+MINIMAL_TOML = """
+[forms.url.schema]
+type = "object"
+
+[templates]
+url = "https://example.com"
+"""
+
 
 @pytest.fixture
 def py_tmp_path(tmp_path: Path) -> Generator[Path, None, None]:
@@ -0,0 +1,5 @@
+"""A sphinx project with many documents."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+extensions = ["urljsf.sphinxext"]
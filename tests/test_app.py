@@ -0,0 +1,227 @@
+"""Verify the ASGI application."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from urljsf.app import UrljsfApp
+    from urljsf.source import DefSource
+    from urljsf.urljsf import Urljsf
+
+DEFINITIONS: dict[str, dict[str, Any]] = {
+    "a": {
+        "forms": {"a": {"schema": {"type": "object", "title": "A"}}},
+        "templates": {"url": "https://example.com"},
+    },
+    "invalid": {"forms": {}},
+    "import": {
+        "forms": {"a": {"schema": {}, "form_data": "py:os:getcwd"}},
+        "templates": {"url": "https://example.com"},
+    },
+    "file": {
+        "forms": {"a": {"schema": "./a.schema.json"}},
+        "templates": {"url": "https://example.com"},
+    },
+    "malformed": {"forms": {"x": "abc"}, "templates": {"url": "https://example.com"}},
+}
+
+#: HTTP status codes
+OK, NOT_MODIFIED, NOT_FOUND, NOT_ALLOWED, INVALID = 200, 304, 404, 405, 422
+
+
+def request(
+    app: UrljsfApp, path: str, method: str = "GET", **headers: str
+) -> tuple[int, dict[str, str], bytes]:
+    """Make a request of an ASGI app, returning the status, headers, and body."""
+    messages: list[dict[str, Any]] = []
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": [
+            (k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()
+        ],
+    }
+
+    async def receive() -> dict[str, Any]:  # noqa: RUF029
+        return {"type": "http.request"}  # pragma: no cover
+
+    async def send(message: dict[str, Any]) -> None:  # noqa: RUF029
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start, *bodies = messages
+    assert not bodies[-1].get("more_body")
+    response_headers = {k.decode(): v.decode() for k, v in start["headers"]}
+    return start["status"], response_headers, b"".join(m["body"] for m in bodies)
+
+
+@pytest.fixture
+def app() -> UrljsfApp:
+    """Provide an app which loads definitions from a dictionary."""
+    from urljsf.app import UrljsfApp
+
+    return UrljsfApp(loader=DEFINITIONS.get)
+
+
+def test_app_page(app: UrljsfApp) -> None:
+    """Verify pages are rendered once, and not sent again if unchanged."""
+    status, headers, body = request(app, "/a")
+    assert status == OK
+    assert b'"title": "A"' in body
+    assert b'src="/_static/urljsf/index.js"' in body
+    assert "content-length" not in headers
+    etag = headers["etag"]
+
+    status, headers, cached = request(app, "/a")
+    assert cached == body
+    assert int(headers["content-length"]) == len(body)
+    assert app.pages.info() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 1024}
+
+    status, headers, body = request(app, "/a", if_none_match=f'"x", {etag}')
+    assert (status, headers["etag"], body) == (NOT_MODIFIED, etag, b"")
+
+    status, headers, body = request(app, "/a", "HEAD")
+    assert (status, body) == (OK, b"")
+    assert int(headers["content-length"])
+
+
+def test_app_errors(app: UrljsfApp) -> None:
+    """Verify unknown, invalid, or unexpected requests."""
+    assert request(app, "/b")[0] == NOT_FOUND
+    assert request(app, "/a", "POST")[0] == NOT_ALLOWED
+    status, _headers, body = request(app, "/invalid")
+    assert status == INVALID
+    assert b"templates" in body
+
+
+@pytest.mark.parametrize("name", ["import", "file", "malformed"])
+def test_app_refs(app: UrljsfApp, name: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify definitions may not reference files or imports, or break the app."""
+    from urljsf import cache
+
+    def no_import(dotted: str) -> None:  # pragma: no cover
+        msg = f"unexpected import: {dotted}"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(cache, "import_dotted_dict", no_import)
+    status, _headers, body = request(app, f"/{name}")
+    assert status == INVALID
+    if name != "malformed":
+        assert b"references are not allowed" in body
+
+
+def test_app_async_loader() -> None:
+    """Verify definitions may be loaded asynchronously, and pages are bounded."""
+    from urljsf.app import Pages, UrljsfApp
+
+    async def loader(name: str) -> dict[str, Any] | None:
+        await asyncio.sleep(0)
+        return {**DEFINITIONS["a"], "iframe": name == "iframe"}
+
+    app = UrljsfApp(loader=loader, pages=Pages(maxsize=1))
+    assert request(app, "/iframe")[0] == OK
+    assert request(app, "/other")[0] == OK
+    assert request(app, "/iframe")[0] == OK
+    assert app.pages.info() == {"hits": 0, "misses": 3, "size": 1, "maxsize": 1}
+    app.pages.clear()
+    assert not app.pages.info()["size"]
+
+
+def test_app_large_page() -> None:
+    """Verify pages larger than the limit are streamed, but not kept."""
+    from urljsf.app import Pages, UrljsfApp
+
+    app = UrljsfApp(loader=DEFINITIONS.get, pages=Pages(max_bytes=100))
+    body = request(app, "/a")[2]
+    assert len(body) > app.pages.max_bytes
+    assert request(app, "/a")[2] == body
+    assert app.pages.info() == {"hits": 0, "misses": 2, "size": 0, "maxsize": 1024}
+
+
+def test_app_threads(app: UrljsfApp, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify definitions are parsed and rendered, and files read, off the loop."""
+    import threading
+
+    from urljsf import app as app_module
+
+    threads: dict[str, int] = {}
+    urljsf, read_chunks, def_source = (
+        app.urljsf,
+        app_module.read_chunks,
+        app_module.DefSource,
+    )
+
+    def parse(**kwargs: Any) -> DefSource:  # noqa: ANN401
+        threads["parse"] = threading.get_ident()
+        return def_source(**kwargs)
+
+    def render(source: DefSource) -> Urljsf:
+        threads["render"] = threading.get_ident()
+        return urljsf(source)
+
+    def read(path: Path) -> Iterator[bytes]:
+        threads["read"] = threading.get_ident()
+        yield from read_chunks(path)
+
+    monkeypatch.setattr(app_module, "DefSource", parse)
+    monkeypatch.setattr(app, "urljsf", render)
+    monkeypatch.setattr(app_module, "read_chunks", read)
+    assert request(app, "/a")[0] == OK
+    assert request(app, "/_static/urljsf/index.js")[0] == OK
+    assert sorted(threads) == ["parse", "read", "render"]
+    assert threading.get_ident() not in threads.values()
+
+
+def test_buffered() -> None:
+    """Verify small chunks of text are joined into larger chunks of bytes."""
+    from urljsf.app import buffered
+
+    assert [*buffered(["a", "b", "c", "\u00e9"], 2)] == [b"ab", "c\u00e9".encode()]
+    assert not [*buffered([], 2)]
+
+
+def test_app_static(app: UrljsfApp) -> None:
+    """Verify static assets are streamed from the package."""
+    from urljsf.constants import STATIC
+
+    index_js = STATIC / "urljsf/index.js"
+    status, headers, body = request(app, "/_static/urljsf/index.js")
+    assert status == OK
+    assert body == index_js.read_bytes()
+    assert "javascript" in headers["content-type"]
+
+    status, _headers, body = request(
+        app, "/_static/urljsf/index.js", if_none_match=headers["etag"]
+    )
+    assert (status, body) == (NOT_MODIFIED, b"")
+
+    assert request(app, "/_static/urljsf/../../__init__.py")[0] == NOT_FOUND
+    assert request(app, "/_static/urljsf/nothing.js")[0] == NOT_FOUND
+
+
+def test_app_lifespan(app: UrljsfApp) -> None:
+    """Verify the app starts and stops."""
+    sent: list[dict[str, Any]] = []
+    received = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+
+    async def receive() -> dict[str, Any]:  # noqa: RUF029
+        return received.pop(0)
+
+    async def send(message: dict[str, Any]) -> None:  # noqa: RUF029
+        sent.append(message)
+
+    asyncio.run(app({"type": "lifespan"}, receive, send))
+    assert [m["type"] for m in sent] == [
+        "lifespan.startup.complete",
+        "lifespan.shutdown.complete",
+    ]
@@ -0,0 +1,150 @@
+"""Verify bundling JSON schema."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+from .conftest import UTF8
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+COMMON = {
+    "definitions": {
+        "name": {"type": "array", "items": {"$ref": "#/definitions/inner"}},
+        "inner": {"type": "integer"},
+        "unused": {"type": "null"},
+    }
+}
+
+ROOT = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "properties": {
+        "a": {"$ref": "#/definitions/a"},
+        "b": {"$ref": "./common.schema.json#/definitions/name"},
+        "c": {"$ref": "./common.schema.json#/definitions/name"},
+        "d": {"$ref": "https://example.com/schema.json"},
+        "e": {"$ref": "#"},
+        "f": {"const": {"$ref": "#/definitions/unused"}},
+    },
+    "definitions": {
+        "a": {"type": "array", "items": {"$ref": "#/definitions/a"}},
+        "unused": {"type": "null"},
+    },
+}
+
+
+def test_bundle(tmp_path: Path) -> None:
+    """Verify local and relative file references are hoisted once."""
+    from urljsf.bundle import bundle_schema
+
+    (tmp_path / "common.schema.json").write_text(json.dumps(COMMON), **UTF8)
+    loaded: list[Path] = []
+
+    def loader(path: Path) -> dict[str, Any]:
+        loaded.append(path)
+        raw: dict[str, Any] = json.loads(path.read_text(**UTF8))
+        return raw
+
+    before = json.dumps(ROOT)
+    bundled = bundle_schema(ROOT, tmp_path, loader)
+    assert json.dumps(ROOT) == before
+    assert len(loaded) == 1
+
+    props = bundled["properties"]
+    assert props["a"] == {"$ref": "#/definitions/a"}
+    assert props["b"] == props["c"] == {"$ref": "#/definitions/common-name"}
+    assert props["d"] == ROOT["properties"]["d"]
+    assert props["e"] == {"$ref": "#"}
+    assert props["f"] == ROOT["properties"]["f"]
+    assert sorted(bundled["definitions"]) == ["a", "common-inner", "common-name"]
+    assert bundled["definitions"]["common-name"]["items"] == {
+        "$ref": "#/definitions/common-inner"
+    }
+
+
+def test_bundle_data_key_names(tmp_path: Path) -> None:
+    """Verify subschemas named like data keywords are still rewritten."""
+    from urljsf.bundle import bundle_schema
+
+    (tmp_path / "common.schema.json").write_text(json.dumps(COMMON), **UTF8)
+    ref = {"$ref": "./common.schema.json#/definitions/inner"}
+    schema = {
+        "properties": {"default": ref, "enum": {"default": ref}},
+        "patternProperties": {"^const$": ref},
+        "definitions": {"examples": ref},
+        "items": {"$ref": "#/definitions/examples"},
+    }
+    bundled = bundle_schema(schema, tmp_path, lambda p: json.loads(p.read_text(**UTF8)))
+    hoisted = {"$ref": "#/definitions/common-inner"}
+    assert bundled["properties"]["default"] == hoisted
+    assert bundled["properties"]["enum"] == {"default": ref}
+    assert bundled["patternProperties"]["^const$"] == hoisted
+    assert bundled["items"] == {"$ref": "#/definitions/examples"}
+    assert bundled["definitions"]["examples"] == hoisted
+
+
+def test_bundle_unresolved() -> None:
+    """Verify references which can't be found are kept."""
+    from urljsf.bundle import bundle_schema
+
+    schema = {"$ref": "#/definitions/missing", "items": {"$ref": "./missing.json"}}
+    assert bundle_schema(schema, None, dict) == schema
+
+
+def test_bundle_source(tmp_path: Path) -> None:
+    """Verify form schema are bundled, recording referenced files."""
+    from urljsf.cache import RESOLUTIONS
+    from urljsf.source import DefSource
+
+    RESOLUTIONS.clear()
+    common = tmp_path / "schemas/common.schema.json"
+    common.parent.mkdir()
+    common.write_text(json.dumps(COMMON), **UTF8)
+    root = tmp_path / "schemas/form.schema.json"
+    root.write_text(json.dumps(ROOT), **UTF8)
+    defn = tmp_path / "urljsf.json"
+    forms = {name: {"schema": "./schemas/form.schema.json"} for name in "xy"}
+    defn.write_text(
+        json.dumps({"forms": forms, "templates": {"url": "https://example.com"}}),
+        **UTF8,
+    )
+
+    source = DefSource(defn, bundle=True)
+    assert not source.validation_errors
+    assert source.raw
+    assert source.data
+    schema = source.data["forms"]["x"]["schema"]
+    assert schema == source.raw["forms"]["x"]["schema"]
+    assert "unused" not in schema["definitions"]
+    assert schema is source.data["forms"]["y"]["schema"]
+    assert common.resolve() in source.dependencies
+    assert common.resolve() in DefSource(defn, bundle=True).dependencies
+    RESOLUTIONS.clear()
+
+
+def test_bundle_rendered(tmp_path: Path) -> None:
+    """Verify bundled schema are rendered, without relative file references."""
+    from urljsf.cache import RESOLUTIONS
+    from urljsf.config import Config
+    from urljsf.urljsf import Urljsf
+
+    RESOLUTIONS.clear()
+    (tmp_path / "common.schema.json").write_text(json.dumps(COMMON), **UTF8)
+    (tmp_path / "form.schema.json").write_text(json.dumps(ROOT), **UTF8)
+    defn = tmp_path / "urljsf.toml"
+    defn.write_text(
+        '[forms.url]\nschema = "./form.schema.json"\n\n'
+        '[templates]\nurl = "https://example.com"\n',
+        **UTF8,
+    )
+    out = tmp_path / "out"
+    assert not Urljsf(Config(input_=str(defn), output_dir=out, bundle=True)).build()
+    html = (out / "index.html").read_text(**UTF8)
+    assert "#/definitions/common-name" in html
+    assert "common.schema.json" not in html
+    RESOLUTIONS.clear()
@@ -0,0 +1,201 @@
+"""Verify caching behavior."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .conftest import MINIMAL_TOML, UTF8
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+SHARED = """
+[forms.url]
+schema = "./shared.schema.json"
+
+[forms.other]
+schema = "./shared.schema.json"
+
+[templates]
+url = "https://example.com"
+"""
+
+
+def test_shared_env(tmp_path: Path) -> None:
+    """Verify ``jinja2`` environments and their templates are reused."""
+    from urljsf.config import Config
+    from urljsf.urljsf import Urljsf
+
+    one = Urljsf(Config(input_=None))
+    two = Urljsf(Config(input_=None))
+    assert one.env is two.env
+    assert one.env.get_template("urljsf/sphinx.j2") is two.env.get_template(
+        "urljsf/sphinx.j2"
+    )
+
+    other = Urljsf(Config(input_=None, extra_template_paths=[tmp_path]))
+    assert other.env is not one.env
+
+
+def test_bytecode_cache(tmp_path: Path) -> None:
+    """Verify compiled templates are cached on disk."""
+    from urljsf.config import Config
+    from urljsf.urljsf import Urljsf
+
+    cache_dir = tmp_path / "cache"
+    urljsf = Urljsf(Config(input_=None, cache_dir=cache_dir))
+    urljsf.env.get_template("urljsf/standalone.j2")
+    assert [*(cache_dir / "jinja2").glob("*.cache")]
+
+
+def test_source_cache(tmp_path: Path) -> None:
+    """Verify validated definitions are cached on disk."""
+    from urljsf.cache import SOURCES
+    from urljsf.source import DefSource
+
+    defn = tmp_path / "urljsf.toml"
+    defn.write_text(MINIMAL_TOML, **UTF8)
+    cache_dir = tmp_path / "cache"
+
+    first = DefSource(defn, cache_dir=cache_dir, defaults={"iframe": True})
+    assert not first.validation_errors
+    cached = [*(cache_dir / SOURCES).glob("*.json")]
+    assert len(cached) == 1
+
+    cached[0].write_text('{"forms": {}, "templates": {}}', **UTF8)
+    second = DefSource(defn, cache_dir=cache_dir, defaults={"iframe": True})
+    assert second.raw == {"forms": {}, "templates": {}}
+
+    third = DefSource(defn, cache_dir=cache_dir, defaults={"iframe": False})
+    assert third.raw
+    assert third.raw["forms"]
+    assert len([*(cache_dir / SOURCES).glob("*.json")]) == len(["first", "third"])
+
+
+def test_source_cache_invalid(tmp_path: Path) -> None:
+    """Verify invalid definitions are not cached."""
+    from urljsf.source import DefSource
+
+    defn = tmp_path / "urljsf.toml"
+    defn.write_text(MINIMAL_TOML.replace("[templates]", "[no_templates]"), **UTF8)
+    cache_dir = tmp_path / "cache"
+    source = DefSource(defn, cache_dir=cache_dir)
+    assert source.validation_errors
+    assert not cache_dir.exists()
+
+
+def test_schema_checks() -> None:
+    """Verify schema are only checked once."""
+    from urljsf.cache import SchemaChecks
+
+    checks = SchemaChecks(maxsize=2)
+    assert checks.check({"type": "object"}) is None
+    assert checks.check({"type": "object"}) is None
+    assert checks.info() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 2}
+
+    err = checks.check({"type": 1})
+    assert err is not None
+    assert checks.check({"type": 1}) is err
+
+    checks.check({"type": "string"})
+    assert checks.info()["size"] == checks.maxsize
+    checks.check({"type": "object"})
+    assert checks.hits == len(["object", 1])
+
+    checks.clear()
+    assert checks.info() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 2}
+
+
+def test_schema_checks_threads() -> None:
+    """Verify schema may be checked by many threads, while being forgotten."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from urljsf.cache import SchemaChecks
+
+    checks = SchemaChecks(maxsize=4)
+    schemas = [{"title": f"{i % 16}"} for i in range(2000)]
+    with ThreadPoolExecutor(8) as pool:
+        assert not any(pool.map(checks.check, schemas))
+    assert checks.hits + checks.misses == len(schemas)
+    assert checks.info()["size"] == checks.maxsize
+
+
+def test_resolutions(tmp_path: Path) -> None:
+    """Verify shared referenced files are only loaded once per build."""
+    import os
+
+    from urljsf.cache import RESOLUTIONS
+    from urljsf.source import DefSource
+
+    RESOLUTIONS.clear()
+    shared = tmp_path / "shared.schema.json"
+    shared.write_text('{"type": "object"}', **UTF8)
+    defn = tmp_path / "urljsf.toml"
+    defn.write_text(SHARED, **UTF8)
+
+    source = DefSource(defn)
+    assert source.raw
+    forms = source.raw["forms"]
+    assert forms["url"]["schema"] is forms["other"]["schema"]
+    assert RESOLUTIONS.info() == {
+        "hits": 1,
+        "misses": 1,
+        "files": 1,
+        "imports": 0,
+        "bundles": 0,
+    }
+
+    stat = shared.stat()
+    os.utime(shared, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    DefSource(defn)
+    assert RESOLUTIONS.misses == len(["first", "touched"])
+    RESOLUTIONS.clear()
+
+
+def test_payloads(tmp_path: Path) -> None:
+    """Verify form documents are written once, by content hash."""
+    from urljsf.cache import Payloads
+
+    payloads = Payloads()
+    schema = {"type": "object", "title": "a"}
+    name = payloads.write(tmp_path, schema)
+    assert payloads.write(tmp_path, schema) == name
+    assert payloads.write(tmp_path, {"title": "a", "type": "object"}) == name
+    assert payloads.info() == {"hits": 2, "misses": 1, "names": 2}
+    assert [p.name for p in tmp_path.glob("*")] == [name]
+
+    (tmp_path / name).unlink()
+    assert payloads.write(tmp_path, schema) == name
+    assert (tmp_path / name).exists()
+
+    payloads.clear()
+    assert payloads.info() == {"hits": 0, "misses": 0, "names": 0}
+
+
+def test_dependencies(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify files read while parsing are recorded, even if already resolved."""
+    from urljsf.cache import RESOLUTIONS
+    from urljsf.source import DefSource
+
+    RESOLUTIONS.clear()
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / "urljsf_test_deps.py").write_text('UI = {"ui:title": "hello"}', **UTF8)
+    shared = tmp_path / "shared.schema.json"
+    shared.write_text('{"type": "object"}', **UTF8)
+    defn = tmp_path / "urljsf.toml"
+    defn.write_text(
+        SHARED.replace(
+            "[forms.other]", '[forms.other]\nui_schema = "py:urljsf_test_deps:UI"'
+        ),
+        **UTF8,
+    )
+    expected = {p.resolve() for p in [defn, shared, tmp_path / "urljsf_test_deps.py"]}
+
+    assert DefSource(defn).dependencies == expected
+    assert DefSource(defn).dependencies == expected
+    assert RESOLUTIONS.hits
+    RESOLUTIONS.clear()
@@ -4,8 +4,16 @@
 
 from __future__ import annotations
 
+import shutil
 from typing import TYPE_CHECKING
 
+import pytest
+
+from .conftest import UTF8
+
+#: the return code for a definition with validation errors
+INVALID_RC = 2
+
 if TYPE_CHECKING:
     from pathlib import Path
 
@@ -55,6 +63,122 @@ def test_cli_run_py(
     _assert_builds(src, script_runner)
 
 
+@pytest.mark.parametrize("how", ["folder", "glob", "manifest"])
+def test_cli_run_many(
+    script_runner: ScriptRunner, a_valid_cli_project: str, tmp_path: Path, how: str
+) -> None:
+    """Verify many sites are built into one tree."""
+    src = tmp_path / "src"
+    many = tmp_path / "many"
+    for name in ["a", "b/c"]:
+        shutil.copytree(src, many / name)
+
+    args = {
+        "folder": ["many"],
+        "glob": ["many/**/urljsf.*"],
+        "manifest": ["@manifest.txt"],
+    }[how]
+
+    if how == "manifest":
+        manifest = "\n".join(str(p.relative_to(tmp_path)) for p in many.rglob("*.toml"))
+        (tmp_path / "manifest.txt").write_text(manifest, **UTF8)
+
+    r = script_runner.run(["urljsf", *args], cwd=str(tmp_path))
+    assert r.success
+    out = tmp_path / "_urljsf_output"
+    assert (out / "a/index.html").exists()
+    assert (out / "b/c/index.html").exists()
+    assert (out / "_static/urljsf/third-party-licenses.json").exists()
+    assert not (out / "index.html").exists()
+    assert not (out / "a/_static").exists()
+    nested = (out / "b/c/index.html").read_text(**UTF8)
+    assert "../../_static/urljsf/index.js" in nested
+
+
+def test_cli_run_many_externalize(
+    script_runner: ScriptRunner, a_valid_cli_project: str, tmp_path: Path
+) -> None:
+    """Verify shared form documents are written once, and referenced by URL."""
+    src = tmp_path / "src"
+    many = tmp_path / "many"
+    for name in ["a", "b/c"]:
+        shutil.copytree(src, many / name)
+
+    r = script_runner.run(["urljsf", "many", "--externalize"], cwd=str(tmp_path))
+    assert r.success
+    out = tmp_path / "_urljsf_output"
+    forms = sorted((out / "_static/urljsf-forms").glob("*.json"))
+    assert forms
+    a_html = (out / "a/index.html").read_text(**UTF8)
+    nested = (out / "b/c/index.html").read_text(**UTF8)
+    for path in forms:
+        assert f"../_static/urljsf-forms/{path.name}" in a_html
+        assert f"../../_static/urljsf-forms/{path.name}" in nested
+    assert '"properties"' not in a_html
+
+
+def test_cli_run_compress(
+    script_runner: ScriptRunner, a_valid_cli_project: str, tmp_path: Path
+) -> None:
+    """Verify outputs are precompressed, and unchanged outputs are not rewritten."""
+    defn = next((tmp_path / "src").glob("urljsf.*"))
+    args = ["urljsf", str(defn), "--compress", "--externalize"]
+    assert script_runner.run(args, cwd=str(tmp_path)).success
+    out = tmp_path / "_urljsf_output"
+    html_gz = out / "index.html.gz"
+    assert html_gz.exists()
+    assert [*(out / "_static/urljsf-forms").glob("*.json.gz")]
+    assert [*(out / "_static/urljsf").glob("*.js.gz")]
+
+    mtime = html_gz.stat().st_mtime_ns
+    assert script_runner.run(args, cwd=str(tmp_path)).success
+    assert html_gz.stat().st_mtime_ns == mtime
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        ([], '\n  "forms": {'),
+        (["--json-compact"], '{"forms":{'),
+        (["--json-indent", "1", "--json-unsorted"], '\n "forms": {'),
+    ],
+)
+def test_cli_run_json(
+    script_runner: ScriptRunner,
+    a_valid_cli_project: str,
+    tmp_path: Path,
+    args: list[str],
+    expected: str,
+) -> None:
+    """Verify the embedded JSON can be formatted."""
+    defn = next((tmp_path / "src").glob("urljsf.*"))
+    r = script_runner.run(["urljsf", str(defn), *args], cwd=str(tmp_path))
+    assert r.success
+    assert expected in (tmp_path / "_urljsf_output/index.html").read_text(**UTF8)
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_cli_run_many_invalid(
+    script_runner: ScriptRunner, a_valid_cli_project: str, tmp_path: Path, jobs: str
+) -> None:
+    """Verify errors in many inputs are reported, without stopping valid builds."""
+    src = tmp_path / "src"
+    many = tmp_path / "many"
+    for name in ["a", "b", "c"]:
+        shutil.copytree(src, many / name)
+    bad = next((many / "b").glob("urljsf.*"))
+    bad.write_text(bad.read_text(**UTF8).replace("[templates]", "[not-templates]"))
+
+    r = script_runner.run(["urljsf", "many", "--jobs", jobs], cwd=str(tmp_path))
+    assert r.returncode == INVALID_RC
+    out = tmp_path / "_urljsf_output"
+    assert (out / "a/index.html").exists()
+    assert not (out / "b/index.html").exists()
+    assert (out / "c/index.html").exists()
+    assert (out / "_static/urljsf/third-party-licenses.json").exists()
+    assert "templates" in r.stderr
+
+
 def _assert_builds(src: Path, script_runner: ScriptRunner) -> None:
     all_files = [*src.glob("urljsf.*")]
     assert all_files
@@ -88,3 +212,40 @@ def _assert_outputs(
         print("\n".join(map(str, path.rglob("*"))))
 
     assert not missing
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+@pytest.mark.parametrize(
+    "broken",
+    [
+        ('schema = "py:json:__name__"', "Failed to resolve json:__name__"),
+        ('schema = "./missing.schema.json"', "missing.schema.json"),
+        ("schema = [not toml", "many/b/urljsf.toml: "),
+    ],
+)
+def test_cli_run_many_broken(
+    script_runner: ScriptRunner,
+    a_valid_cli_project: str,
+    tmp_path: Path,
+    jobs: str,
+    broken: tuple[str, str],
+) -> None:
+    """Verify a definition which can't be loaded doesn't stop other builds."""
+    src = tmp_path / "src"
+    many = tmp_path / "many"
+    for name in ["a", "b"]:
+        shutil.copytree(src, many / name)
+    for path in (many / "b").glob("urljsf.*"):
+        path.unlink()
+    (many / "b/urljsf.toml").write_text(
+        f'[forms.url]\n{broken[0]}\n\n[templates]\nurl = "x"\n', **UTF8
+    )
+
+    r = script_runner.run(["urljsf", "many", "--jobs", jobs], cwd=str(tmp_path))
+    assert r.returncode == 1
+    assert "Traceback" not in r.stderr
+    assert broken[1] in r.stderr
+    out = tmp_path / "_urljsf_output"
+    assert (out / "a/index.html").exists()
+    assert (out / "_static/urljsf/index.js").exists()
+    assert not (out / "b/index.html").exists()
@@ -4,6 +4,8 @@
 
 from typing import Any
 
+import pytest
+
 
 def test_example_urljsf(an_example_urljsf: dict[str, Any]) -> None:
     """Verify a full urljsf examples is valid."""
@@ -19,3 +21,51 @@ def test_example_ui_schema(an_example_ui_schema: dict[str, Any]) -> None:
 
     errors = [*UI_VALIDATOR.iter_errors(an_example_ui_schema)]
     assert not errors
+
+
+@pytest.mark.parametrize(
+    "name", ["URLJSF_VALIDATOR", "PROPS_VALIDATOR", "UI_VALIDATOR"]
+)
+def test_lazy_validator(name: str) -> None:
+    """Verify validators are only built once."""
+    from urljsf import schema
+
+    assert getattr(schema, name) is getattr(schema, name)
+
+
+def test_lazy_validator_missing() -> None:
+    """Verify unknown validators are not found."""
+    from urljsf import schema
+
+    with pytest.raises(AttributeError):
+        schema.NOT_A_VALIDATOR  # noqa: B018
+
+
+def test_example_urljsf_fast(an_example_urljsf: dict[str, Any]) -> None:
+    """Verify a full urljsf example is valid with the generated validator."""
+    from urljsf.schema import urljsf_fast_validator
+
+    fast_validator = urljsf_fast_validator()
+    assert fast_validator
+    assert fast_validator(an_example_urljsf)
+
+
+@pytest.mark.parametrize(
+    "invalid",
+    [
+        {},
+        {"forms": {}},
+        {"forms": {"url": {"schema": 1}}, "templates": {"url": ""}},
+        {"forms": {}, "templates": {"url": ""}, "$id": "a b"},
+        {"forms": {}, "templates": {"url": ""}, "$id": "{}"},
+        {"forms": {}, "templates": {"url": ""}, "not-a-field": True},
+    ],
+)
+def test_invalid_urljsf_fast(invalid: dict[str, Any]) -> None:
+    """Verify the generated validator agrees with ``jsonschema``."""
+    from urljsf.schema import URLJSF_VALIDATOR, urljsf_fast_validator
+
+    fast_validator = urljsf_fast_validator()
+    assert fast_validator
+    assert [*URLJSF_VALIDATOR.iter_errors(invalid)]
+    assert not fast_validator(invalid)
@@ -0,0 +1,117 @@
+"""Verify custom ``jinja2`` filters."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from .conftest import MINIMAL_TOML, UTF8
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+VALUES: list[object] = [
+    None,
+    {"b": [1, 2.5, "<script>"], "a": {"c": "it's & done"}},
+    [{}, [], "", True],
+]
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_urljsf_json_default(value: object) -> None:
+    """Verify the default output matches the built-in ``tojson(indent=2)``."""
+    import jinja2
+
+    from urljsf.filters import urljsf_json
+
+    env = jinja2.Environment(autoescape=True)
+    expected = env.from_string("{{ value | tojson(indent=2) }}").render(value=value)
+    assert urljsf_json(value) == expected
+
+
+@pytest.mark.parametrize("value", VALUES)
+@pytest.mark.parametrize("sort_keys", [True, False])
+def test_urljsf_json_compact(value: object, sort_keys: bool) -> None:  # noqa: FBT001
+    """Verify compact output has no whitespace, and is HTML-safe."""
+    from urljsf.filters import urljsf_json
+
+    text = urljsf_json(value, None, sort_keys=sort_keys)
+    assert "\n" not in text
+    assert ", " not in text
+    assert "<" not in text
+    assert json.loads(text) == value
+
+
+@pytest.mark.parametrize("value", [*VALUES, "<&'>" * 2**15])
+@pytest.mark.parametrize("indent", [2, None])
+@pytest.mark.parametrize("sort_keys", [True, False])
+def test_urljsf_json_chunks(value: object, indent: int | None, sort_keys: bool) -> None:  # noqa: FBT001
+    """Verify streamed JSON is the same as ``urljsf_json``, in bounded chunks."""
+    from urljsf.filters import urljsf_json, urljsf_json_chunks
+
+    expected = urljsf_json(value, indent, sort_keys=sort_keys)
+    chunks = [*urljsf_json_chunks(value, indent, sort_keys=sort_keys)]
+    assert "".join(chunks) == expected
+    assert all(hasattr(chunk, "__html__") for chunk in chunks)
+
+
+def test_urljsf_json_chunks_large() -> None:
+    """Verify a large value is streamed in more than one chunk."""
+    from urljsf.filters import JSON_CHUNK_SIZE, urljsf_json, urljsf_json_chunks
+
+    value = {f"<key_{i}>": [f"it's & {j}" for j in range(10)] for i in range(2000)}
+    chunks = [*urljsf_json_chunks(value)]
+    assert len(chunks) > 1
+    assert max(map(len, chunks)) < 2 * JSON_CHUNK_SIZE
+    assert "".join(chunks) == urljsf_json(value)
+
+
+def test_urljsf_json_chunks_template() -> None:
+    """Verify the streamed form script is the same as the ``urljsf`` macro.
+
+    Only the streamed script should encode JSON in chunks.
+    """
+    from urljsf.cache import get_env
+    from urljsf.constants import TEMPLATES
+
+    env = get_env((str(TEMPLATES),))
+    context = {
+        "mime_prefix": "application/x-urljsf",
+        "definition_json": VALUES[1],
+        "validators_json": {"a": "./a.js"},
+        "json_indent": None,
+        "json_sort_keys": True,
+    }
+    macro = env.from_string(
+        '{% import "urljsf/_form.j2" as form with context %}{{ form.urljsf() }}'
+    )
+    script = env.get_template("urljsf/_script.j2")
+    streamed = "".join(script.generate({**context, "json_stream": True}))
+    assert streamed == macro.render(context)
+    assert streamed == script.render({**context, "json_stream": False})
+    assert "\\u003cscript\\u003e" in streamed
+
+
+def test_urljsf_json_chunks_only_streamed(tmp_path: Path) -> None:
+    """Verify rendering a page at once doesn't encode JSON in chunks."""
+    from urljsf.config import Config
+    from urljsf.urljsf import Urljsf
+
+    defn = tmp_path / "urljsf.toml"
+    defn.write_text(MINIMAL_TOML, **UTF8)
+    urljsf = Urljsf(Config(input_=str(defn), output_dir=tmp_path))
+    urljsf.load_definition()
+    streamed = "".join(urljsf.generate())
+
+    def no_chunks(*_args: object, **_kwargs: object) -> None:
+        msg = "unexpected chunks"
+        raise AssertionError(msg)
+
+    env = urljsf.env.overlay(cache_size=0)
+    env.filters = {**env.filters, "urljsf_json_chunks": no_chunks}
+    urljsf.env = env
+    assert urljsf.render() == streamed
@@ -15,6 +15,16 @@ except ImportError:
     pytest.skip("mkdocs is not installed", allow_module_level=True)
 
 
+#: a definition which references a file outside of ``docs``
+OUTSIDE_DOCS = """
+[forms.url]
+schema = "./../../shared.schema.json"
+
+[templates]
+url = "https://example.com"
+"""
+
+
 def test_sphinx_build(
     an_mkdocs_project: str, script_runner: ScriptRunner, tmp_path: Path
 ) -> None:
@@ -37,5 +47,62 @@ def test_sphinx_build(
         index_ = site / "deeply/nested/index.html"
     index_text = index_.read_text(**UTF8)
     print(index_text)
-    assert "urljsf/index.js" in index_text
+    assert index_text.count('urljsf/index.js"></script>') == 1
     assert MIME_PREFIX in index_text
+
+
+def test_mkdocs_rebuild(tmp_path: Path) -> None:
+    """Verify unchanged fences are reused when rebuilding."""
+    import shutil
+
+    from mkdocs.commands.build import build
+    from mkdocs.config import load_config
+
+    from urljsf.constants import STATIC
+    from urljsf.mkdocsext.plugin import UrljsfMkdocs
+    from urljsf.profile import PROFILER
+
+    from .conftest import MKDOCS_PROJECTS
+
+    project = tmp_path / "project"
+    shutil.copytree(MKDOCS_PROJECTS / "nested-file", project)
+    defn = project / "docs/other/xkcd.toml"
+    index_html = project / "site/deeply/nested/index.html"
+
+    def rebuild() -> UrljsfMkdocs:
+        config = load_config(str(project / "mkdocs.yml"))
+        config.plugins.on_startup(command="serve", dirty=False)
+        build(config)
+        plugin: UrljsfMkdocs = config.plugins["urljsf"]
+        return plugin
+
+    first = rebuild()
+    assert first.cache_info()["misses"] == 1
+    assert [p.name for p in PROFILER.slowest()] == [
+        "deeply/nested/index.md ../../other/xkcd.toml"
+    ]
+
+    js = project / "site/_static/urljsf/index.js"
+    assert js.exists()
+    assert not js.samefile(STATIC / "urljsf/index.js")
+
+    second = rebuild()
+    assert second is first
+    assert second.cache_info()["hits"] == 1
+    assert second.cache_info()["misses"] == 0
+
+    defn.write_text(defn.read_text(**UTF8).replace("pick an", "choose an"), **UTF8)
+    third = rebuild()
+    assert third.cache_info()["misses"] == 1
+    assert "choose an" in index_html.read_text(**UTF8)
+
+    watched: list[str] = []
+    server = type("Server", (), {"watch": lambda _, path, **_kw: watched.append(path)})
+    third.on_serve(server(), config=None, builder=None)
+    assert not watched
+
+    shared = project / "shared.schema.json"
+    shared.write_text('{"type": "object"}', **UTF8)
+    defn.write_text(OUTSIDE_DOCS, **UTF8)
+    rebuild()
+    assert watched == [str(shared.resolve())]
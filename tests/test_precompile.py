@@ -0,0 +1,98 @@
+"""Verify ahead-of-time compilation of form schema."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+from .conftest import MINIMAL_TOML, UTF8
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+#: a stand-in for ``node`` which writes the requested modules
+FAKE_NODE = f"""#!{sys.executable}
+import json, pathlib, sys
+request = json.load(sys.stdin)
+folder = pathlib.Path(request["folder"])
+for name in request["schemas"]:
+    (folder / name).write_text("export default function (require) {{ return {{}}; }}")
+"""
+
+#: a stand-in for ``node`` which can't find ``@rjsf/validator-ajv8``
+BROKEN_NODE = f"""#!{sys.executable}
+import sys
+sys.exit("@rjsf/validator-ajv8 not found")
+"""
+
+
+def a_node(tmp_path: Path, text: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use an executable script as ``node``."""
+    from urljsf.precompile import NODE_ENV_VAR
+
+    node = tmp_path / "bin/node"
+    node.parent.mkdir()
+    node.write_text(text, **UTF8)
+    node.chmod(0o755)
+    monkeypatch.setenv(NODE_ENV_VAR, str(node))
+
+
+def build(tmp_path: Path) -> str:
+    """Build a minimal definition with precompiled validators."""
+    from urljsf.config import Config
+    from urljsf.urljsf import Urljsf
+
+    defn = tmp_path / "urljsf.toml"
+    defn.write_text(MINIMAL_TOML, **UTF8)
+    out = tmp_path / "out"
+    config = Config(input_=str(defn), output_dir=out, precompile=True)
+    assert not Urljsf(config).build()
+    return (out / "index.html").read_text(**UTF8)
+
+
+def test_precompile(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify validators are written once, and referenced by URL."""
+    from urljsf.precompile import VALIDATORS
+
+    VALIDATORS.clear()
+    a_node(tmp_path, FAKE_NODE, monkeypatch)
+    html = build(tmp_path)
+    modules = [*(tmp_path / "out/_static/urljsf-forms").glob("*.js")]
+    assert len(modules) == 1
+    urls = f'{{"url":"./_static/urljsf-forms/{modules[0].name}"}}'
+    assert f"data-urljsf-validators='{urls}'" in html
+
+    assert build(tmp_path) == html
+    assert VALIDATORS.info() == {"hits": 1, "misses": 1, "names": 2}
+    VALIDATORS.clear()
+
+
+def test_precompile_no_node(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify forms are still built, and validated in the browser, without ``node``."""
+    from urljsf.precompile import NODE_ENV_VAR, VALIDATORS
+
+    VALIDATORS.clear()
+    monkeypatch.setenv(NODE_ENV_VAR, str(tmp_path / "not-node"))
+    assert "data-urljsf-validators" not in build(tmp_path)
+    assert VALIDATORS.error
+    assert NODE_ENV_VAR in VALIDATORS.error
+    VALIDATORS.clear()
+
+
+def test_precompile_broken(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify a failed compile is only reported once."""
+    from urljsf.precompile import VALIDATORS
+
+    VALIDATORS.clear()
+    a_node(tmp_path, BROKEN_NODE, monkeypatch)
+    assert "data-urljsf-validators" not in build(tmp_path)
+    assert VALIDATORS.error
+    assert "not found" in VALIDATORS.error
+    (tmp_path / "bin/node").unlink()
+    assert "data-urljsf-validators" not in build(tmp_path)
+    assert "not found" in VALIDATORS.error
+    VALIDATORS.clear()
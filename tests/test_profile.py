@@ -0,0 +1,92 @@
+"""Verify profiling the phases of building forms."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+import json
+import time
+from typing import TYPE_CHECKING
+
+from .conftest import MINIMAL_TOML, UTF8
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_profile_phases() -> None:
+    """Verify nested phases are not counted twice, and nothing is kept if disabled."""
+    from urljsf.profile import Profiler
+
+    profiler = Profiler()
+    with profiler.form("off") as profile, profiler.phase("read") as phase:
+        assert (profile, phase) == (None, None)
+    assert not profiler.profiles
+
+    profiler.enabled = True
+    with profiler.form("a") as profile:
+        with profiler.form("nested") as nested:
+            assert nested is profile
+        with profiler.phase("render") as outer:
+            assert outer
+            outer.nbytes += 10
+            with profiler.phase("read"):
+                time.sleep(0.02)
+    assert profile
+    assert [p.name for p in profiler.profiles] == ["a"]
+    read, render = profile.phases["read"], profile.phases["render"]
+    assert read.seconds >= 0.02  # noqa: PLR2004
+    assert render.seconds < read.seconds
+    assert render.nbytes == 10  # noqa: PLR2004
+    assert profile.seconds >= read.seconds + render.seconds
+    assert profile.summary().startswith(f"{1000 * profile.seconds:.1f}ms a (read ")
+    profiler.clear()
+    assert not profiler.profiles
+
+
+def test_profile_build(tmp_path: Path) -> None:
+    """Verify building a form records each phase, and static assets separately."""
+    from urljsf.config import Config
+    from urljsf.profile import PROFILER, STATIC_PROFILE
+    from urljsf.urljsf import Urljsf
+
+    defn = tmp_path / "urljsf.toml"
+    defn.write_text(MINIMAL_TOML, **UTF8)
+    PROFILER.clear()
+    PROFILER.enabled = True
+    try:
+        assert not Urljsf(Config(input_=str(defn), output_dir=tmp_path)).run_cli()
+    finally:
+        PROFILER.enabled = False
+
+    report = PROFILER.report()
+    PROFILER.clear()
+    names = [p["name"] for p in report["profiles"]]
+    assert sorted(names) == sorted([str(defn), STATIC_PROFILE])
+    phases = report["phases"]
+    for phase in ["read", "parse", "merge", "validate", "check", "render", "deploy"]:
+        assert phases[phase]["calls"], phase
+    assert phases["read"]["bytes"] == len(MINIMAL_TOML)
+    assert phases["render"]["bytes"] == (tmp_path / "index.html").stat().st_size
+    json.dumps(report)
+
+
+def test_cli_profile_json(tmp_path: Path) -> None:
+    """Verify the CLI writes a profile of many forms built in parallel."""
+    from urljsf.cli import main
+    from urljsf.profile import PROFILER
+
+    for name in ["a", "b"]:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "urljsf.toml").write_text(MINIMAL_TOML, **UTF8)
+    out = tmp_path / "profile.json"
+    args = [str(tmp_path / "a"), str(tmp_path / "b"), "-o", str(tmp_path / "out")]
+    try:
+        assert not main([*args, "--jobs", "2", "--profile-json", str(out)])
+    finally:
+        PROFILER.enabled = False
+        PROFILER.clear()
+
+    report = json.loads(out.read_text(**UTF8))
+    assert len(report["profiles"]) == len(["a", "b", "_static"])
+    assert report["phases"]["validate"]["calls"] == len(["a", "b"])
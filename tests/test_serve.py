@@ -0,0 +1,236 @@
+"""Verify the development server."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from http.client import HTTPConnection
+from typing import TYPE_CHECKING
+
+import pytest
+
+from .conftest import UTF8
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from urljsf.serve import DevHTTPServer, DevServer
+
+DEFINITION = """
+[forms.url]
+schema = "./a.schema.json"
+
+[templates]
+url = "https://example.com"
+"""
+
+
+def touch(path: Path, text: str) -> None:
+    """Write a file, making sure its stamp changes."""
+    old = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(text, **UTF8)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, max(stat.st_mtime_ns, old + 1_000_000)))
+
+
+def a_dev_server(
+    tmp_path: Path, definition: str = DEFINITION, **extra_options: object
+) -> DevServer:
+    """Build a development server for two definitions."""
+    from urljsf.cli import DEFAULTS, get_parser, plan_many
+    from urljsf.serve import DevServer
+
+    for name in ["one", "two"]:
+        (tmp_path / name).mkdir(exist_ok=True)
+        touch(tmp_path / name / "urljsf.toml", definition)
+        touch(tmp_path / name / "a.schema.json", '{"title": "a"}')
+
+    options = dict(vars(get_parser().parse_args(["x"])))
+    for key in ["input_", "jobs", "serve", "host", "port", "profile_json"]:
+        options.pop(key)
+    options["output_dir"] = tmp_path / DEFAULTS["output_dir"]
+    options.update(extra_options)
+    inputs = [tmp_path / "one/urljsf.toml", tmp_path / "two/urljsf.toml"]
+    configs, rc = plan_many(inputs, options)
+    assert not rc
+    dev = DevServer(
+        configs=configs,
+        output_dir=options["output_dir"],
+        link_static=options["link_static"],
+        compress=options["compress"],
+    )
+    assert not dev.build_all()
+    return dev
+
+
+def test_serve_rebuild(tmp_path: Path) -> None:
+    """Verify only definitions with changed files are rebuilt."""
+    from urljsf.constants import STATIC
+
+    dev = a_dev_server(tmp_path)
+    out = dev.output_dir
+    js = out / "_static/urljsf/index.js"
+    assert js.exists()
+    assert not js.samefile(STATIC / "urljsf/index.js")
+    assert not dev.check()
+    assert dev.version == 0
+
+    touch(tmp_path / "two/urljsf.toml", DEFINITION.replace(".com", ".com/changed"))
+    rebuilt = dev.check()
+    assert [w.urljsf.config.input_ for w in rebuilt] == [
+        str(tmp_path / "two/urljsf.toml")
+    ]
+    assert dev.version == 1
+    assert "/changed" in (out / "two/index.html").read_text(**UTF8)
+    assert "/changed" not in (out / "one/index.html").read_text(**UTF8)
+
+    touch(tmp_path / "one/a.schema.json", '{"title": "changed"}')
+    assert len(dev.check()) == 1
+
+    touch(tmp_path / "one/urljsf.toml", "[not valid")
+    assert len(dev.check()) == 1
+    assert dev.watched[0].stamps
+    touch(tmp_path / "one/urljsf.toml", DEFINITION)
+    assert len(dev.check()) == 1
+    assert dev.version == len(["two", "schema", "broken", "fixed"])
+
+
+def test_serve_broken_reference(tmp_path: Path) -> None:
+    """Verify a definition is rebuilt after a broken referenced file is fixed."""
+    dev = a_dev_server(tmp_path)
+    schema = (tmp_path / "one/a.schema.json").resolve()
+    assert schema in dev.watched[0].stamps
+
+    touch(schema, "{not valid")
+    assert len(dev.check()) == 1
+    assert schema in dev.watched[0].stamps
+    assert not dev.check()
+
+    touch(schema, '{"title": "fixed"}')
+    assert len(dev.check()) == 1
+    assert "fixed" in (dev.output_dir / "one/index.html").read_text(**UTF8)
+
+
+def test_serve_bundled_reference(tmp_path: Path) -> None:
+    """Verify a bundled schema is bundled again when a file it references changes."""
+    from urljsf.cache import RESOLUTIONS
+
+    RESOLUTIONS.clear()
+    for name in ["one", "two"]:
+        (tmp_path / name).mkdir()
+        touch(tmp_path / name / "defs.json", '{"definitions": {"a": {"title": "OLD"}}}')
+    dev = a_dev_server(tmp_path, bundle=True)
+    touch(tmp_path / "one/a.schema.json", '{"$ref": "./defs.json#/definitions/a"}')
+    assert len(dev.check()) == 1
+    page = dev.output_dir / "one/index.html"
+    assert "OLD" in page.read_text(**UTF8)
+
+    touch(tmp_path / "one/defs.json", '{"definitions": {"a": {"title": "NEW"}}}')
+    assert len(dev.check()) == 1
+    html = page.read_text(**UTF8)
+    assert "NEW" in html
+    assert "OLD" not in html
+    RESOLUTIONS.clear()
+
+
+def test_serve_python_reference(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify changed modules of ``py:`` references are imported again."""
+    from urljsf.cache import RESOLUTIONS
+
+    module = f"urljsf_serve_{tmp_path.name}"
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr("sys.dont_write_bytecode", True)
+    touch(tmp_path / f"{module}.py", 'DATA = {"title": "OLD"}\n')
+    RESOLUTIONS.clear()
+    dev = a_dev_server(
+        tmp_path, DEFINITION.replace("./a.schema.json", f"py:{module}:DATA")
+    )
+    page = dev.output_dir / "one/index.html"
+    assert "OLD" in page.read_text(**UTF8)
+
+    touch(tmp_path / f"{module}.py", 'DATA = {"title": "NEWER"}\n')
+    assert len(dev.check()) == len(["one", "two"])
+    assert "NEWER" in page.read_text(**UTF8)
+    RESOLUTIONS.clear()
+    monkeypatch.delitem(sys.modules, module)
+
+
+def test_serve_http(tmp_path: Path) -> None:
+    """Verify pages get a reload script, and are told to reload after a build."""
+    from urljsf.serve import RELOAD_PATH, RELOAD_SCRIPT
+
+    dev = a_dev_server(tmp_path)
+    with _serving(dev) as httpd:
+        host, port = httpd.server_address[:2]
+        conn = HTTPConnection(f"{host}", port, timeout=10)
+        conn.request("GET", "/one/")
+        page = conn.getresponse().read().decode()
+        assert RELOAD_SCRIPT in page
+        assert "urljsf" in page
+
+        conn.request("GET", "/_static/urljsf/index.js")
+        res = conn.getresponse()
+        assert res.status == 200  # noqa: PLR2004
+        assert RELOAD_SCRIPT not in res.read().decode()
+
+        events = HTTPConnection(f"{host}", port, timeout=10)
+        events.request("GET", RELOAD_PATH)
+        stream = events.getresponse()
+        assert stream.getheader("Content-Type") == "text/event-stream"
+        dev.notify()
+        assert stream.readline() == b"data: 1\n"
+        events.close()
+
+
+def test_serve_watch(tmp_path: Path) -> None:
+    """Verify changes are found in the background until stopped."""
+    dev = a_dev_server(tmp_path)
+    dev.interval = 0.01
+    watcher = threading.Thread(target=dev.watch, daemon=True)
+    watcher.start()
+    touch(tmp_path / "one/urljsf.toml", DEFINITION.replace(".com", ".com/changed"))
+    assert dev.wait(0, timeout=10) == 1
+    dev.stop()
+    watcher.join(timeout=10)
+    assert not watcher.is_alive()
+
+
+def test_cli_serve(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify the CLI builds, then serves, definitions."""
+    from urljsf.cli import main
+    from urljsf.serve import DevHTTPServer
+
+    monkeypatch.setattr(DevHTTPServer, "serve_forever", lambda _self: None)
+    (tmp_path / "one").mkdir()
+    touch(tmp_path / "one/urljsf.toml", DEFINITION)
+    touch(tmp_path / "one/a.schema.json", "{}")
+    out = tmp_path / "out"
+    args = [str(tmp_path / "one"), "-o", str(out), "--serve", "--port", "0"]
+    assert not main(args)
+    assert (out / "index.html").exists()
+    assert main([str(tmp_path / "nothing/*.toml"), "--serve"])
+    with pytest.raises(SystemExit):
+        main([*args, "--profile-json", str(tmp_path / "profile.json")])
+
+
+@contextmanager
+def _serving(dev: DevServer) -> Generator[DevHTTPServer, None, None]:
+    """Serve a development server on a free port in a thread."""
+    from urljsf.serve import make_server
+
+    httpd = make_server(dev, ("127.0.0.1", 0))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield httpd
+    finally:
+        dev.stop()
+        httpd.shutdown()
+        httpd.server_close()
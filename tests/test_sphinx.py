@@ -30,3 +30,70 @@ def test_sphinx_build(
     index_text = index_.read_text(**UTF8)
     assert "urljsf/index.js" in index_text
     assert MIME_PREFIX in index_text
+
+
+def test_sphinx_build_parallel(script_runner: ScriptRunner, tmp_path: Path) -> None:
+    """Verify documents with forms are tracked when read in parallel."""
+    import pickle  # noqa: S403
+    import shutil
+
+    from .conftest import SPHINX_PROJECTS
+
+    src = tmp_path / "src"
+    shutil.copytree(SPHINX_PROJECTS / "many", src)
+    args = ["sphinx-build", "-b", "html", "src", "build", "-W", "-j", "2"]
+    env_pickle = tmp_path / "build/.doctrees/environment.pickle"
+
+    res = script_runner.run(args, cwd=str(tmp_path))
+    assert res.success
+    assert "urljsf: 4 forms in 3 documents" in res.stdout
+    state = pickle.loads(env_pickle.read_bytes()).urljsf_state  # noqa: S301
+    assert state.forms == {"index": 1, "one": 2, "two": 1}
+    assert {k: len(v) for k, v in state.profiles.items()} == state.forms
+    assert res.stdout.count("urljsf: slowest: ") == len(["index", "one", "one", "two"])
+    for name in ["index", "one", "two", "three"]:
+        html = (tmp_path / f"build/{name}.html").read_text(**UTF8)
+        assert ("urljsf/index.js" in html) == (name in state.forms)
+
+    one = src / "one.rst"
+    one.write_text(one.read_text(**UTF8).split("..")[0], **UTF8)
+    res = script_runner.run(args, cwd=str(tmp_path))
+    assert res.success
+    state = pickle.loads(env_pickle.read_bytes()).urljsf_state  # noqa: S301
+    assert state.forms == {"index": 1, "two": 1}
+
+
+def test_sphinx_build_dependencies(script_runner: ScriptRunner, tmp_path: Path) -> None:
+    """Verify documents are read again when their definitions change."""
+    import shutil
+
+    from .conftest import SPHINX_PROJECTS
+
+    src = tmp_path / "src"
+    shutil.copytree(SPHINX_PROJECTS / "many", src)
+    args = ["sphinx-build", "-b", "html", "src", "build", "-W"]
+    assert script_runner.run(args, cwd=str(tmp_path)).success
+
+    defn = src / "urljsf.toml"
+    defn.write_text(defn.read_text(**UTF8).replace("pick an", "choose an"), **UTF8)
+    res = script_runner.run(args, cwd=str(tmp_path))
+    assert res.success
+    assert "3 changed" in res.stdout
+    for name in ["index", "one", "two"]:
+        assert "choose an" in (tmp_path / f"build/{name}.html").read_text(**UTF8)
+
+
+def test_sphinx_build_singlehtml(script_runner: ScriptRunner, tmp_path: Path) -> None:
+    """Verify a single page with every document gets JS if any have forms."""
+    import shutil
+
+    from .conftest import SPHINX_PROJECTS
+
+    src = tmp_path / "src"
+    shutil.copytree(SPHINX_PROJECTS / "many", src)
+    index = src / "index.rst"
+    index.write_text(index.read_text(**UTF8).replace(".. urljsf::", ".."), **UTF8)
+    args = ["sphinx-build", "-b", "singlehtml", "src", "build", "-W"]
+    assert script_runner.run(args, cwd=str(tmp_path)).success
+    html = (tmp_path / "build/index.html").read_text(**UTF8)
+    assert html.count('urljsf/index.js"') == len(["script", "modulepreload"])
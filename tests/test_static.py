@@ -0,0 +1,115 @@
+"""Verify deploying static assets."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+def test_deploy_static_incremental(tmp_path: Path) -> None:
+    """Verify unchanged static assets are not copied again."""
+    from urljsf.urljsf import Urljsf
+
+    first = Urljsf.deploy_static(tmp_path)
+    assert first.copied
+    assert not first.skipped
+
+    second = Urljsf.deploy_static(tmp_path)
+    assert not second.copied
+    assert second.skipped == first.copied
+    assert second.skipped_bytes == first.copied_bytes
+
+    licenses = tmp_path / "urljsf/third-party-licenses.json"
+    licenses.write_bytes(b"changed")
+    third = Urljsf.deploy_static(tmp_path)
+    assert third.copied == 1
+    assert licenses.read_bytes() != b"changed"
+
+
+def test_deploy_static_touched(tmp_path: Path) -> None:
+    """Verify static assets with the same content but a new time are not copied."""
+    import os
+
+    from urljsf.urljsf import Urljsf
+
+    Urljsf.deploy_static(tmp_path)
+    for path in (tmp_path / "urljsf").rglob("*.js"):
+        os.utime(path, ns=(0, 0))
+
+    stats = Urljsf.deploy_static(tmp_path)
+    assert not stats.copied
+
+
+def test_deploy_static_link(tmp_path: Path) -> None:
+    """Verify static assets can be hard linked."""
+    from urljsf.constants import STATIC
+    from urljsf.urljsf import Urljsf
+
+    stats = Urljsf.deploy_static(tmp_path, link=True)
+    assert stats.linked
+    js = tmp_path / "urljsf/index.js"
+    assert js.samefile(STATIC / "urljsf/index.js")
+    assert not Urljsf.deploy_static(tmp_path, link=True).linked
+
+
+def test_deploy_static_compress(tmp_path: Path) -> None:
+    """Verify static assets are precompressed once."""
+    import gzip
+
+    from urljsf.urljsf import Urljsf
+
+    first = Urljsf.deploy_static(tmp_path, compress=True)
+    assert first.compressed
+    js = tmp_path / "urljsf/index.js"
+    js_gz = tmp_path / "urljsf/index.js.gz"
+    assert gzip.decompress(js_gz.read_bytes()) == js.read_bytes()
+    assert not Urljsf.deploy_static(tmp_path, compress=True).compressed
+
+
+def test_compress_file_changed(tmp_path: Path) -> None:
+    """Verify a file is compressed again only after it changes."""
+    import gzip
+    import os
+
+    from urljsf.static import compress_file
+
+    path = tmp_path / "data.json"
+    path.write_text("{}", encoding="utf-8")
+    written = compress_file(path)
+    assert written
+    assert not compress_file(path)
+
+    path.write_text("[]", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert compress_file(path) == written
+    assert gzip.decompress(written[0].read_bytes()) == b"[]"
+    assert not compress_file(tmp_path / "data.json.gz")
+
+
+def test_stream_if_changed(tmp_path: Path) -> None:
+    """Verify streamed text is only written when changed, and never partially."""
+    import pytest
+
+    from urljsf.static import stream_if_changed
+
+    path = tmp_path / "out/index.html"
+    assert stream_if_changed(path, ["<html>", "</html>"])
+    stamp = path.stat().st_mtime_ns
+    assert not stream_if_changed(path, ["<html></html>"])
+    assert path.stat().st_mtime_ns == stamp
+
+    def broken() -> Iterator[str]:
+        yield "<html>"
+        msg = "broken"
+        raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="broken"):
+        stream_if_changed(path, broken())
+    assert path.read_text(encoding="utf-8") == "<html></html>"
+    assert [p.name for p in path.parent.iterdir()] == ["index.html"]
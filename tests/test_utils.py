@@ -0,0 +1,94 @@
+"""Verify utilities."""
+# Copyright (C) urljsf contributors.
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from .conftest import MINIMAL_TOML, UTF8
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(
+    ("left", "right", "expected"),
+    [
+        (None, None, {}),
+        ({"a": 1}, None, {"a": 1}),
+        (None, {"a": 1}, {"a": 1}),
+        ({"a": 1}, {"a": 2}, {"a": 2}),
+        ({"a": {"b": 1}}, {"a": {"c": 2}}, {"a": {"b": 1, "c": 2}}),
+        ({"a": {"b": 1}}, {"a": 2}, {"a": 2}),
+        ({"a": 1}, {"a": {"b": 2}}, {"a": {"b": 2}}),
+        ({"a": [1]}, {"a": [2]}, {"a": [2]}),
+    ],
+)
+def test_merge_deep(
+    left: dict[str, Any] | None,
+    right: dict[str, Any] | None,
+    expected: dict[str, Any],
+) -> None:
+    """Verify merging dictionaries."""
+    from urljsf.utils import merge_deep
+
+    assert merge_deep(left, right) == expected
+
+
+def test_merge_deep_shared() -> None:
+    """Verify only dictionaries defined on both sides are copied."""
+    from urljsf.utils import merge_deep
+
+    left = {"forms": {"a": {"schema": {"type": "object"}}}, "css": {"b": 1}}
+    right = {"forms": {"a": {"ui_schema": {}}, "b": {"schema": {}}}}
+    merged = merge_deep(left, right)
+
+    assert merged["forms"] is not left["forms"]
+    assert merged["forms"]["a"] is not left["forms"]["a"]
+    assert merged["forms"]["a"]["schema"] is left["forms"]["a"]["schema"]
+    assert merged["forms"]["b"] is right["forms"]["b"]
+    assert merged["css"] is left["css"]
+    assert left == {"forms": {"a": {"schema": {"type": "object"}}}, "css": {"b": 1}}
+    assert right == {"forms": {"a": {"ui_schema": {}}, "b": {"schema": {}}}}
+
+
+def test_defaults_not_mutated(tmp_path: Path) -> None:
+    """Verify resolving form fields does not change shared defaults."""
+    from urljsf.source import DefSource
+
+    defaults = {"forms": {"extra": {"schema": "./extra.schema.json"}}}
+    (tmp_path / "extra.schema.json").write_text('{"type": "object"}', **UTF8)
+    defn = tmp_path / "urljsf.toml"
+    defn.write_text(MINIMAL_TOML, **UTF8)
+
+    source = DefSource(defn, defaults=defaults)
+    assert source.raw
+    assert source.raw["forms"]["extra"]["schema"] == {"type": "object"}
+    assert defaults == {"forms": {"extra": {"schema": "./extra.schema.json"}}}
+
+
+def test_resolved_forms_rendered(tmp_path: Path) -> None:
+    """Verify resolved form fields reach the validated data and rendered page."""
+    from urljsf.config import Config
+    from urljsf.urljsf import Urljsf
+
+    (tmp_path / "shared.schema.json").write_text('{"title": "shared"}', **UTF8)
+    defn = tmp_path / "urljsf.toml"
+    defn.write_text(
+        '[forms.url]\nschema = "./shared.schema.json"\n\n'
+        '[templates]\nurl = "https://example.com"\n',
+        **UTF8,
+    )
+    out = tmp_path / "out"
+    urljsf = Urljsf(Config(input_=str(defn), output_dir=out))
+    assert not urljsf.build()
+    source = urljsf.config.definition
+    assert source
+    assert source.data
+    assert source.data["forms"]["url"]["schema"] == {"title": "shared"}
+    html = (out / "index.html").read_text(**UTF8)
+    assert '"title": "shared"' in html
+    assert "./shared.schema.json" not in html